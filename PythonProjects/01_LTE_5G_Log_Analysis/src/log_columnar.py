@@ -0,0 +1,337 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Columnar Binary Export for Parsed Log Data           ###
+###                 - Chunked typed-array columns + string dictionaries  ###
+###                 - Per-chunk min/max stats and optional zlib          ###
+###                 - mmap reader with projection and time filtering     ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import re
+import os
+import sys
+import json
+import mmap
+import zlib
+import struct
+import argparse
+import logging
+from array import array
+from lte_nr_log_analyzer import LTELogAnalyzer
+from log_records import iter_file_records, parse_time_ms, format_time_ms
+from log_render import render_rows, FORMATS
+
+# -------------------- File Layout --------------------
+#
+#   b"LCOL" | version:u16 | reserved:u16
+#   column blocks ...            (one block per column per chunk)
+#   footer                       (JSON: schema, chunk directory, stats, dictionaries)
+#   footer_length:u64 | b"LCOL"
+#
+# Numeric columns are little-endian typed arrays; string columns are
+# dictionary-encoded as uint32 codes into a per-column dictionary.
+
+MAGIC = b"LCOL"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+TRAILER = struct.Struct("<Q4s")
+
+DICT = "dict"
+TYPECODES = {"int32": "i", "int64": "q", DICT: "I"}
+
+SCHEMAS = {
+    "records": [("time_ms", "int64"), ("code", "int32"), ("date", DICT), ("name", DICT),
+                ("offset", "int64"), ("size", "int32")],
+    "signals": [("time_ms", "int64"), ("code", "int32"), ("rsrp", "int32"), ("cqi", "int32")],
+    "events": [("time_ms", "int64"), ("code", "int32"), ("message", DICT)],
+}
+
+MISSING = -1  # time_ms / code of headerless records
+
+MSG_MARKER = re.compile(r"\((MSG\d)\)")
+
+# -------------------- Extraction --------------------
+
+def signal_samples(record):
+    """
+    Yields (rsrp, cqi) integer pairs from a record's lines.
+    """
+    for line in record.lines:
+        rsrp = LTELogAnalyzer.rsrp_pattern.search(line)
+        cqi = LTELogAnalyzer.cqi_pattern.search(line)
+        if rsrp and cqi:
+            yield int(rsrp.group().split("=")[1]), int(cqi.group().split("=")[1])
+
+
+def procedure_event(record):
+    """
+    Returns the procedure message a record represents, or None.
+    (MSGn) RACH reports, "CHANNEL / Message" RRC titles and OTA NAS messages count.
+    """
+    if record.code is None:
+        return None
+    marker = MSG_MARKER.search(record.name)
+    if marker:
+        return marker.group(1)
+    if " / " in record.name:
+        return record.name.rsplit(" / ", 1)[1]
+    if " OTA LOG " in record.header:
+        return record.name
+    return None
+
+# -------------------- Writer --------------------
+
+class ColumnarLogWriter:
+    """
+    Streams parsed records into the chunked columnar file.
+    Only one chunk per table is buffered in memory at a time.
+    """
+
+    def __init__(self, path, chunk_rows=65536, compress=False, source=None):
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self.compress = compress
+        self.source = source
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0))
+        self._buffers = {table: {name: [] for name, _ in schema} for table, schema in SCHEMAS.items()}
+        self._chunks = {table: [] for table in SCHEMAS}
+        self.rows = {table: 0 for table in SCHEMAS}
+        self._dictionaries = {}
+
+    def add_record(self, record):
+        time_ms = record.time_ms if record.time_ms is not None else MISSING
+        code = record.code if record.code is not None else MISSING
+        self._append("records", time_ms, code, record.date or "", record.name,
+                     record.offset, record.size)
+        for rsrp, cqi in signal_samples(record):
+            self._append("signals", time_ms, code, rsrp, cqi)
+        message = procedure_event(record)
+        if message:
+            self._append("events", time_ms, code, message)
+
+    def close(self):
+        for table in SCHEMAS:
+            self._flush(table)
+        source = os.stat(self.source) if self.source and os.path.exists(self.source) else None
+        footer = json.dumps({
+            "version": VERSION,
+            "source": self.source,
+            "source_size": source.st_size if source else None,
+            "source_mtime_ns": source.st_mtime_ns if source else None,
+            "tables": {
+                table: {"columns": SCHEMAS[table], "rows": self.rows[table], "chunks": self._chunks[table]}
+                for table in SCHEMAS
+            },
+            "dictionaries": {key: list(values) for key, values in self._dictionaries.items()},
+        }).encode("utf-8")
+        self._file.write(footer)
+        self._file.write(TRAILER.pack(len(footer), MAGIC))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _append(self, table, *values):
+        buffers = self._buffers[table]
+        for (name, kind), value in zip(SCHEMAS[table], values):
+            if kind == DICT:
+                codes = self._dictionaries.setdefault(f"{table}.{name}", {})
+                value = codes.setdefault(value, len(codes))
+            buffers[name].append(value)
+        if len(buffers[SCHEMAS[table][0][0]]) >= self.chunk_rows:
+            self._flush(table)
+
+    def _flush(self, table):
+        buffers = self._buffers[table]
+        rows = len(buffers[SCHEMAS[table][0][0]])
+        if not rows:
+            return
+        chunk = {"rows": rows, "columns": {}}
+        for name, kind in SCHEMAS[table]:
+            values = buffers[name]
+            data = array(TYPECODES[kind], values)
+            if sys.byteorder == "big":
+                data.byteswap()
+            payload = data.tobytes()
+            block = {"offset": self._file.tell(), "codec": "raw"}
+            if self.compress:
+                payload = zlib.compress(payload, 6)
+                block["codec"] = "zlib"
+            block["length"] = len(payload)
+            if kind != DICT:
+                block["min"], block["max"] = min(values), max(values)
+            self._file.write(payload)
+            chunk["columns"][name] = block
+            values.clear()
+        self._chunks[table].append(chunk)
+        self.rows[table] += rows
+
+
+def export_log(log_path, out_path, chunk_rows=65536, compress=False):
+    """
+    Parses a log file and writes its records, signal samples and procedure
+    events to `out_path`. Returns the row count of each table.
+    """
+    with ColumnarLogWriter(out_path, chunk_rows=chunk_rows, compress=compress, source=log_path) as writer:
+        for record in iter_file_records(log_path):
+            writer.add_record(record)
+    return dict(writer.rows)
+
+# -------------------- Reader --------------------
+
+class ColumnarLogReader:
+    """
+    Memory-maps a columnar log file. Only the column blocks of chunks that
+    survive the min/max statistics check are ever read.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _ = HEADER.unpack_from(self._map, 0)
+        footer_length, tail = TRAILER.unpack_from(self._map, len(self._map) - TRAILER.size)
+        if magic != MAGIC or tail != MAGIC:
+            raise ValueError(f"Not a columnar log file: {path}")
+        if version != VERSION:
+            raise ValueError(f"Unsupported columnar log version {version} (expected {VERSION})")
+        footer_start = len(self._map) - TRAILER.size - footer_length
+        self.footer = json.loads(self._map[footer_start:footer_start + footer_length])
+        self.tables = self.footer["tables"]
+        self.dictionaries = self.footer["dictionaries"]
+        self.chunks_read = 0
+        self.chunks_skipped = 0
+
+    def columns(self, table):
+        return [name for name, _ in self.tables[table]["columns"]]
+
+    def num_rows(self, table):
+        return self.tables[table]["rows"]
+
+    def iter_chunks(self, table, columns=None, time_range=None, ranges=None, decode=True):
+        """
+        Yields {column: values} per chunk, restricted to `columns`.
+
+        `time_range` is an inclusive (start_ms, end_ms) pair; `ranges` maps any
+        numeric column to an inclusive (low, high) pair. Chunks whose statistics
+        cannot overlap are skipped without touching their data.
+        """
+        schema = dict(self.tables[table]["columns"])
+        columns = list(columns or schema)
+        ranges = dict(ranges or {})
+        if time_range is not None:
+            ranges["time_ms"] = time_range
+        wanted = columns + [name for name in ranges if name not in columns]
+
+        for chunk in self.tables[table]["chunks"]:
+            blocks = chunk["columns"]
+            if any(not _overlaps(blocks[name], low, high) for name, (low, high) in ranges.items()):
+                self.chunks_skipped += 1
+                continue
+            self.chunks_read += 1
+            data = {name: self._read_block(blocks[name], schema[name]) for name in wanted}
+            if ranges:
+                keep = [i for i in range(chunk["rows"])
+                        if all(low <= data[name][i] <= high for name, (low, high) in ranges.items())]
+                if not keep:
+                    continue
+                data = {name: [data[name][i] for i in keep] for name in wanted}
+            if decode:
+                for name in columns:
+                    if schema[name] == DICT:
+                        words = self.dictionaries[f"{table}.{name}"]
+                        data[name] = [words[code] for code in data[name]]
+            yield {name: data[name] for name in columns}
+
+    def read(self, table, columns=None, time_range=None, ranges=None, decode=True):
+        """
+        Reads the selected columns of a table into lists.
+        """
+        result = {name: [] for name in (columns or self.columns(table))}
+        for chunk in self.iter_chunks(table, columns, time_range, ranges, decode):
+            for name, values in chunk.items():
+                result[name].extend(values)
+        return result
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _read_block(self, block, kind):
+        payload = self._map[block["offset"]:block["offset"] + block["length"]]
+        if block["codec"] == "zlib":
+            payload = zlib.decompress(payload)
+        values = array(TYPECODES[kind])
+        values.frombytes(payload)
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+
+def _overlaps(block, low, high):
+    if "min" not in block:
+        return True
+    return not (block["max"] < low or block["min"] > high)
+
+
+def parse_time_range(text):
+    """
+    Parses 'HH:MM[:SS[.mmm]]-HH:MM[:SS[.mmm]]' into an inclusive (start_ms, end_ms) pair.
+    """
+    start, _, end = text.partition("-")
+    return parse_time_ms(start), parse_time_ms(end) if end else parse_time_ms(start)
+
+# -------------------- Program Entry Point --------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Columnar binary export for parsed LTE/NR logs")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_cmd = commands.add_parser("export", help="Parse a log and write a columnar file")
+    export_cmd.add_argument("log", help="Path to the text log")
+    export_cmd.add_argument("output", help="Path of the columnar file to write")
+    export_cmd.add_argument("--compress", action="store_true", help="zlib-compress column blocks")
+    export_cmd.add_argument("--chunk-rows", type=int, default=65536, help="Rows per chunk")
+
+    show_cmd = commands.add_parser("show", help="Print rows from a columnar file")
+    show_cmd.add_argument("input", help="Path to the columnar file")
+    show_cmd.add_argument("--table", choices=sorted(SCHEMAS), default="signals")
+    show_cmd.add_argument("--columns", type=str, help="Comma-separated column projection")
+    show_cmd.add_argument("--time", type=str, help="Time range, e.g. 12:15:14-12:16")
+    show_cmd.add_argument("--format", choices=FORMATS, default="table", help="Output format")
+    show_cmd.add_argument("--head", type=int, help="Print only the first N rows")
+    show_cmd.add_argument("--tail", type=int, help="Print only the last N rows")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        counts = export_log(args.log, args.output, chunk_rows=args.chunk_rows, compress=args.compress)
+        logging.info(f"Exported {args.log} → {args.output}: {counts}")
+    else:
+        with ColumnarLogReader(args.input) as reader:
+            columns = args.columns.split(",") if args.columns else None
+            time_range = parse_time_range(args.time) if args.time else None
+            columns = columns or reader.columns(args.table)
+
+            def rows():
+                for chunk in reader.iter_chunks(args.table, columns, time_range=time_range):
+                    if "time_ms" in chunk:
+                        chunk["time_ms"] = [format_time_ms(t) if t != MISSING else "-" for t in chunk["time_ms"]]
+                    if "code" in chunk:
+                        chunk["code"] = [f"0x{c:04X}" if c != MISSING else "-" for c in chunk["code"]]
+                    yield from zip(*chunk.values())
+
+            render_rows(rows(), columns, [12 if name == "time_ms" else 6 for name in columns],
+                        fmt=args.format, head=args.head, tail=args.tail)
+            logging.info(f"Chunks read: {reader.chunks_read}, skipped by statistics: {reader.chunks_skipped}")
@@ -0,0 +1,196 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Live Log Ingest Server for the LTE & NR Analyzer     ###
+###                 - asyncio TCP / Unix-socket ingest of log streams    ###
+###                 - Frames streams into records with back-pressure     ###
+###                 - Replay client for local testing with data/*.txt    ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import os
+import asyncio
+import argparse
+import logging
+from lte_nr_log_analyzer import LTELogAnalyzer, NRLogAnalyzer
+from log_records import RecordFramer
+
+ANALYZERS = {
+    "lte": LTELogAnalyzer,
+    "nr": NRLogAnalyzer,
+}
+
+# Longest single log line accepted from a stream (decoded hex dumps can be long).
+LINE_LIMIT = 1 << 20
+
+# -------------------- Ingest Server --------------------
+
+class LogIngestServer:
+    """
+    Accepts concurrent log streams and feeds them to the analyzer extractors.
+
+    Every connection gets its own analyzer (chosen by `mode`) and its own
+    record framer. Framed records go through one bounded queue: when the
+    consumer lags, `queue.put()` suspends the connection's reader, which
+    stops draining the socket and lets TCP flow control slow the sender.
+    """
+
+    def __init__(self, mode="lte", queue_size=256, max_record_lines=10000):
+        if mode not in ANALYZERS:
+            raise ValueError(f"Unknown analyzer mode: {mode} (expected one of {', '.join(ANALYZERS)})")
+        self.mode = mode
+        self.queue_size = queue_size
+        self.max_record_lines = max_record_lines
+        self.streams = {}
+        self.records_received = 0
+        self._queue = None
+        self._server = None
+        self._consumer = None
+        self._handlers = set()
+        self._next_id = 0
+
+    async def start(self, host=None, port=None, unix_path=None):
+        """
+        Starts listening on a TCP host/port or a Unix socket path.
+        """
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._consumer = asyncio.create_task(self._consume())
+        if unix_path:
+            self._server = await asyncio.start_unix_server(self._handle_stream, path=unix_path, limit=LINE_LIMIT)
+            logging.info(f"Ingest server listening on unix:{unix_path}")
+        else:
+            self._server = await asyncio.start_server(
+                self._handle_stream, host or "127.0.0.1", port or 0, limit=LINE_LIMIT)
+            logging.info(f"Ingest server listening on tcp:{self.address[0]}:{self.address[1]}")
+        return self
+
+    @property
+    def address(self):
+        return self._server.sockets[0].getsockname()
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """
+        Stops accepting streams and waits until every queued record is analyzed.
+        """
+        self._server.close()
+        await self._server.wait_closed()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self._queue.join()
+        self._consumer.cancel()
+
+    async def _handle_stream(self, reader, writer):
+        self._next_id += 1
+        stream_id = f"{self._next_id}:{writer.get_extra_info('peername') or 'unix'}"
+        analyzer = ANALYZERS[self.mode](stream_id)
+        self.streams[stream_id] = analyzer
+        framer = RecordFramer(max_lines=self.max_record_lines)
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        logging.info(f"Stream {stream_id} connected")
+
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                for record in framer.push(raw.decode("utf-8", errors="replace"), len(raw)):
+                    await self._queue.put((analyzer, record))
+            for record in framer.flush():
+                await self._queue.put((analyzer, record))
+        finally:
+            writer.close()
+            self._handlers.discard(handler)
+            logging.info(f"Stream {stream_id} closed")
+
+    async def _consume(self):
+        while True:
+            analyzer, record = await self._queue.get()
+            try:
+                for line in record.lines:
+                    analyzer.feed_line(line)
+                self.records_received += 1
+            except Exception as e:
+                logging.error(f"Failed to analyze record {record!r} from {analyzer.logfile_path}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def report(self):
+        """
+        Prints the analysis result of every stream seen so far.
+        """
+        for stream_id, analyzer in self.streams.items():
+            print(f"\n🛰️ Stream {stream_id}")
+            analyzer.report()
+
+# -------------------- Replay Client --------------------
+
+async def replay_log(path, host=None, port=None, unix_path=None, rate=None):
+    """
+    Stand-in capture host: streams a log file to the ingest server.
+    `rate` limits the replay to that many lines per second (None = as fast as possible).
+    """
+    if unix_path:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host or "127.0.0.1", port)
+
+    interval = 1.0 / rate if rate else 0.0
+    sent = 0
+    with open(path, "rb") as logfile:
+        for line in logfile:
+            writer.write(line)
+            sent += 1
+            if interval:
+                await asyncio.sleep(interval)
+            # drain() is where the server's back-pressure reaches the client.
+            await writer.drain()
+
+    writer.close()
+    await writer.wait_closed()
+    logging.info(f"Replayed {sent} lines from {path}")
+    return sent
+
+# -------------------- Program Entry Point --------------------
+
+async def _serve(args):
+    server = LogIngestServer(mode=args.mode, queue_size=args.queue_size)
+    await server.start(host=args.host, port=args.port, unix_path=args.unix)
+    try:
+        await server.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await server.close()
+        server.report()
+
+
+async def _replay(args):
+    await asyncio.gather(*(
+        replay_log(path, host=args.host, port=args.port, unix_path=args.unix, rate=args.rate)
+        for path in args.replay
+    ))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Live log ingest server for the LTE & NR Log Analyzer")
+    parser.add_argument("--mode", choices=sorted(ANALYZERS), default="lte", help="Analyzer used for every stream")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host to listen on / connect to")
+    parser.add_argument("--port", type=int, default=5555, help="TCP port to listen on / connect to")
+    parser.add_argument("--unix", type=str, help="Unix socket path (overrides --host/--port)")
+    parser.add_argument("--queue-size", type=int, default=256, help="Records buffered before back-pressure")
+    parser.add_argument("--replay", nargs="+", metavar="LOG", help="Act as a client and replay these log files")
+    parser.add_argument("--rate", type=float, help="Replay rate in lines per second (default: unthrottled)")
+    args = parser.parse_args()
+
+    if args.unix and os.path.exists(args.unix) and not args.replay:
+        os.remove(args.unix)
+
+    try:
+        asyncio.run(_replay(args) if args.replay else _serve(args))
+    except KeyboardInterrupt:
+        logging.info("Ingest server stopped.")
@@ -0,0 +1,463 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Query / Filter Language for the Log Analyzer CLI     ###
+###                 - e.g. code in (0xB167,0xB168) and RSRP < -100       ###
+###                 - Header predicates run before any body parsing      ###
+###                 - Uses a columnar record index when one exists       ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import re
+import os
+import time
+import logging
+from functools import lru_cache
+from log_records import iter_file_records, parse_time_ms, format_time_ms
+
+# Fields known from the record header alone; everything else is a body field
+# ("RSRP", "CQI", "PRACH Tx Power", ...) read from "Field = value" text.
+HEADER_FIELDS = {"code", "time", "name"}
+
+TOKEN = re.compile(r"""\s*(?:
+      (?P<time>\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?)
+    | (?P<hex>0[xX][0-9A-Fa-f]+)
+    | (?P<number>-?\d+(?:\.\d+)?)
+    | (?P<string>"[^"]*"|'[^']*')
+    | (?P<op><=|>=|!=|==|=|<|>|~|\(|\)|,)
+    | (?P<word>[A-Za-z_][A-Za-z0-9_\-]*)
+)""", re.VERBOSE)
+
+COMPARATORS = {
+    "=": lambda a, b: a == b,
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "~": lambda a, b: str(b).lower() in str(a).lower(),
+}
+
+
+class QuerySyntaxError(ValueError):
+    pass
+
+# -------------------- Tokenizer --------------------
+
+def tokenize(text):
+    """
+    Returns (kind, value, start, end) tuples for a query string.
+    """
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = TOKEN.match(text, position)
+        if not match or match.end() == position:
+            raise QuerySyntaxError(f"Unexpected input at {position}: {text[position:]!r}")
+        kind = match.lastgroup
+        value, start = match.group(kind), match.start(kind)
+        if kind == "string":
+            value = value[1:-1]
+        elif kind == "word" and value.lower() in ("and", "or", "not", "in", "between"):
+            kind, value = "keyword", value.lower()
+        tokens.append((kind, value, start, match.end()))
+        position = match.end()
+    return tokens
+
+# -------------------- AST --------------------
+
+class Predicate:
+    """
+    A single comparison such as `RSRP < -100` or `code in (0xB167,0xB168)`.
+    """
+
+    def __init__(self, field, op, values, text):
+        self.field = field
+        self.op = op
+        self.values = values
+        self.text = text
+        self.evaluated = 0
+        self.passed = 0
+        self.seconds = 0.0
+
+    @property
+    def header_level(self):
+        return self.field.lower() in HEADER_FIELDS
+
+    def test(self, value):
+        if value is None:
+            return False
+        try:
+            if self.op == "in":
+                return value in self.values
+            if self.op == "between":
+                return self.values[0] <= value <= self.values[1]
+            return COMPARATORS[self.op](value, self.values[0])
+        except TypeError:
+            # e.g. "CQI = Disabled" compared against a number
+            return False
+
+    def __repr__(self):
+        return f"Predicate({self.text!r})"
+
+
+class BoolOp:
+    def __init__(self, op, children):
+        self.op = op
+        self.children = children
+
+# -------------------- Parser --------------------
+
+class QueryParser:
+    """
+    Recursive-descent parser:  or → and ('or' and)* ;  and → not ('and' not)* ;
+    not → 'not' not | '(' or ')' | predicate
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.position = 0
+
+    def parse(self):
+        node = self._or()
+        if self.position != len(self.tokens):
+            raise QuerySyntaxError(f"Unexpected token {self.tokens[self.position][1]!r} in query")
+        return node
+
+    def _peek(self):
+        return self.tokens[self.position][:2] if self.position < len(self.tokens) else (None, None)
+
+    def _take(self, kind=None, value=None):
+        token = self._peek()
+        if token[0] is None or (kind and token[0] != kind) or (value and token[1] != value):
+            expected = value or kind or "token"
+            raise QuerySyntaxError(f"Expected {expected!r} but found {token[1]!r} in query: {self.text}")
+        self.position += 1
+        return token
+
+    def _or(self):
+        children = [self._and()]
+        while self._peek() == ("keyword", "or"):
+            self._take()
+            children.append(self._and())
+        return children[0] if len(children) == 1 else BoolOp("or", children)
+
+    def _and(self):
+        children = [self._not()]
+        while self._peek() == ("keyword", "and"):
+            self._take()
+            children.append(self._not())
+        return children[0] if len(children) == 1 else BoolOp("and", children)
+
+    def _not(self):
+        if self._peek() == ("keyword", "not"):
+            self._take()
+            return BoolOp("not", [self._not()])
+        if self._peek() == ("op", "("):
+            self._take()
+            node = self._or()
+            self._take("op", ")")
+            return node
+        return self._predicate()
+
+    def _predicate(self):
+        start = self.tokens[self.position][2] if self.position < len(self.tokens) else len(self.text)
+        kind, field = self._peek()
+        if kind not in ("word", "string"):
+            raise QuerySyntaxError(f"Expected a field name but found {field!r} in query: {self.text}")
+        self._take()
+
+        kind, op = self._peek()
+        if (kind, op) == ("keyword", "in"):
+            self._take()
+            self._take("op", "(")
+            values = [self._value(field)]
+            while self._peek() == ("op", ","):
+                self._take()
+                values.append(self._value(field))
+            self._take("op", ")")
+            values = set(values)
+        elif (kind, op) == ("keyword", "between"):
+            self._take()
+            low = self._value(field)
+            self._take("keyword", "and")
+            values = [low, self._value(field)]
+        elif kind == "op" and op in COMPARATORS:
+            self._take()
+            values = [self._value(field)]
+        else:
+            raise QuerySyntaxError(f"Expected an operator after {field!r} but found {op!r}")
+
+        text = self.text[start:self.tokens[self.position - 1][3]]
+        return Predicate(field, op, values, text)
+
+    def _value(self, field):
+        kind, value = self._take()
+        name = field.lower()
+        if name == "time":
+            if kind != "time":
+                raise QuerySyntaxError(f"Expected a time of day (HH:MM[:SS[.mmm]]) but found {value!r}")
+            return parse_time_ms(value)
+        if kind == "hex":
+            return int(value, 16)
+        if kind == "number":
+            return float(value) if "." in value else int(value)
+        if name == "code" and kind == "word":
+            raise QuerySyntaxError(f"Log code must be numeric, e.g. 0xB167 (got {value!r})")
+        return value
+
+
+def parse_query(text):
+    return QueryParser(text).parse()
+
+# -------------------- Push-down Planning --------------------
+
+def plan(node):
+    """
+    Reorders every AND so header-level predicates run before body-level ones.
+    Returns (node, [predicates]) with predicates in evaluation order.
+    """
+    if isinstance(node, Predicate):
+        return node, [node]
+    children = [plan(child) for child in node.children]
+    if node.op == "and":
+        children.sort(key=lambda item: not _header_only(item[0]))
+    predicates = [p for _, preds in children for p in preds]
+    return BoolOp(node.op, [child for child, _ in children]), predicates
+
+
+def _header_only(node):
+    if isinstance(node, Predicate):
+        return node.header_level
+    return all(_header_only(child) for child in node.children)
+
+
+def index_ranges(node):
+    """
+    Derives inclusive column ranges implied by top-level AND header predicates,
+    used to skip whole index chunks by their min/max statistics.
+    """
+    conjuncts = node.children if isinstance(node, BoolOp) and node.op == "and" else [node]
+    ranges = {}
+    for predicate in conjuncts:
+        if not isinstance(predicate, Predicate) or not predicate.header_level:
+            continue
+        column = {"time": "time_ms", "code": "code"}.get(predicate.field.lower())
+        if column is None:
+            continue
+        if predicate.op == "in":
+            bounds = (min(predicate.values), max(predicate.values))
+        elif predicate.op == "between":
+            bounds = tuple(predicate.values)
+        elif predicate.op in ("=", "=="):
+            bounds = (predicate.values[0], predicate.values[0])
+        elif predicate.op in ("<", "<="):
+            bounds = (float("-inf"), predicate.values[0])
+        elif predicate.op in (">", ">="):
+            bounds = (predicate.values[0], float("inf"))
+        else:
+            continue
+        low, high = ranges.get(column, (float("-inf"), float("inf")))
+        ranges[column] = (max(low, bounds[0]), min(high, bounds[1]))
+    return ranges
+
+# -------------------- Evaluation --------------------
+
+class Candidate:
+    """
+    A record under evaluation. Header fields are known up front; body lines
+    are loaded and body fields extracted only when a predicate asks for them.
+    """
+
+    def __init__(self, time_ms, code, name, lines=None, loader=None):
+        self.time_ms = time_ms
+        self.code = code
+        self.name = name
+        self._lines = lines
+        self._loader = loader
+        self._fields = {}
+        self.body_parsed = False
+
+    @property
+    def lines(self):
+        if self._lines is None:
+            self._lines = self._loader()
+        return self._lines
+
+    def values(self, field):
+        name = field.lower()
+        if name == "time":
+            return [self.time_ms]
+        if name == "code":
+            return [self.code]
+        if name == "name":
+            return [self.name]
+        if name not in self._fields:
+            self.body_parsed = True
+            pattern = _field_pattern(name)
+            found = []
+            for line in self.lines:
+                for match in pattern.finditer(line):
+                    found.append(_coerce(match.group(1)))
+            self._fields[name] = found
+        return self._fields[name]
+
+
+@lru_cache(maxsize=64)
+def _field_pattern(name):
+    return re.compile(rf"\b{re.escape(name)}\s*=\s*([^,\s]+)", re.IGNORECASE)
+
+
+def _coerce(text):
+    try:
+        return int(text)
+    except ValueError:
+        try:
+            return float(text)
+        except ValueError:
+            return text
+
+
+def evaluate(node, candidate, profile=True):
+    if isinstance(node, Predicate):
+        started = time.perf_counter() if profile else 0.0
+        result = any(node.test(value) for value in candidate.values(node.field) if value is not None)
+        if profile:
+            node.seconds += time.perf_counter() - started
+            node.evaluated += 1
+            node.passed += result
+        return result
+    if node.op == "and":
+        return all(evaluate(child, candidate, profile) for child in node.children)
+    if node.op == "or":
+        return any(evaluate(child, candidate, profile) for child in node.children)
+    return not evaluate(node.children[0], candidate, profile)
+
+# -------------------- Query Execution --------------------
+
+class LogQuery:
+    """
+    Runs a filter expression over a log file, preferring a columnar record
+    index (see log_columnar.py) when one exists for that file.
+    """
+
+    def __init__(self, expression, profile=False):
+        self.expression = expression
+        self.root, self.predicates = plan(parse_query(expression))
+        self.profile = profile
+        self.stats = {"records": 0, "chunks_skipped": 0, "header_rejected": 0,
+                      "body_parsed": 0, "matched": 0, "seconds": 0.0, "source": "scan"}
+
+    def run(self, log_path, index_path=None):
+        """
+        Yields every matching Candidate (with .lines available).
+        """
+        started = time.perf_counter()
+        index_path = index_path or find_index(log_path)
+        try:
+            if index_path:
+                self.stats["source"] = f"index:{index_path}"
+                yield from self._run_indexed(log_path, index_path)
+            else:
+                yield from self._run_scan(log_path)
+        finally:
+            self.stats["seconds"] = time.perf_counter() - started
+
+    def _check(self, candidate):
+        self.stats["records"] += 1
+        matched = evaluate(self.root, candidate, self.profile)
+        if candidate.body_parsed:
+            self.stats["body_parsed"] += 1
+        elif not matched:
+            self.stats["header_rejected"] += 1
+        if matched:
+            self.stats["matched"] += 1
+        return matched
+
+    def _run_scan(self, log_path):
+        for record in iter_file_records(log_path):
+            candidate = Candidate(record.time_ms, record.code, record.name, lines=record.lines)
+            if self._check(candidate):
+                yield candidate
+
+    def _run_indexed(self, log_path, index_path):
+        from log_columnar import ColumnarLogReader, MISSING
+
+        columns = ["time_ms", "code", "name", "offset", "size"]
+        with ColumnarLogReader(index_path) as reader, open(log_path, "rb") as logfile:
+            def loader(offset, size):
+                def load():
+                    logfile.seek(offset)
+                    return logfile.read(size).decode("utf-8", errors="replace").splitlines(keepends=True)
+                return load
+
+            ranges = index_ranges(self.root)
+            for chunk in reader.iter_chunks("records", columns, ranges=ranges):
+                for time_ms, code, name, offset, size in zip(*(chunk[c] for c in columns)):
+                    candidate = Candidate(None if time_ms == MISSING else time_ms,
+                                          None if code == MISSING else code, name,
+                                          loader=loader(offset, size))
+                    if self._check(candidate):
+                        yield candidate
+            self.stats["chunks_skipped"] = reader.chunks_skipped
+
+    def profile_rows(self):
+        """
+        Per-predicate rows: predicate, level, evaluated, passed, selectivity, time (ms).
+        """
+        rows = []
+        for predicate in self.predicates:
+            selectivity = predicate.passed / predicate.evaluated if predicate.evaluated else 0.0
+            rows.append([predicate.text, "header" if predicate.header_level else "body",
+                         predicate.evaluated, predicate.passed, f"{selectivity:.1%}",
+                         f"{predicate.seconds * 1000:.3f}"])
+        return rows
+
+
+def find_index(log_path):
+    """
+    Returns '<log>.lcol' if it exists and was built from the current log file
+    (same size and modification time as recorded in the index footer).
+    """
+    candidate = log_path + ".lcol"
+    if not os.path.exists(candidate):
+        return None
+    from log_columnar import ColumnarLogReader
+    source = os.stat(log_path)
+    with ColumnarLogReader(candidate) as reader:
+        built_from = (reader.footer.get("source_size"), reader.footer.get("source_mtime_ns"))
+        if built_from != (source.st_size, source.st_mtime_ns):
+            logging.warning(f"Ignoring stale record index: {candidate}")
+            return None
+    return candidate
+
+
+def run_query(expression, log_path, index_path=None, profile=False):
+    """
+    CLI helper: prints matching records and, optionally, the query profile.
+    """
+    from tabulate import tabulate
+
+    query = LogQuery(expression, profile=profile)
+    body_fields = [p.field for p in query.predicates if not p.header_level]
+    print(f"\n🔎 Query: {expression}")
+    for candidate in query.run(log_path, index_path):
+        time_text = format_time_ms(candidate.time_ms) if candidate.time_ms is not None else "-"
+        code_text = f"0x{candidate.code:04X}" if candidate.code is not None else "-"
+        fields = "  ".join(f"{f}={','.join(map(str, candidate.values(f)))}" for f in dict.fromkeys(body_fields))
+        print(f"{time_text}  {code_text}  {candidate.name}  {fields}".rstrip())
+
+    stats = query.stats
+    logging.info(f"Query matched {stats['matched']} of {stats['records']} records ({stats['source']})")
+    if profile:
+        print("\n⏱️ Query Profile:")
+        print(tabulate(query.profile_rows(),
+                       headers=["Predicate", "Level", "Evaluated", "Passed", "Selectivity", "Time (ms)"]))
+        print(f"\nRecords scanned: {stats['records']}  index chunks skipped: {stats['chunks_skipped']}  "
+              f"rejected at header: {stats['header_rejected']}  body parsed: {stats['body_parsed']}  "
+              f"matched: {stats['matched']}  total: {stats['seconds'] * 1000:.3f} ms")
+    return query
@@ -0,0 +1,176 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Diagnostic Log Record Framing                        ###
+###                 - Splits raw log text into header + body records     ###
+###                 - Works incrementally on files or live streams       ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import re
+
+# -------------------- Header Formats --------------------
+
+# QXDM text export:  "2021 Feb 20  12:15:14.022  [92]  0xB167  LTE Random Access ..."
+DATED_HEADER = re.compile(
+    r"^(?P<date>\d{4} \w{3} +\d{1,2}) +(?P<time>\d{2}:\d{2}:\d{2}\.\d{3}) +"
+    r"\[[0-9A-Fa-f]+\] +0x(?P<code>[0-9A-Fa-f]{4}) +(?P<name>.*?)\s*$"
+)
+
+# QCAT/APEX export:  "[0xB822] LOG 10:52:44.240 Length:   31 NR5G RRC MIB Info   50 Qualcomm ..."
+BRACKET_HEADER = re.compile(
+    r"^\[0x(?P<code>[0-9A-Fa-f]{4})\] +(?:OTA +)?LOG +(?P<time>\d{2}:\d{2}:\d{2}\.\d{3}) +"
+    r"(?:Length: +\d+ +)?(?P<name>.*?)(?: {2,}\d+ +\S.*)?\s*$"
+)
+
+
+def parse_time_ms(text):
+    """
+    Converts 'HH:MM[:SS[.mmm]]' into milliseconds since midnight.
+    """
+    parts = text.strip().split(":")
+    if not 2 <= len(parts) <= 3:
+        raise ValueError(f"Invalid time of day: {text!r}")
+    hours, minutes = int(parts[0]), int(parts[1])
+    seconds = float(parts[2]) if len(parts) == 3 else 0.0
+    return (hours * 3600 + minutes * 60) * 1000 + int(round(seconds * 1000))
+
+
+def format_time_ms(time_ms):
+    """
+    Formats milliseconds since midnight as 'HH:MM:SS.mmm'.
+    """
+    seconds, millis = divmod(int(time_ms), 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{millis:03d}"
+
+
+def parse_header(line):
+    """
+    Returns (date, time_ms, code, name) for a record header line, or None.
+    """
+    match = DATED_HEADER.match(line) or BRACKET_HEADER.match(line)
+    if not match:
+        return None
+    fields = match.groupdict()
+    return fields.get("date"), parse_time_ms(fields["time"]), int(fields["code"], 16), _undouble(fields["name"])
+
+
+def _undouble(name):
+    # OTA headers repeat the message title: "UL_CCCH / RRC Setup Req UL_CCCH / RRC Setup Req"
+    half = len(name) // 2
+    if len(name) % 2 == 1 and name[half] == " " and name[:half] == name[half + 1:]:
+        return name[:half]
+    return name
+
+# -------------------- Record --------------------
+
+class LogRecord:
+    """
+    One framed log record: the parsed header plus every line it covers.
+
+    Text that appears before the first header (or in files without any
+    headers, such as a decoded UE Capability message) is kept as a
+    headerless record with code None so no line is ever dropped.
+    """
+
+    def __init__(self, lines, date=None, time_ms=None, code=None, name="", offset=0, size=0):
+        self.lines = lines
+        self.date = date
+        self.time_ms = time_ms
+        self.code = code
+        self.name = name
+        self.offset = offset
+        self.size = size
+
+    @property
+    def header(self):
+        return self.lines[0] if self.code is not None else ""
+
+    @property
+    def body(self):
+        return self.lines[1:] if self.code is not None else self.lines
+
+    def __repr__(self):
+        code = f"0x{self.code:04X}" if self.code is not None else "-"
+        return f"LogRecord({code}, {self.name!r}, lines={len(self.lines)})"
+
+# -------------------- Framing --------------------
+
+class RecordFramer:
+    """
+    Incremental record framer.
+
+    Feed it lines as they arrive; it hands back each record once the next
+    header (or the end of the stream) proves the record is complete. Only
+    the record currently being assembled is held in memory.
+    """
+
+    def __init__(self, max_lines=None):
+        self.max_lines = max_lines
+        self._lines = []
+        self._header = None
+        self._offset = 0
+        self._position = 0
+
+    def push(self, line, nbytes=None):
+        """
+        Adds one line and returns the list of records it completed.
+        `nbytes` is the line's size in the source (defaults to len(line)),
+        so record offsets can be byte positions usable with seek().
+        """
+        completed = []
+        header = parse_header(line)
+        if header is not None and self._lines:
+            completed.append(self._emit())
+        if header is not None or not self._lines:
+            self._header = header
+            self._offset = self._position
+        self._lines.append(line)
+        self._position += len(line) if nbytes is None else nbytes
+
+        # A runaway body (missing headers in a live stream) is cut into
+        # headerless records instead of growing without bound.
+        if self.max_lines and len(self._lines) >= self.max_lines:
+            completed.append(self._emit())
+        return completed
+
+    def flush(self):
+        """
+        Ends the stream and returns the trailing record, if any.
+        """
+        return [self._emit()] if self._lines else []
+
+    def _emit(self):
+        size = self._position - self._offset
+        if self._header is not None:
+            date, time_ms, code, name = self._header
+            record = LogRecord(self._lines, date, time_ms, code, name, self._offset, size)
+        else:
+            record = LogRecord(self._lines, offset=self._offset, size=size)
+        self._lines = []
+        self._header = None
+        return record
+
+
+def iter_records(lines):
+    """
+    Frames any iterable of text lines (e.g. an open log file) into records.
+    """
+    framer = RecordFramer()
+    for line in lines:
+        yield from framer.push(line)
+    yield from framer.flush()
+
+
+def iter_file_records(path, encoding="utf-8"):
+    """
+    Frames a log file read in binary mode, so record offsets are byte offsets.
+    """
+    framer = RecordFramer()
+    with open(path, "rb") as logfile:
+        for raw in logfile:
+            yield from framer.push(raw.decode(encoding, errors="replace"), len(raw))
+    yield from framer.flush()
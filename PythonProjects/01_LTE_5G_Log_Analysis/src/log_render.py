@@ -0,0 +1,167 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Streaming Result Renderer for the Log Analyzer       ###
+###                 - Table / CSV / JSON-lines output, row by row        ###
+###                 - Preset column widths and buffered writes           ###
+###                 - Optional head / tail / random sampling             ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import io
+import sys
+import csv
+import json
+import random
+from collections import deque
+
+FORMATS = ("table", "csv", "jsonl")
+
+# Rendered lines are collected and written to the output in one call per block.
+BUFFER_ROWS = 4096
+
+# -------------------- Renderer --------------------
+
+class TableRenderer:
+    """
+    Writes result rows as they are produced instead of collecting them first.
+
+    Unlike tabulate, column widths are fixed up front (from `widths`, or the
+    header lengths), so the first row is printed before the last one is
+    known. Values wider than their column simply push the row wider.
+
+    `head` / `tail` keep only the first / last N rows, `sample` keeps a
+    uniform random sample of N rows (reservoir sampling) printed in their
+    original order. Memory use is bounded by those N rows plus one buffer.
+
+    `table` names the result in CSV / JSON-lines output (a leading "table"
+    column / key on every row), so several tables can share one stream.
+    """
+
+    def __init__(self, headers, widths=None, fmt="table", out=None,
+                 head=None, tail=None, sample=None, seed=None, buffer_rows=BUFFER_ROWS, table=None):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown output format: {fmt} (expected one of {', '.join(FORMATS)})")
+        if sample and (head or tail):
+            raise ValueError("sample cannot be combined with head/tail")
+        self.headers = list(headers)
+        self.widths = [max(len(h), w) for h, w in zip(self.headers, widths or [0] * len(self.headers))]
+        self.fmt = fmt
+        self.table = table
+        self.out = out if out is not None else sys.stdout
+        self.head = head
+        self.tail = deque(maxlen=tail) if tail else None
+        self.sample = sample
+        self.rows_seen = 0
+        self.rows_written = 0
+        self._random = random.Random(seed)
+        self._reservoir = []
+        self._buffer = []
+        self._buffer_rows = buffer_rows
+        self._csv_buffer = io.StringIO()
+        self._csv = csv.writer(self._csv_buffer, lineterminator="\n")
+        self._started = False
+        self._closed = False
+
+    def write(self, row):
+        """
+        Accepts one row (a sequence matching `headers`).
+        """
+        if not self._started:
+            self._write_header()
+        index = self.rows_seen
+        self.rows_seen += 1
+
+        if self.sample:
+            if len(self._reservoir) < self.sample:
+                self._reservoir.append((index, row))
+            else:
+                slot = self._random.randrange(index + 1)
+                if slot < self.sample:
+                    self._reservoir[slot] = (index, row)
+            return
+        if (self.head is not None and index < self.head) or (self.head is None and self.tail is None):
+            self._emit(row)
+        elif self.tail is not None:
+            self.tail.append(row)
+
+    def write_rows(self, rows):
+        for row in rows:
+            self.write(row)
+        return self
+
+    def close(self):
+        """
+        Prints any held-back tail / sample rows and flushes the buffer.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if not self._started:
+            self._write_header()
+        held = [row for _, row in sorted(self._reservoir, key=lambda item: item[0])] if self.sample \
+            else list(self.tail or ())
+        skipped = self.rows_seen - self.rows_written - len(held)
+        if skipped and self.fmt == "table":
+            self._buffer.append(f"... {skipped} rows omitted ...")
+        for row in held:
+            self._emit(row)
+        self._flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _write_header(self):
+        self._started = True
+        if self.fmt == "table":
+            self._buffer.append(self._table_line(self.headers))
+            self._buffer.append(self._table_line(["-" * w for w in self.widths]))
+        elif self.fmt == "csv":
+            self._buffer.append(self._csv_line(self._tagged(self.headers, "table")))
+
+    def _emit(self, row):
+        if self.fmt == "table":
+            self._buffer.append(self._table_line(row))
+        elif self.fmt == "csv":
+            self._buffer.append(self._csv_line(self._tagged(row, self.table)))
+        else:
+            record = dict(zip(self.headers, row))
+            if self.table is not None:
+                record = {"table": self.table, **record}
+            self._buffer.append(json.dumps(record, default=str))
+        self.rows_written += 1
+        if len(self._buffer) >= self._buffer_rows:
+            self._flush()
+
+    def _tagged(self, row, tag):
+        return [tag, *row] if self.table is not None else row
+
+    def _table_line(self, row):
+        cells = [str(value).ljust(width) for value, width in zip(row, self.widths)]
+        return "  ".join(cells).rstrip()
+
+    def _csv_line(self, row):
+        self._csv.writerow(row)
+        line = self._csv_buffer.getvalue()[:-1]
+        self._csv_buffer.seek(0)
+        self._csv_buffer.truncate()
+        return line
+
+    def _flush(self):
+        if self._buffer:
+            self.out.write("\n".join(self._buffer) + "\n")
+            self._buffer.clear()
+        self.out.flush()
+
+
+def render_rows(rows, headers, widths=None, **options):
+    """
+    Streams an iterable of rows through a TableRenderer and returns it.
+    """
+    with TableRenderer(headers, widths, **options) as renderer:
+        renderer.write_rows(rows)
+    return renderer
@@ -0,0 +1,257 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Bounded Buffers for Constant-Memory Log Analysis     ###
+###                 - Append-only buffers that spill to temporary files  ###
+###                 - One memory budget shared by every analyzer stage   ###
+###                 - Peak RSS check against the budget                  ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import os
+import re
+import sys
+import pickle
+import logging
+import tempfile
+
+try:
+    import resource  # POSIX only; peak RSS is reported as unavailable elsewhere
+except ImportError:
+    resource = None
+
+# Share of the budget handed to buffers; the rest covers the interpreter,
+# the current line / record and the renderer.
+BUFFER_FRACTION = 0.5
+
+# Items per pickled block; reading back never holds more than one block per buffer.
+SPILL_BLOCK_ITEMS = 4096
+
+SIZE_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMG]?)(?:i?B)?\s*$", re.IGNORECASE)
+
+
+def parse_size(text):
+    """
+    Parses '512K', '64M', '1.5G' or a plain byte count into bytes.
+    """
+    match = SIZE_PATTERN.match(str(text))
+    if not match:
+        raise ValueError(f"Invalid memory size: {text!r} (expected e.g. 64M or 1G)")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).upper()])
+
+
+def peak_rss_bytes():
+    """
+    Returns the peak resident set size of this process, or None if unknown.
+    Linux reports VmHWM: ru_maxrss there keeps the parent's peak across
+    fork + exec, so a process started by a large parent would look large.
+    """
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # macOS reports bytes, Linux KiB
+
+
+def _item_size(item):
+    # Object size plus the list slot that references it
+    if isinstance(item, (list, tuple)):
+        return 8 + sys.getsizeof(item) + sum(sys.getsizeof(value) for value in item)
+    return 8 + sys.getsizeof(item)
+
+# -------------------- Spill Buffer --------------------
+
+class SpillList:
+    """
+    Append-only list that keeps at most `limit_bytes` of items in memory.
+
+    When the in-memory tail grows past the limit it is pickled to a
+    temporary file as one more run of small blocks. Iteration replays the
+    spilled blocks in order and then the in-memory tail, so callers see the
+    original sequence while holding only one block at a time.
+    """
+
+    def __init__(self, name, limit_bytes, spill_dir=None):
+        self.name = name
+        self.limit_bytes = limit_bytes
+        self.spill_dir = spill_dir
+        self.spilled_items = 0
+        self.spill_runs = 0
+        self._blocks = 0
+        self._items = []
+        self._bytes = 0
+        self._file = None
+
+    def append(self, item):
+        self._items.append(item)
+        self._bytes += _item_size(item)
+        if self._bytes > self.limit_bytes:
+            self.spill()
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def spill(self):
+        """
+        Writes the in-memory items to the spill file as one run.
+        """
+        if not self._items:
+            return
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix=f"lte_nr_{self.name}_", dir=self.spill_dir)
+        self._file.seek(0, os.SEEK_END)
+        for start in range(0, len(self._items), SPILL_BLOCK_ITEMS):
+            pickle.dump(self._items[start:start + SPILL_BLOCK_ITEMS], self._file, protocol=pickle.HIGHEST_PROTOCOL)
+            self._blocks += 1
+        self.spilled_items += len(self._items)
+        self.spill_runs += 1
+        self._items = []
+        self._bytes = 0
+
+    def __iter__(self):
+        position = 0
+        for _ in range(self._blocks):
+            self._file.seek(position)
+            block = pickle.load(self._file)
+            position = self._file.tell()
+            yield from block
+        yield from list(self._items)
+
+    def __len__(self):
+        return self.spilled_items + len(self._items)
+
+    def __eq__(self, other):
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        return f"SpillList({self.name!r}, items={len(self)}, spilled={self.spilled_items})"
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._items = []
+        self.spilled_items = self.spill_runs = self._blocks = self._bytes = 0
+
+# -------------------- Memory Budget --------------------
+
+class MemoryBudget:
+    """
+    Hands out SpillList buffers that together stay within `max_bytes`.
+
+    Every buffer gets an equal share of BUFFER_FRACTION of the budget; the
+    shares are recomputed whenever another analyzer registers its buffers,
+    and buffers already holding more than their new share spill at once.
+    """
+
+    def __init__(self, max_bytes, spill_dir=None):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self._buffers = []
+
+    def buffers(self, *names):
+        """
+        Creates one bounded buffer per name and rebalances all shares.
+        """
+        created = [SpillList(name, 0, self.spill_dir) for name in names]
+        self._buffers.extend(created)
+        share = int(self.max_bytes * BUFFER_FRACTION) // len(self._buffers)
+        for buffer in self._buffers:
+            buffer.limit_bytes = share
+            if buffer._bytes > share:
+                buffer.spill()
+        return created
+
+    @property
+    def spilled_items(self):
+        return sum(buffer.spilled_items for buffer in self._buffers)
+
+    def report(self):
+        """
+        Logs spill statistics and checks the peak RSS against the budget.
+        Returns True if the budget was met (or cannot be measured).
+        """
+        budget_mib = self.max_bytes / (1 << 20)
+        spilled = [buffer for buffer in self._buffers if buffer.spill_runs]
+        for buffer in spilled:
+            logging.info(f"Spilled {buffer.spilled_items} {buffer.name} items in {buffer.spill_runs} runs")
+        peak = peak_rss_bytes()
+        if peak is None:
+            logging.info(f"Memory budget {budget_mib:.1f} MiB (peak RSS unavailable on this platform)")
+            return True
+        peak_mib = peak / (1 << 20)
+        if peak > self.max_bytes:
+            logging.warning(f"Peak RSS {peak_mib:.1f} MiB exceeded the {budget_mib:.1f} MiB budget")
+            return False
+        logging.info(f"Peak RSS {peak_mib:.1f} MiB within the {budget_mib:.1f} MiB budget")
+        return True
+
+    def close(self):
+        for buffer in self._buffers:
+            buffer.close()
+
+# -------------------- Peak RSS Check --------------------
+
+_RSS_RUN = """
+import os, sys
+from lte_nr_log_analyzer import LTELogAnalyzer
+from log_spill import MemoryBudget, peak_rss_bytes
+max_bytes = int(sys.argv[2])
+budget = MemoryBudget(max_bytes) if max_bytes else None
+with open(os.devnull, "w") as out:
+    LTELogAnalyzer(sys.argv[1], {"out": out}, budget).extract_signal_values()
+print(peak_rss_bytes())
+"""
+
+
+def write_signal_log(path, lines):
+    """
+    Writes a synthetic LTE log of `lines` RSRP/CQI lines.
+    """
+    with open(path, "w") as logfile:
+        for start in range(0, lines, SPILL_BLOCK_ITEMS):
+            logfile.write("".join(f"2021 Feb 20  12:15:14.031  RSRP = -{60 + i % 80} ,CQI = {i % 16}\n"
+                                  for i in range(start, min(lines, start + SPILL_BLOCK_ITEMS))))
+
+
+def rss_benchmark(log_path, max_bytes):
+    """
+    Extracts and prints the RSRP/CQI table of `log_path` in fresh interpreters,
+    without and with a `max_bytes` budget. Returns {"unbounded": peak,
+    "bounded": peak} in bytes (None where peak RSS is unavailable).
+    """
+    import subprocess
+
+    src = os.path.dirname(os.path.abspath(__file__))
+    results = {}
+    for mode, budget in (("unbounded", 0), ("bounded", max_bytes)):
+        out = subprocess.run([sys.executable, "-c", _RSS_RUN, os.path.abspath(log_path), str(budget)], cwd=src,
+                             capture_output=True, text=True, check=True).stdout.split()
+        results[mode] = None if out[-1] == "None" else int(out[-1])
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Peak RSS of the LTE signal analysis with and without --max-memory")
+    parser.add_argument("log", nargs="?", help="LTE log to analyze (default: a generated RSRP/CQI log)")
+    parser.add_argument("--lines", type=int, default=2_000_000, help="Lines of the generated log (default: 2000000)")
+    parser.add_argument("--max-memory", default="48M", help="Memory budget of the bounded run (default: 48M)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        log_path = args.log
+        if not log_path:
+            log_path = os.path.join(folder, "signals.txt")
+            write_signal_log(log_path, args.lines)
+        for mode, peak in rss_benchmark(log_path, parse_size(args.max_memory)).items():
+            print(f"{mode:<10} peak RSS: " + (f"{peak / (1 << 20):7.1f} MiB" if peak else "unavailable"))
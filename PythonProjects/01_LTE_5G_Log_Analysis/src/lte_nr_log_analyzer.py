@@ -12,7 +12,7 @@ import re
 import os
 import argparse
 import logging
-from tabulate import tabulate
+from log_render import render_rows, FORMATS
 
 # -------------------- Logging Setup --------------------
 
@@ -29,12 +29,97 @@ class LTELogAnalyzer:
     Analyzes LTE network logs to extract signal metrics and decode message flow.
     """
 
-    def __init__(self, logfile_path):
+    rsrp_pattern = re.compile(r"RSRP = -?\d+")
+    cqi_pattern = re.compile(r"CQI = -?\d+")
+
+    # Preset widths fit "RSRP = -140" / "CQI = 15" so rows stream without a width pass.
+    signal_widths = [11, 8]
+
+    def __init__(self, logfile_path, render_options=None, memory_budget=None):
         self.logfile_path = logfile_path
-        self.rsrp_values = []
-        self.cqi_values = []
+        self.render_options = render_options or {}
+        if memory_budget is not None:
+            # Bounded buffers that spill to temporary files (--max-memory)
+            self.rsrp_values, self.cqi_values, self.msg_block = memory_budget.buffers("rsrp", "cqi", "msg_block")
+        else:
+            self.rsrp_values = []
+            self.cqi_values = []
+            self.msg_block = []
         self.msg_start = "MSG2"
         self.msg_stop = "MSG3"
+        self.msg_state = "search"
+
+    # ---------- Line-level extractors (shared by file and stream input) ----------
+
+    def collect_signal_line(self, line):
+        """
+        Records the RSRP/CQI pair carried by a single log line, if any.
+        """
+        rsrp_match = self.rsrp_pattern.findall(line)
+        cqi_match = self.cqi_pattern.findall(line)
+        if rsrp_match and cqi_match:
+            self.rsrp_values.append(rsrp_match[0])
+            self.cqi_values.append(cqi_match[0])
+
+    def collect_message_line(self, line):
+        """
+        Advances the MSG2 → MSG3 block capture by one line.
+        Returns False once the block is complete and no more lines are needed.
+        """
+        if self.msg_state == "search":
+            if re.search(rf"\b{self.msg_start}\b", line):
+                self.msg_state = "capture"
+                self.msg_block.append(line.strip())
+        elif self.msg_state == "capture":
+            if self.msg_stop in line:
+                self.msg_state = "done"
+            else:
+                self.msg_block.append(line.strip())
+        return self.msg_state != "done"
+
+    def feed_line(self, line):
+        """
+        Runs every LTE extractor on one line of a live stream.
+        """
+        self.collect_signal_line(line)
+        self.collect_message_line(line)
+
+    # ---------- Reporting ----------
+
+    def print_signal_values(self):
+        if self.rsrp_values:
+            if self.render_options.get("fmt", "table") == "table":
+                print("\n📶 RSRP & CQI Values:")
+            render_rows(zip(self.rsrp_values, self.cqi_values), ["RSRP", "CQI"],
+                        self.signal_widths, table="signals", **self.render_options)
+        else:
+            logging.warning("No RSRP/CQI values found.")
+
+    def print_message_block(self):
+        if not self.msg_block:
+            logging.warning(f"Message '{self.msg_start}' not found.")
+            return
+        fmt = self.render_options.get("fmt", "table")
+        if fmt != "table":
+            # CSV / JSON lines: the block is one more tagged table, status text goes to the log
+            render_rows(([line] for line in self.msg_block), ["line"], fmt=fmt, table="message_block")
+            if self.msg_state == "done":
+                logging.info(f"End of '{self.msg_start}' message block.")
+            return
+        print(f"\n📨 Found '{self.msg_start}' message:")
+        for line in self.msg_block:
+            print(line)
+        if self.msg_state == "done":
+            print("\n🛑 End of message block.\n")
+
+    def report(self):
+        """
+        Prints everything collected so far via feed_line().
+        """
+        self.print_signal_values()
+        self.print_message_block()
+
+    # ---------- File-based pipeline ----------
 
     def extract_signal_values(self):
         """
@@ -44,23 +129,13 @@ class LTELogAnalyzer:
             logging.error(f"LTE log file not found: {self.logfile_path}")
             return
 
-        rsrp_pattern = r"RSRP = -?\d+"
-        cqi_pattern = r"CQI = -?\d+"
         logging.info(f"Reading LTE log file: {self.logfile_path}")
 
         with open(self.logfile_path, "r") as logfile:
             for line in logfile:
-                rsrp_match = re.findall(rsrp_pattern, line)
-                cqi_match = re.findall(cqi_pattern, line)
-                if rsrp_match and cqi_match:
-                    self.rsrp_values.append(rsrp_match[0])
-                    self.cqi_values.append(cqi_match[0])
+                self.collect_signal_line(line)
 
-        if self.rsrp_values:
-            print("\n📶 RSRP & CQI Values:")
-            print(tabulate(zip(self.rsrp_values, self.cqi_values), headers=["RSRP", "CQI"]))
-        else:
-            logging.warning("No RSRP/CQI values found.")
+        self.print_signal_values()
 
     def search_lte_messages(self):
         """
@@ -70,25 +145,14 @@ class LTELogAnalyzer:
             logging.error(f"LTE log file not found: {self.logfile_path}")
             return
 
-        found = False
         logging.info(f"Searching for LTE message block: {self.msg_start} → {self.msg_stop}")
 
         with open(self.logfile_path, "r") as logfile:
             for line in logfile:
-                if re.search(rf"\b{self.msg_start}\b", line):
-                    found = True
-                    print(f"\n📨 Found '{self.msg_start}' message:")
-                    print(line.strip())
-
-                    for next_line in logfile:
-                        if self.msg_stop in next_line:
-                            print("\n🛑 End of message block.\n")
-                            break
-                        print(next_line.strip())
+                if not self.collect_message_line(line):
                     break
 
-        if not found:
-            logging.warning(f"Message '{self.msg_start}' not found.")
+        self.print_message_block()
 
     def run_analysis(self):
         """
@@ -106,10 +170,103 @@ class NRLogAnalyzer:
     Analyzes UE Capability logs to extract supported NR bands and combinations.
     """
 
-    def __init__(self, logfile_path):
+    band_pattern = re.compile(r"bandNR: \d+")
+
+    # 38.331 maxSimultaneousBands: a longer run of bands is a combination
+    # whose featureSetCombination line is missing, not a real combination.
+    max_combo_bands = 32
+
+    def __init__(self, logfile_path, render_options=None, memory_budget=None):
         self.logfile_path = logfile_path
-        self.supported_band_list = []
-        self.band_combinations = []
+        self.render_options = render_options or {}
+        if memory_budget is not None:
+            # Bounded buffers that spill to temporary files (--max-memory)
+            self.supported_band_list, self.band_combinations = memory_budget.buffers("bands", "band_combinations")
+        else:
+            self.supported_band_list = []
+            self.band_combinations = []
+        self.band_state = "bands"
+        self.combo_state = "search"
+        self.current_combo = []
+
+    # ---------- Line-level extractors (shared by file and stream input) ----------
+
+    def collect_band_line(self, line):
+        """
+        Records a supported band until supportedBandCombinationList is reached.
+        Returns False once the band list section has ended.
+        """
+        if self.band_state != "bands":
+            return False
+        bands = self.band_pattern.findall(line)
+        if bands:
+            self.supported_band_list.append(bands[0])
+        if "supportedBandCombinationList" in line:
+            self.band_state = "done"
+        return self.band_state != "done"
+
+    def collect_combo_line(self, line):
+        """
+        Groups bands into combinations between supportedBandCombinationList
+        and appliedFreqBandListFilter. Returns False once the section has ended.
+        """
+        if self.combo_state == "search":
+            if "supportedBandCombinationList" in line:
+                self.combo_state = "combos"
+        elif self.combo_state == "combos":
+            bands = self.band_pattern.findall(line)
+            if bands:
+                if len(self.current_combo) >= self.max_combo_bands:
+                    logging.warning(f"Band combination exceeds {self.max_combo_bands} bands; closing it")
+                    self.band_combinations.append(self.current_combo)
+                    self.current_combo = []
+                self.current_combo.append(bands[0])
+            if "featureSetCombination" in line:
+                if self.current_combo:
+                    self.band_combinations.append(self.current_combo)
+                    self.current_combo = []
+            if "appliedFreqBandListFilter" in line:
+                self.combo_state = "done"
+        return self.combo_state != "done"
+
+    def feed_line(self, line):
+        """
+        Runs every NR extractor on one line of a live stream.
+        """
+        self.collect_band_line(line)
+        self.collect_combo_line(line)
+
+    # ---------- Reporting ----------
+
+    def print_supported_bands(self):
+        if self.supported_band_list:
+            if self.render_options.get("fmt", "table") == "table":
+                print("\n📶 Supported NR Bands:")
+            render_rows(([b] for b in self.supported_band_list), ["BandNR"], [11],
+                        table="supported_bands", **self.render_options)
+        else:
+            logging.warning("No NR bands found.")
+
+    def print_band_combinations(self):
+        fmt = self.render_options.get("fmt", "table")
+        if self.band_combinations and fmt != "table":
+            render_rows(((i, ", ".join(combo)) for i, combo in enumerate(self.band_combinations, 1)),
+                        ["Combo", "Bands"], fmt=fmt, table="band_combinations")
+        elif self.band_combinations:
+            print("\n🔗 Band Combinations:")
+            for i, combo in enumerate(self.band_combinations, 1):
+                print(f"Combo {i}: {', '.join(combo)}")
+        else:
+            logging.warning("No band combinations found.")
+
+    def report(self):
+        """
+        Prints everything collected so far via feed_line().
+        """
+        self.print_supported_bands()
+        self.print_band_combinations()
+
+    # ---------- File-based pipeline ----------
 
     def extract_supported_bands(self):
         """
@@ -119,22 +276,14 @@ class NRLogAnalyzer:
             logging.error(f"NR capability file not found: {self.logfile_path}")
             return
 
-        band_pattern = r"bandNR: \d+"
         logging.info(f"Reading NR capability file: {self.logfile_path}")
 
         with open(self.logfile_path, "r") as file:
             for line in file:
-                bands = re.findall(band_pattern, line)
-                if bands:
-                    self.supported_band_list.append(bands[0])
-                if "supportedBandCombinationList" in line:
+                if not self.collect_band_line(line):
                     break
 
-        if self.supported_band_list:
-            print("\n📶 Supported NR Bands:")
-            print(tabulate([[b] for b in self.supported_band_list], headers=["BandNR"]))
-        else:
-            logging.warning("No NR bands found.")
+        self.print_supported_bands()
 
     def extract_band_combinations(self):
         """
@@ -144,31 +293,14 @@ class NRLogAnalyzer:
             logging.error(f"NR capability file not found: {self.logfile_path}")
             return
 
-        band_pattern = r"bandNR: \d+"
-        current_combo = []
         logging.info("Parsing NR band combinations...")
 
         with open(self.logfile_path, "r") as file:
             for line in file:
-                if "supportedBandCombinationList" in line:
-                    for line in file:
-                        bands = re.findall(band_pattern, line)
-                        if bands:
-                            current_combo.append(bands[0])
-                        if "featureSetCombination" in line:
-                            if current_combo:
-                                self.band_combinations.append(current_combo)
-                                current_combo = []
-                        if "appliedFreqBandListFilter" in line:
-                            break
+                if not self.collect_combo_line(line):
                     break
 
-        if self.band_combinations:
-            print("\n🔗 Band Combinations:")
-            for i, combo in enumerate(self.band_combinations, 1):
-                print(f"Combo {i}: {', '.join(combo)}")
-        else:
-            logging.warning("No band combinations found.")
+        self.print_band_combinations()
 
     def run_analysis(self):
         """
@@ -190,6 +322,16 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="LTE & NR Log Analyzer")
     parser.add_argument("--lte", type=str, help="Path to LTE log file")
     parser.add_argument("--nr", type=str, help="Path to NR capability file")
+    parser.add_argument("--query", type=str,
+                        help='Filter records, e.g. "code in (0xB167,0xB168) and time between 12:15:14 and 12:16 and RSRP < -100"')
+    parser.add_argument("--index", type=str, help="Columnar record index for --query (default: <log>.lcol if present)")
+    parser.add_argument("--profile", action="store_true", help="Report per-predicate selectivity and time for --query")
+    parser.add_argument("--format", choices=FORMATS, default="table", help="Output format for result tables")
+    parser.add_argument("--head", type=int, help="Print only the first N rows of each result table")
+    parser.add_argument("--tail", type=int, help="Print only the last N rows of each result table")
+    parser.add_argument("--sample", type=int, help="Print a random sample of N rows of each result table")
+    parser.add_argument("--max-memory", type=str, help="Memory budget, e.g. 64M; buffers spill to temporary files")
+    parser.add_argument("--spill-dir", type=str, help="Directory for spill files (default: system temp dir)")
     args = parser.parse_args()
 
     logging.info("📊 Running Combined LTE + NR Log Analyzer")
@@ -199,14 +341,31 @@ if __name__ == "__main__":
     DEFAULT_LTE = os.path.join(PROJECT_ROOT, "..", "data", "LTENetworkLogs.txt")
     DEFAULT_NR = os.path.join(PROJECT_ROOT, "..", "data", "UECapabilityInfo.txt")
 
+    if args.query:
+        if args.nr:
+            parser.error("--query filters LTE log records and cannot be combined with --nr")
+        from log_query import run_query
+        run_query(args.query, args.lte or DEFAULT_LTE, index_path=args.index, profile=args.profile)
+        raise SystemExit(0)
+
     if not args.lte and not args.nr:
         args.lte = DEFAULT_LTE
         args.nr = DEFAULT_NR
 
+    render_options = {"fmt": args.format, "head": args.head, "tail": args.tail, "sample": args.sample}
+    budget = None
+    if args.max_memory:
+        from log_spill import MemoryBudget, parse_size
+        budget = MemoryBudget(parse_size(args.max_memory), spill_dir=args.spill_dir)
+
     if args.lte:
-        lte = LTELogAnalyzer(args.lte)
+        lte = LTELogAnalyzer(args.lte, render_options, budget)
         lte.run_analysis()
 
     if args.nr:
-        nr = NRLogAnalyzer(args.nr)
+        nr = NRLogAnalyzer(args.nr, render_options, budget)
         nr.run_analysis()
+
+    if budget is not None:
+        budget.report()
+        budget.close()
@@ -0,0 +1,62 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the columnar binary log export        ###
+###                 - Round-trips records, signals and events            ###
+###                 - Checks projection and statistics-based skipping    ###
+###  Date         : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+
+# 📦 Ensure src/ is in Python's module search path
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import pytest
+from log_columnar import export_log, ColumnarLogReader
+from log_records import iter_file_records, parse_time_ms
+from lte_nr_log_analyzer import LTELogAnalyzer
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+LTE_LOG = os.path.join(DATA_DIR, "LTENetworkLogs.txt")
+UE_LOG = os.path.join(DATA_DIR, "UE_Logs_SA_SA_Redir.txt")
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_columnar_round_trip(tmp_path, compress):
+    """
+    ✅ Signal samples and record headers survive export + mmap read-back.
+    """
+    out = tmp_path / "lte.lcol"
+    counts = export_log(LTE_LOG, str(out), chunk_rows=2, compress=compress)
+
+    reference = LTELogAnalyzer(LTE_LOG)
+    reference.extract_signal_values()
+    with ColumnarLogReader(str(out)) as reader:
+        signals = reader.read("signals", ["rsrp", "cqi"])
+        records = reader.read("records", ["code", "name", "offset"])
+        events = reader.read("events", ["message"])
+
+    assert counts["signals"] == len(reference.rsrp_values)
+    assert [f"RSRP = {v}" for v in signals["rsrp"]] == reference.rsrp_values
+    assert [f"CQI = {v}" for v in signals["cqi"]] == reference.cqi_values
+    assert records["offset"] == [r.offset for r in iter_file_records(LTE_LOG)]
+    assert events["message"] == ["MSG1", "MSG2", "MSG3", "MSG4"]
+
+
+def test_columnar_time_range_skips_chunks(tmp_path):
+    """
+    ✅ A narrow time window reads only the chunks its statistics allow.
+    """
+    out = tmp_path / "ue.lcol"
+    export_log(UE_LOG, str(out), chunk_rows=8, compress=True)
+    start, end = parse_time_ms("10:52:44.300"), parse_time_ms("10:52:44.310")
+
+    with ColumnarLogReader(str(out)) as reader:
+        events = reader.read("events", ["time_ms", "message"], time_range=(start, end))
+        assert reader.chunks_skipped > 0
+
+    assert events["message"]
+    assert "RRC Setup Req" in events["message"]
+    assert all(start <= t <= end for t in events["time_ms"])
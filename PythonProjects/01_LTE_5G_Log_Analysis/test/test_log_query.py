@@ -0,0 +1,97 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the log query / filter language       ###
+###                 - Validates parsing and header-first push-down       ###
+###                 - Confirms index and scan paths agree                ###
+###  Date         : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+
+# 📦 Ensure src/ is in Python's module search path
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import shutil
+import subprocess
+import pytest
+from log_query import LogQuery, QuerySyntaxError, parse_query, find_index
+from log_columnar import export_log
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+LTE_LOG = os.path.join(DATA_DIR, "LTENetworkLogs.txt")
+UE_LOG = os.path.join(DATA_DIR, "UE_Logs_SA_SA_Redir.txt")
+
+
+def test_query_header_predicates_run_first():
+    """
+    ✅ Header predicates are evaluated before body fields; bodies of rejected records are never parsed.
+    """
+    query = LogQuery("RSRP < -50 and code in (0xB167,0xB168) and time between 12:15:14 and 12:16", profile=True)
+    assert [p.header_level for p in query.predicates] == [True, True, False]
+
+    matches = list(query.run(LTE_LOG))
+    assert [hex(m.code) for m in matches] == ["0xb167", "0xb168"]
+    assert [m.values("RSRP") for m in matches] == [[-60], [-55]]
+    assert query.stats["body_parsed"] == 2
+    assert query.stats["header_rejected"] == query.stats["records"] - 2
+    rows = query.profile_rows()
+    assert rows[0][0] == "code in (0xB167,0xB168)" and rows[0][2] == query.stats["records"]
+
+
+def test_query_index_matches_scan(tmp_path):
+    """
+    ✅ A columnar record index gives the same answer and skips chunks by statistics.
+    """
+    log = tmp_path / "ue.txt"
+    shutil.copy(UE_LOG, log)
+    expression = 'time between 10:52:44.300 and 10:52:44.310 and name ~ "RRC"'
+    scanned = [(m.time_ms, m.name) for m in LogQuery(expression).run(str(log))]
+
+    export_log(str(log), str(log) + ".lcol", chunk_rows=8)
+    query = LogQuery(expression)
+    indexed = [(m.time_ms, m.name, "".join(m.lines)) for m in query.run(str(log))]
+
+    assert query.stats["source"].startswith("index:")
+    assert query.stats["chunks_skipped"] > 0
+    assert [(t, n) for t, n, _ in indexed] == scanned == [(39164302, "UL_CCCH / RRC Setup Req")]
+    assert indexed[0][2].startswith("[0xB821] OTA LOG 10:52:44.302")
+
+
+def test_index_edited_in_place_is_stale(tmp_path):
+    """
+    ✅ An index is ignored once its log is rewritten, even at the same size.
+    """
+    log = tmp_path / "ue.txt"
+    shutil.copy(UE_LOG, log)
+    export_log(str(log), str(log) + ".lcol")
+    assert find_index(str(log)) == str(log) + ".lcol"
+
+    data = log.read_bytes()
+    log.write_bytes(data.replace(b"RRC Setup Req", b"RRC Setup Rex", 1))
+    built = os.stat(str(log) + ".lcol").st_mtime_ns
+    os.utime(log, ns=(built + 10**9, built + 10**9))
+    assert log.stat().st_size == len(data)
+    assert find_index(str(log)) is None
+    query = LogQuery('name ~ "Rex"')
+    assert len(list(query.run(str(log)))) == 1 and query.stats["source"] == "scan"
+
+
+def test_query_rejects_nr_log():
+    """
+    ✅ --query filters LTE records only; combining it with --nr is an error, not a silent skip.
+    """
+    script = os.path.join(os.path.dirname(__file__), "..", "src", "lte_nr_log_analyzer.py")
+    result = subprocess.run([sys.executable, script, "--query", "code in (0xB167)", "--nr", UE_LOG],
+                            capture_output=True, text=True)
+    assert result.returncode == 2 and "--nr" in result.stderr and not result.stdout
+
+
+@pytest.mark.parametrize("expression", ["code in (B167)", "time > soon", "RSRP <", "(CQI > 1"])
+def test_query_syntax_errors(expression):
+    """
+    ✅ Malformed filters raise QuerySyntaxError.
+    """
+    with pytest.raises(QuerySyntaxError):
+        parse_query(expression)
@@ -0,0 +1,138 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the streaming result renderer         ###
+###                 - Table output matches the former tabulate layout    ###
+###                 - Validates head / tail / sampling and CSV / JSONL   ###
+###  Date         : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+
+# 📦 Ensure src/ is in Python's module search path
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import io
+import csv
+import json
+import subprocess
+import pytest
+from tabulate import tabulate
+from log_render import TableRenderer, render_rows
+from lte_nr_log_analyzer import LTELogAnalyzer, NRLogAnalyzer
+
+LTE_LOG = os.path.join(os.path.dirname(__file__), "..", "data", "LTENetworkLogs.txt")
+NR_LOG = os.path.join(os.path.dirname(__file__), "..", "data", "UECapabilityInfo.txt")
+
+# -------------------- Table Output --------------------
+
+def test_signal_table_matches_tabulate(capsys):
+    """
+    ✅ Streaming table output has the previous tabulate layout.
+    Column widths are preset, so only padding and rule lengths may differ.
+    """
+    analyzer = LTELogAnalyzer(LTE_LOG)
+    analyzer.extract_signal_values()
+    output = capsys.readouterr().out.splitlines()[2:]
+    expected = tabulate(zip(analyzer.rsrp_values, analyzer.cqi_values), headers=["RSRP", "CQI"]).splitlines()
+    assert [line.split() for line in output if "--" not in line] == \
+        [line.split() for line in expected if "--" not in line]
+
+
+def test_head_and_tail():
+    """
+    ✅ head/tail keep the first and last rows and report what was omitted.
+    """
+    out = io.StringIO()
+    render_rows(([i, i * i] for i in range(100000)), ["n", "square"], [6, 10], out=out, head=2, tail=2)
+    lines = out.getvalue().splitlines()
+    assert lines[2:] == ["0       0", "1       1", "... 99996 rows omitted ...",
+                         "99998   9999600004", "99999   9999800001"]
+
+# -------------------- Sampling --------------------
+
+def test_sample_is_bounded_and_ordered():
+    """
+    ✅ Reservoir sampling holds N rows at most and prints them in input order.
+    """
+    out = io.StringIO()
+    renderer = TableRenderer(["n"], fmt="jsonl", out=out, sample=5, seed=7)
+    for i in range(50000):
+        renderer.write([i])
+        assert len(renderer._reservoir) <= 5
+    renderer.close()
+    values = [json.loads(line)["n"] for line in out.getvalue().splitlines()]
+    assert len(values) == 5 and values == sorted(values)
+    assert renderer.rows_seen == 50000
+
+# -------------------- CSV / JSONL --------------------
+
+@pytest.mark.parametrize("fmt, expected", [
+    ("csv", 'band,note\nn78,"3.5 GHz, TDD"\n'),
+    ("jsonl", '{"band": "n78", "note": "3.5 GHz, TDD"}\n'),
+])
+def test_csv_and_jsonl(fmt, expected):
+    """
+    ✅ CSV quoting and JSON-lines records.
+    """
+    out = io.StringIO()
+    render_rows([["n78", "3.5 GHz, TDD"]], ["band", "note"], fmt=fmt, out=out)
+    assert out.getvalue() == expected
+
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+def test_analyzer_stdout_is_machine_readable(capsys, fmt):
+    """
+    ✅ With --format csv/jsonl the whole stdout parses: no headings around the rows.
+    """
+    def parse(output):
+        if fmt == "csv":
+            return list(csv.DictReader(io.StringIO(output)))
+        return [json.loads(line) for line in output.splitlines()]
+
+    lte = LTELogAnalyzer(LTE_LOG, {"fmt": fmt})
+    lte.extract_signal_values()
+    rows = parse(capsys.readouterr().out)
+    assert rows and [(str(r["RSRP"]), str(r["CQI"])) for r in rows] == \
+        [(str(rsrp), str(cqi)) for rsrp, cqi in zip(lte.rsrp_values, lte.cqi_values)]
+
+    nr = NRLogAnalyzer(NR_LOG, {"fmt": fmt})
+    nr.extract_supported_bands()
+    rows = parse(capsys.readouterr().out)
+    assert rows and [str(r["BandNR"]) for r in rows] == [str(band) for band in nr.supported_band_list]
+
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+def test_cli_stdout_is_one_tagged_stream(fmt):
+    """
+    ✅ The whole stdout of an LTE + NR run parses: every row names its table, no text in between.
+    """
+    script = os.path.join(os.path.dirname(__file__), "..", "src", "lte_nr_log_analyzer.py")
+    output = subprocess.run([sys.executable, script, "--lte", LTE_LOG, "--nr", NR_LOG, "--format", fmt],
+                            capture_output=True, text=True, check=True).stdout
+    tables = {}
+    if fmt == "csv":
+        headers, header = {}, None
+        for row in csv.reader(io.StringIO(output)):
+            if row[0] == "table":
+                header = row[1:]
+                continue
+            headers.setdefault(row[0], header)
+            assert headers[row[0]] == header and len(row) == len(header) + 1
+            tables.setdefault(row[0], []).append(dict(zip(header, row[1:])))
+    else:
+        for line in output.splitlines():
+            record = json.loads(line)
+            tables.setdefault(record.pop("table"), []).append(record)
+
+    lte, nr = LTELogAnalyzer(LTE_LOG), NRLogAnalyzer(NR_LOG)
+    for analyzer, path in ((lte, LTE_LOG), (nr, NR_LOG)):
+        with open(path) as logfile:
+            for line in logfile:
+                analyzer.feed_line(line)
+    assert list(tables) == ["signals", "message_block", "supported_bands", "band_combinations"]
+    assert [row["RSRP"] for row in tables["signals"]] == list(lte.rsrp_values)
+    assert [row["line"] for row in tables["message_block"]] == list(lte.msg_block)
+    assert [row["BandNR"] for row in tables["supported_bands"]] == list(nr.supported_band_list)
+    assert [row["Bands"] for row in tables["band_combinations"]] == [", ".join(c) for c in nr.band_combinations]
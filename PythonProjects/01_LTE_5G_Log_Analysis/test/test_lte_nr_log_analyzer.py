@@ -8,13 +8,13 @@
 ###  Framework    : pytest                                               ###
 #############################################################################
 
-# 📦 Ensure the project root is in Python's module search path
+# 📦 Ensure src/ is in Python's module search path
 import sys
 import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
 import pytest
-from src.lte_nr_log_analyzer import LTELogAnalyzer, NRLogAnalyzer
+from lte_nr_log_analyzer import LTELogAnalyzer, NRLogAnalyzer
 
 # -------------------- LTE Tests --------------------
 
@@ -1,13 +1,17 @@
 import sys
-import logging
 from nr5gmodule import NR5GMenu
 import nr5gmodule as nrmod
 
+# argparse, logging, nr5gaudit, NumPy and the batch / server modules are imported
+# by the modes that use them, so one-shot commands and --test start quickly.
+
 # ---------------------- Logging Setup ----------------------
-logging.basicConfig(filename="nr5gcalc.log", level=logging.INFO, format="%(asctime)s - %(message)s")
+# Results go to nr5gcalc.log through a background writer (nr5gaudit); logging.info() lines too.
+# The file is opened by the first result, not at startup.
 
 def log_result(label, result):
-    logging.info(f"{label}: {result}")
+    import nr5gaudit
+    nr5gaudit.audit(label, result)
 
 # ---------------------- Input Validation ----------------------
 def safe_int_input(prompt, min_val=None, max_val=None):
@@ -178,13 +182,165 @@ def nr5GCalculator():
             case_default()
 
 # ---------------------- Program Entry Point ----------------------
-def main():
+def parse_args(argv=None):
+    import argparse
+    import nr5gaudit
+    from nr5gops import COMMANDS, command_usage
+    parser = argparse.ArgumentParser(
+        description="5G NR Calculator", formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="one-shot commands (result on stdout, no menu, no log file):\n"
+               + "\n".join(f"  {command_usage(name)}" for name in COMMANDS))
+    parser.add_argument("--test", action="store_true", help="Run the built-in sample cases")
+    parser.add_argument("--batch", metavar="INPUT",
+                        help="Run operations from a CSV / JSON-lines file ('-' = stdin) instead of the menu")
+    parser.add_argument("--output", default="-", help="Batch / enrichment results file ('-' = stdout, default)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Batch input format (default: from the file extension)")
+    parser.add_argument("--output-format", choices=["csv", "jsonl"], help="Batch output format (default: input format)")
+    parser.add_argument("--chunk-size", type=int, default=65536, help="Records evaluated together per chunk")
+    parser.add_argument("--enrich", metavar="CELLS_CSV",
+                        help="Add frequency, bands, duplex, SCS and PRBs to a cell-list CSV (ARFCN, PCI, BW columns)")
+    parser.add_argument("--workers", type=int, default=1, help="Processes used by --enrich (default 1)")
+    parser.add_argument("--serve", nargs="?", const="/tmp/nr5gcalc.sock", metavar="ADDRESS",
+                        help="Run as a server on a Unix socket path or host:port (default /tmp/nr5gcalc.sock)")
+    parser.add_argument("--log-file", default=nr5gaudit.LOG_FILE, help="Audit log file (default nr5gcalc.log)")
+    parser.add_argument("--log-format", choices=nr5gaudit.LOG_FORMATS, default="text",
+                        help="Audit log format: text lines or JSON lines")
+    parser.add_argument("--log-max-bytes", type=int, default=nr5gaudit.DEFAULT_MAX_BYTES,
+                        help="Rotate the audit log at this size (0 = never)")
+    parser.add_argument("--audit-results", action="store_true",
+                        help="Also record every batch / server result in the audit log")
+    return parser.parse_args(argv)
+
+def run_batch_mode(args, audit_log=None):
+    """Non-interactive mode: results are streamed to --output, one summary line is logged"""
+    import logging
+    from nr5gbatchmode import run_batch
+    try:
+        processed, failed = run_batch(args.batch, args.output, args.format, args.output_format, args.chunk_size,
+                                      audit=audit_log)
+    except (OSError, ValueError) as exc:
+        print(f"❌ Batch mode failed: {exc}", file=sys.stderr)
+        return 1
+    logging.info(f"Batch {args.batch}: {processed} records, {failed} errors")
+    print(f"✅ Batch completed: {processed} records, {failed} errors", file=sys.stderr)
+    return 0
+
+def run_enrich_mode(args):
+    """Cell-list enrichment: enriched CSV to --output, one summary line is logged"""
+    import logging
+    from nr5genrich import enrich_cell_list
+    try:
+        processed, failed = enrich_cell_list(args.enrich, args.output, args.chunk_size, args.workers)
+    except (OSError, ValueError) as exc:
+        print(f"❌ Enrichment failed: {exc}", file=sys.stderr)
+        return 1
+    logging.info(f"Enrich {args.enrich}: {processed} cells, {failed} errors")
+    print(f"✅ Enrichment completed: {processed} cells, {failed} errors", file=sys.stderr)
+    return 0
+
+def run_command(argv):
+    """
+    One-shot mode: 'arfcn2freq 620000' prints just the result (lists space
+    separated) and exits. Nothing is logged and argparse is not loaded.
+    Exit status 1 for an invalid value, 2 for a bad command line.
+    """
+    from nr5gops import COMMANDS, OPERATIONS, OPTIONAL, command_usage
+    name, values = argv[0], argv[1:]
+    op = OPERATIONS[COMMANDS[name]]
+    names = [param for param, _ in op.params]
+    required = [param for param in names if param not in OPTIONAL]
+    if not len(required) <= len(values) <= len(names):
+        print(f"usage: nr5gCalculator.py {command_usage(name)}", file=sys.stderr)
+        return 2
+    try:
+        args = op.parse_args(dict(zip(names, values)))
+    except ValueError as exc:
+        print(f"❌ {name}: {exc}", file=sys.stderr)
+        return 2
+    result, error = op.run(*args)
+    if error:
+        print(f"❌ {name}: {error}", file=sys.stderr)
+        return 1
+    print(" ".join(map(str, result)) if isinstance(result, (list, tuple)) else result)
+    return 0
+
+# ---------------------- Startup Benchmark ----------------------
+
+_STARTUP = """
+import sys, time
+start = time.perf_counter()
+import nr5gCalculator
+imported = time.perf_counter() - start
+nr5gCalculator.main(sys.argv[1:])
+finished = time.perf_counter() - start
+heavy = [name for name in ("nrarfcn", "numpy", "argparse", "logging", "nr5gaudit") if name in sys.modules]
+print(imported, finished, ",".join(heavy) or "-", file=sys.stderr)
+"""
+
+STARTUP_SCENARIOS = {"one_shot": ["arfcn2freq", "620000"], "test_mode": ["--test"]}
+
+def startup_benchmark(runs=5):
+    """
+    Runs each STARTUP_SCENARIOS command line in fresh interpreters (in an
+    empty directory). Returns {scenario: {"import", "run", "process": median
+    seconds, "modules": heavy modules loaded, "log_file": nr5gcalc.log created}}.
+    """
+    import os
+    import statistics
+    import subprocess
+    import tempfile
+    import time
+
+    src = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PYTHONPATH=src)
+    results = {}
+    for scenario, argv in STARTUP_SCENARIOS.items():
+        timings = {"import": [], "run": [], "process": []}
+        modules, log_file = set(), False
+        for _ in range(runs):
+            with tempfile.TemporaryDirectory() as workdir:
+                start = time.perf_counter()
+                out = subprocess.run([sys.executable, "-c", _STARTUP, *argv], cwd=workdir, env=env,
+                                     capture_output=True, text=True, check=True).stderr.split()[-3:]
+                timings["process"].append(time.perf_counter() - start)
+                log_file = log_file or os.path.exists(os.path.join(workdir, "nr5gcalc.log"))
+            timings["import"].append(float(out[0]))
+            timings["run"].append(float(out[1]))
+            modules.update(name for name in out[2].split(",") if name != "-")
+        results[scenario] = {key: statistics.median(values) for key, values in timings.items()}
+        results[scenario].update(modules=sorted(modules), log_file=log_file)
+    return results
+
+def main(argv=None):
     """
     Entry point for the 5G NR Calculator.
-    Supports optional '--test' mode for quick validation.
+    Supports one-shot commands ('arfcn2freq 620000'), optional '--test' mode for
+    quick validation, '--batch' for file input and '--serve' to answer requests
+    from nr5gclient.
     """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    from nr5gops import COMMANDS
+    if argv and argv[0] in COMMANDS:
+        return run_command(argv)
+
+    import nr5gaudit
+    args = parse_args(argv)
+    if args.enrich:
+        nr5gaudit.configure(args.log_file, args.log_format, args.log_max_bytes)
+        return run_enrich_mode(args)
+    if args.batch or args.serve:
+        audit_log = nr5gaudit.configure(args.log_file, args.log_format, args.log_max_bytes)
+        results_log = audit_log if args.audit_results else None
+        if args.batch:
+            return run_batch_mode(args, results_log)
+        from nr5gserver import serve
+        serve(args.serve, results_log)
+        return 0
+    # Menu and --test: the log file is only created once a result is logged
+    nr5gaudit.configure(args.log_file, args.log_format, args.log_max_bytes, lazy=True)
+
     print("\n🧮 Welcome to the 5G NR Calculator\n")
-    if "--test" in sys.argv:
+    if args.test:
         print("🧪 Running test mode...\n")
 
         # Sample test cases with hardcoded inputs
@@ -207,4 +363,4 @@ def main():
     nr5GCalculator()
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
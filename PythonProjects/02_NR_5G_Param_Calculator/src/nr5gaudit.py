@@ -0,0 +1,257 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : NR 5G Calculator Audit Log                           ###
+###                 Background writer for the result audit trail: calls  ###
+###                 only enqueue, a thread formats and writes batches    ###
+###                 (text or JSON lines) with size-based rotation and    ###
+###                 a flush at exit                                      ###
+###  Created On   : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+LOG_FILE = "nr5gcalc.log"
+LOG_FORMATS = ("text", "jsonl")
+
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024   # rotate when the file would grow past this (0 = never)
+DEFAULT_BACKUPS = 3                    # nr5gcalc.log.1 ... .3 are kept
+BATCH_SIZE = 4096                      # entries formatted and written per write() call
+FLUSH_INTERVAL = 0.2                   # seconds a partial batch may wait
+
+_STOP = object()
+
+# ---------------------- Entry Formatting ----------------------
+
+def _timestamp(created):
+    # Same layout as logging's default asctime: 2026-10-19 03:13:45,123
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created)) + f",{int(created * 1000) % 1000:03d}"
+
+
+def format_text(created, label, result, error=None):
+    """One text line, as the old logging.basicConfig format: '<time> - <label>: <result>'"""
+    message = label if result is None and error is None else f"{label}: {f'error: {error}' if error else result}"
+    return f"{_timestamp(created)} - {message}\n"
+
+
+def format_jsonl(created, label, result, error=None):
+    """One JSON line: time, label and result (or error)"""
+    entry = {"time": _timestamp(created), "label": label}
+    if error:
+        entry["error"] = error
+    elif result is not None:
+        entry["result"] = result
+    return json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+
+# ---------------------- Writer ----------------------
+
+class AuditLog:
+    """
+    Queue-based audit trail writer.
+
+    write() / write_many() stamp the time and put the entries on a queue; a
+    daemon thread drains up to BATCH_SIZE entries at a time, formats them and
+    writes them with a single file write, so callers never wait for the disk.
+    Before a write that would take the file past max_bytes, the file is
+    rotated (path -> path.1 -> ... -> path.<backups>); if the rotation
+    fails, the batch still goes to the current file. flush() waits until
+    everything queued so far is on disk; close() (registered with atexit)
+    flushes and stops the thread. write() after close() raises ValueError.
+    """
+
+    def __init__(self, path=LOG_FILE, fmt="text", max_bytes=DEFAULT_MAX_BYTES, backups=DEFAULT_BACKUPS,
+                 batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        if fmt not in LOG_FORMATS:
+            raise ValueError(f"unknown log format: {fmt!r} (expected one of {', '.join(LOG_FORMATS)})")
+        self.path = path
+        self.fmt = fmt
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.entries_written = 0
+        self.batches_written = 0
+        self.rotations = 0
+        self.write_errors = 0
+        self._format = format_jsonl if fmt == "jsonl" else format_text
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._lock = threading.Lock()  # no entry is queued behind the stop marker
+        self._file = open(path, "a", encoding="utf-8")
+        self._size = self._file.tell()
+        self._thread = threading.Thread(target=self._run, name="nr5g-audit", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ---------- Producer side ----------
+
+    def write(self, label, result=None, error=None):
+        """Queues one entry; returns immediately"""
+        self._put((time.time(), ((label, result, error),)))
+
+    def write_many(self, entries):
+        """Queues (label, result, error) entries sharing one timestamp, as one queue item"""
+        self._put((time.time(), tuple(entries)))
+
+    def _put(self, item):
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"audit log {self.path} is closed")
+            self._queue.put(item)
+
+    def flush(self, timeout=None):
+        """Waits until every entry queued before this call is written; False on timeout"""
+        if self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        """
+        Writes what is queued, stops the writer thread and closes the file.
+        If this is the process-wide log, the next get_audit_log() opens a new one.
+        """
+        global _audit_log
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+        self._file.close()
+        atexit.unregister(self.close)
+        if _audit_log is self:
+            _audit_log = None
+
+    # ---------- Writer thread ----------
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            batch, markers, stop, count = [], [], False, 0
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                    count += len(item[1])
+                if stop or markers or count >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except Exception:
+                    self.write_errors += 1  # disk full / failed rotation: keep serving, count the loss
+            for marker in markers:
+                marker.set()
+            if stop:
+                return
+
+    def _write_batch(self, batch):
+        lines = [self._format(created, *entry) for created, entries in batch for entry in entries]
+        data = "".join(lines)
+        size = len(data.encode("utf-8"))
+        if self.max_bytes and self._size and self._size + size > self.max_bytes:
+            try:
+                self._rotate()
+            except OSError:
+                self.write_errors += 1  # the file was reopened: write the batch there, retry next time
+        self._file.write(data)
+        self._file.flush()
+        self._size += size
+        self.entries_written += len(lines)
+        self.batches_written += 1
+
+    def _rotate(self):
+        self._file.close()
+        try:
+            if self.backups > 0:
+                for index in range(self.backups - 1, 0, -1):
+                    source = f"{self.path}.{index}"
+                    if os.path.exists(source):
+                        os.replace(source, f"{self.path}.{index + 1}")
+                os.replace(self.path, f"{self.path}.1")
+            else:
+                os.remove(self.path)
+            self.rotations += 1
+        finally:
+            # Reopened even when a rename fails, so later batches still have a file
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._size = self._file.tell()
+
+# ---------------------- logging Bridge ----------------------
+
+class AuditHandler(logging.Handler):
+    """
+    logging handler that hands records to an AuditLog instead of writing them
+    itself; without one, to the process-wide log (reopened after a close)
+    """
+
+    def __init__(self, audit_log=None):
+        super().__init__()
+        self.audit_log = audit_log
+
+    def emit(self, record):
+        try:
+            (self.audit_log or get_audit_log()).write(record.getMessage())
+        except Exception:
+            self.handleError(record)
+
+# ---------------------- Process-wide Audit Log ----------------------
+
+_audit_log = None
+_settings = {}
+_handler = None
+
+
+def configure(path=LOG_FILE, fmt="text", max_bytes=DEFAULT_MAX_BYTES, backups=DEFAULT_BACKUPS, lazy=False):
+    """
+    Opens the process-wide audit log (closing a previous one) and routes the
+    root logger's INFO messages to it. Returns the AuditLog. Once closed, it
+    is reopened with the same settings by the next get_audit_log() / audit(). With lazy=True
+    only the settings are kept and None is returned: the file is created and
+    the writer thread started by the first entry, so runs that log nothing
+    leave no file behind.
+    """
+    global _audit_log, _settings, _handler
+    if fmt not in LOG_FORMATS:
+        raise ValueError(f"unknown log format: {fmt!r} (expected one of {', '.join(LOG_FORMATS)})")
+    if _audit_log is not None:
+        _audit_log.close()
+        _audit_log = None
+    _settings = {"path": path, "fmt": fmt, "max_bytes": max_bytes, "backups": backups}
+    if lazy:
+        return None
+    _audit_log = AuditLog(path, fmt, max_bytes, backups)
+    if _handler not in logging.getLogger().handlers:
+        # Follows the process-wide log, so a reopen (even from emit()) keeps logging routed
+        _handler = AuditHandler()
+        logging.basicConfig(level=logging.INFO, handlers=[_handler], force=True)
+    return _audit_log
+
+
+def get_audit_log():
+    """The process-wide audit log; opened with the configured (or default) settings on first use and after close()"""
+    return _audit_log or configure(**_settings)
+
+
+def audit(label, result=None, error=None):
+    """Queues one entry on the process-wide audit log"""
+    get_audit_log().write(label, result, error)
@@ -0,0 +1,125 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : NR 5G Frequency -> Band Interval Index               ###
+###                 Sorted-endpoint index over the UL and DL range of    ###
+###                 every band (overlapping, SUL and SDL bands included) ###
+###                 for point, range and sorted-array batch queries      ###
+###  Created On   : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+"""
+
+import sys
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from nr5gtables import get_tables, NA
+from nr5gcache import normalize_direction
+
+# "" = UL and DL ranges together (the nrarfcn band list semantics)
+INDEX_DIRECTIONS = ("", "ul", "dl")
+
+# ---------------------- Index ----------------------
+
+class BandIntervalIndex:
+    """
+    Static stabbing-query index over closed band intervals [low, high] (MHz).
+
+    The sorted, distinct endpoints split the axis into elementary segments:
+    code 2i is the open gap below edges[i], code 2i + 1 is edges[i] itself.
+    Every segment stores the bands covering it, so a point query is one
+    bisect plus the answer (O(log n + k)). A range [low, high] is the bands
+    covering `low` plus the bands whose interval starts in (low, high]; the
+    starts are kept sorted, so that is two more bisects (O(log n + k)).
+    Answers are in band-table order (FR1, then FR2); range answers are
+    sorted into that order after the lookup.
+    """
+
+    def __init__(self, intervals):
+        # intervals = [(band, low, high)] in band-table order; a band may have several
+        self.intervals = intervals
+        self._position = {band: position for position, band in enumerate(dict.fromkeys(b for b, _, _ in intervals))}
+        self.edges = sorted({edge for _, low, high in intervals for edge in (low, high)})
+
+        members = [[] for _ in range(2 * len(self.edges) + 1)]
+        for band, low, high in intervals:
+            for code in range(2 * bisect_left(self.edges, low) + 1, 2 * bisect_left(self.edges, high) + 2):
+                if not members[code] or members[code][-1] != band:
+                    members[code].append(band)
+        self.segments = [tuple(sorted(bands, key=self._position.get)) for bands in members]
+
+        by_start = sorted(intervals, key=lambda interval: interval[1])
+        self._starts = [low for _, low, _ in by_start]
+        self._start_bands = [band for band, _, _ in by_start]
+
+    def _code(self, frequency):
+        index = bisect_left(self.edges, frequency)
+        return 2 * index + 1 if index < len(self.edges) and self.edges[index] == frequency else 2 * index
+
+    def bands_at(self, frequency):
+        """Bands whose interval contains the frequency (MHz)"""
+        return list(self.segments[self._code(frequency)])
+
+    def bands_overlapping(self, low, high):
+        """Bands whose interval overlaps [low, high] (MHz)"""
+        if high < low:
+            raise ValueError(f"Empty frequency range: {low} - {high} MHz.")
+        found = set(self.segments[self._code(low)])
+        found.update(self._start_bands[bisect_right(self._starts, low):bisect_right(self._starts, high)])
+        return sorted(found, key=self._position.get)
+
+    def bands_at_sorted(self, frequencies):
+        """
+        Point queries for an ascending frequency array, as a merge: the
+        endpoints are located in the array (n bisects) and each run of
+        frequencies between two boundaries gets its segment's bands, so the
+        cost is O(n log m + m) for m frequencies. Returns a NumPy object
+        array of band tuples.
+        """
+        import numpy as np
+        frequencies = np.asarray(frequencies, dtype=np.float64)
+        if np.any(frequencies[1:] < frequencies[:-1]):
+            raise ValueError("Frequencies must be sorted in ascending order.")
+        edges = np.array(self.edges, dtype=np.float64)
+        # bounds[2i + 1] / bounds[2i + 2]: first frequency >= / > edges[i]; segment c is bounds[c]:bounds[c + 1]
+        bounds = np.empty(2 * len(edges) + 2, dtype=np.int64)
+        bounds[0], bounds[-1] = 0, len(frequencies)
+        bounds[1:-1:2] = np.searchsorted(frequencies, edges, side="left")
+        bounds[2:-1:2] = np.searchsorted(frequencies, edges, side="right")
+        table = np.empty(len(self.segments), dtype=object)
+        table[:] = self.segments
+        return np.repeat(table, np.diff(bounds))
+
+# ---------------------- Band Intervals ----------------------
+
+def band_intervals(direction=""):
+    """(band, low, high) per UL / DL range of every band; '' keeps both, once per distinct range"""
+    direction = normalize_direction(direction)
+    if direction not in INDEX_DIRECTIONS:
+        raise ValueError(f"Unknown direction: {direction!r} (expected 'ul', 'dl' or '').")
+    intervals = []
+    for band, (ul_low, ul_high, dl_low, dl_high, _, _) in get_tables().band_info.items():
+        spans = {"ul": (ul_low, ul_high), "dl": (dl_low, dl_high)}
+        chosen = [spans[direction]] if direction else list(dict.fromkeys(spans.values()))
+        intervals.extend((band, low, high) for low, high in chosen if NA not in (low, high))
+    return intervals
+
+
+def get_band_index(direction=""):
+    """The index for a direction ('' = UL and DL, 'ul', 'dl'), built once"""
+    return _build_index(normalize_direction(direction))
+
+
+@lru_cache(maxsize=None)
+def _build_index(direction):
+    return BandIntervalIndex(band_intervals(direction))
+
+
+if __name__ == "__main__":
+    # python nr5gbandindex.py 3300 3800 [ul|dl]
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python nr5gbandindex.py LOW_MHZ HIGH_MHZ [ul|dl]")
+        sys.exit(2)
+    index = get_band_index(sys.argv[3] if len(sys.argv) == 4 else "")
+    print(", ".join(index.bands_overlapping(float(sys.argv[1]), float(sys.argv[2]))) or "No bands")
@@ -0,0 +1,236 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : NR 5G Vectorized Batch Conversions                   ###
+###                 NumPy versions of every nr5gmodule conversion.       ###
+###                 Each returns (values, valid) arrays: invalid inputs  ###
+###                 are flagged in the mask instead of print()/-1        ###
+###  Created On   : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+"""
+
+import numpy as np
+from functools import lru_cache
+from nr5gtables import get_tables, MAX_NRARFCN
+from nr5gcache import band_query
+from nr5gprb import NRB_TABLE
+
+# Invalid entries hold these fill values; always use the mask to tell them apart
+INVALID_INT = -1
+INVALID_FLOAT = np.nan
+
+# ---------------------- Raster Arrays ----------------------
+
+@lru_cache(maxsize=None)
+def _raster_arrays():
+    """Per-row raster parameters as NumPy arrays, built once from the tables"""
+    tables = get_tables()
+    arfcn = np.array(tables.arfcn_rows, dtype=np.float64)
+    gscn_rows = tables.gscn_rows
+    segments = [()]  # before the first band edge
+    for index, point in enumerate(tables.point_bands):
+        segments.append(point)
+        segments.append(tables.gap_bands[index] if index < len(tables.gap_bands) else ())
+    segment_table = np.empty(len(segments), dtype=object)
+    segment_table[:] = segments
+    return {
+        "arfcn_n_max": arfcn[:, 6].astype(np.int64),
+        "arfcn_f_max": arfcn[:, 1],
+        "arfcn_f_offs": arfcn[:, 3],
+        "arfcn_f_offs_khz": np.array([int(row[3] * 1000) for row in tables.arfcn_rows], dtype=np.int64),
+        "arfcn_df": arfcn[:, 2].astype(np.int64),
+        "arfcn_n_offs": arfcn[:, 4].astype(np.int64),
+        "gscn_max": np.array([row[12] for row in gscn_rows], dtype=np.int64),
+        "gscn_f_max": np.array([row[1] for row in gscn_rows], dtype=np.float64),
+        "band_edges": np.array(tables.band_edges, dtype=np.float64),
+        "segment_table": segment_table,
+    }
+
+
+def _as_int_array(values):
+    values = np.asarray(values)
+    if values.dtype.kind in "iub":
+        return values.astype(np.int64), np.ones(values.shape, dtype=bool)
+    # Non-integral numbers are rejected, as the scalar path rejects non-int ARFCNs
+    as_float = values.astype(np.float64)
+    integral = np.isfinite(as_float) & (as_float == np.trunc(as_float))
+    return np.where(integral, as_float, 0).astype(np.int64), integral
+
+# ---------------------- ARFCN ↔ Frequency ----------------------
+
+def get_nr_Freq_from_nr_Arfcn(nrarfcn):
+    """NR ARFCN array -> frequency array (MHz), valid where 0 < ARFCN < 3279165"""
+    raster = _raster_arrays()
+    n, valid = _as_int_array(nrarfcn)
+    valid &= (n > 0) & (n < MAX_NRARFCN)
+    row = np.minimum(np.searchsorted(raster["arfcn_n_max"], n, side="left"), len(raster["arfcn_n_max"]) - 1)
+    khz = raster["arfcn_f_offs_khz"][row] + raster["arfcn_df"][row] * (n - raster["arfcn_n_offs"][row])
+    return np.where(valid, np.round(khz / 1000, 3), INVALID_FLOAT), valid
+
+def get_nr_Arfcn_from_nr_Freq(nrfreq):
+    """Frequency array (MHz) -> NR ARFCN array, valid where 410 < freq < 71000"""
+    raster = _raster_arrays()
+    f = np.asarray(nrfreq, dtype=np.float64)
+    valid = (f > 410) & (f < 71000)
+    row = np.minimum(np.searchsorted(raster["arfcn_f_max"], f, side="left"), len(raster["arfcn_f_max"]) - 1)
+    n = raster["arfcn_n_offs"][row] + (f - raster["arfcn_f_offs"][row]) * 1000. / raster["arfcn_df"][row]
+    n = np.minimum(np.rint(np.where(valid, n, 0)), MAX_NRARFCN).astype(np.int64)
+    return np.where(valid, n, INVALID_INT), valid
+
+# ---------------------- Frequency / ARFCN ➡ Band List ----------------------
+
+def _segment_codes(f):
+    # 2*i + 1 = exactly on band edge i; 2*i = strictly between edges i-1 and i
+    edges = _raster_arrays()["band_edges"]
+    index = np.searchsorted(edges, f, side="left")
+    on_edge = (index < len(edges)) & (edges[np.minimum(index, len(edges) - 1)] == f)
+    return 2 * index + on_edge
+
+def get_nr_Bands_from_nr_Freq(nrfreq):
+    """Frequency array (MHz) -> object array of band tuples"""
+    f = np.asarray(nrfreq, dtype=np.float64)
+    valid = (f > 410) & (f < 71000)
+    bands = _raster_arrays()["segment_table"][_segment_codes(np.where(valid, f, -1.0))]
+    return bands, valid
+
+def get_nr_Bands_from_nr_Arfcn(nrarfcn):
+    """NR ARFCN array -> object array of band tuples"""
+    freq, valid = get_nr_Freq_from_nr_Arfcn(nrarfcn)
+    bands = _raster_arrays()["segment_table"][_segment_codes(np.where(valid, freq, -1.0))]
+    return bands, valid
+
+# ---------------------- GSCN ↔ Frequency ----------------------
+
+def get_nr_Freq_from_nr_GSCN(nrgscn):
+    """GSCN array -> SS block frequency array (MHz), valid where 2 <= GSCN <= 26639"""
+    tables = get_tables()
+    raster = _raster_arrays()
+    g = np.trunc(np.asarray(nrgscn, dtype=np.float64)).astype(np.int64)
+    valid = (g >= 2) & (g <= 26639)
+    row = np.minimum(np.searchsorted(raster["gscn_max"], g, side="left"), len(raster["gscn_max"]) - 1)
+    freq = np.full(g.shape, INVALID_FLOAT)
+    for index, params in enumerate(tables.gscn_rows):
+        f_min, f_max, n_min, n_max, m_set, f_offs, n_coeff, m_coeff, g_offs, g_n_coeff, g_m_coeff, _, _ = params
+        rows = valid & (row == index)
+        gr = g[rows]
+        if not m_set:
+            freq[rows] = f_offs + n_coeff * (gr - g_offs)
+        else:
+            remainder = gr % 3
+            n = np.where(remainder == 2, gr + 1, gr) // g_n_coeff
+            m = np.choose(remainder, [3, 5, 1])
+            freq[rows] = f_offs + n_coeff * n + m_coeff * m
+    return np.round(freq, 3), valid
+
+def get_nr_GSCN_from_nr_Freq(nrfreq):
+    """Frequency array (MHz) -> nearest GSCN array, valid where 410 <= int(freq) <= 71000"""
+    tables = get_tables()
+    raster = _raster_arrays()
+    f = np.trunc(np.asarray(nrfreq, dtype=np.float64))
+    valid = (f >= 410) & (f <= 71000)
+    row = np.minimum(np.searchsorted(raster["gscn_f_max"], f, side="left"), len(raster["gscn_f_max"]) - 1)
+    gscn = np.full(f.shape, INVALID_INT, dtype=np.int64)
+    for index, params in enumerate(tables.gscn_rows):
+        f_min, f_max, n_min, n_max, m_set, f_offs, n_coeff, m_coeff, g_offs, g_n_coeff, g_m_coeff, _, _ = params
+        rows = valid & (row == index)
+        fr = f[rows]
+        if not m_set:
+            gscn[rows] = np.trunc(g_offs + np.rint((fr - f_offs) / n_coeff))
+            continue
+        n = np.rint((fr - m_coeff * sum(m_set) / len(m_set)) / n_coeff)
+        best_m = np.zeros(fr.shape)
+        best_distance = np.full(fr.shape, np.inf)
+        for candidate in sorted(m_set):  # ties go to the smaller m, like min() over (distance, m)
+            distance = np.abs(fr - (n * n_coeff + candidate * m_coeff))
+            better = distance < best_distance
+            best_m = np.where(better, candidate, best_m)
+            best_distance = np.where(better, distance, best_distance)
+        gscn[rows] = np.trunc(g_offs + n * g_n_coeff + best_m * g_m_coeff)
+    return gscn, valid
+
+# ---------------------- Band-level Queries ----------------------
+
+def _per_band(nrband, answer):
+    # Band columns repeat a few dozen distinct values: answer each once
+    bands = np.asarray(nrband, dtype=object)
+    unique, inverse = np.unique(bands.astype(str), return_inverse=True)
+    answers = np.empty(len(unique), dtype=object)
+    for index, band in enumerate(unique):
+        try:
+            answers[index] = answer(str(band))
+        except ValueError:
+            answers[index] = None
+    result = answers[inverse.reshape(bands.shape)]
+    return result, np.not_equal(result, None)
+
+def _range_arrays(result, valid):
+    low = np.full(result.shape, INVALID_FLOAT)
+    high = np.full(result.shape, INVALID_FLOAT)
+    for index in zip(*np.nonzero(valid)):
+        span = result[index]
+        if isinstance(span[0], str):  # 'N/A' side of an SUL/SDL band
+            valid[index] = False
+        else:
+            low[index], high[index] = span
+    return low, high, valid
+
+def get_duplex_mode_from_nr_Band(nrband):
+    """Band array -> duplex mode array ('FDD', 'TDD', 'SDL', 'SUL')"""
+    return _per_band(nrband, lambda band: band_query("duplex_mode", band))
+
+def get_nr_ArfcnRange_from_nr_Band(nrband, direction=""):
+    """Band array -> (low, high, valid) ARFCN range arrays"""
+    # The scalar version ignores direction; here it is honoured ("" = band default)
+    return _range_arrays(*_per_band(nrband, lambda band: band_query("nrarfcn_range", band, direction)))
+
+def get_nr_Freqrange_from_nr_Band(nrband, direction=""):
+    """Band array -> (low, high, valid) frequency range arrays (MHz)"""
+    return _range_arrays(*_per_band(nrband, lambda band: band_query("frequency_range", band, direction)))
+
+def get_nr_GSCNRange_from_nr_Band(nrband):
+    """Band array -> (low, high, valid) GSCN range arrays"""
+    return _range_arrays(*_per_band(nrband, lambda band: band_query("gscn_range", band)))
+
+# ---------------------- Numerology / PRB ----------------------
+
+def get_NRsubcarrier_spacing_from_numerology(numerology):
+    """Numerology array -> subcarrier spacing array (kHz), valid for 0–4"""
+    mu, valid = _as_int_array(numerology)
+    valid &= (mu >= 0) & (mu <= 4)
+    return np.where(valid, 15 * 2 ** np.clip(mu, 0, 4), INVALID_INT), valid
+
+@lru_cache(maxsize=None)
+def _nrb_grid(fr):
+    """Dense N_RB array indexed [SCS position, bandwidth MHz]; 0 = not in the 38.101 tables"""
+    entries = {(scs, bw): nrb for (table_fr, scs, bw), nrb in NRB_TABLE.items() if table_fr == fr}
+    scs_values = np.array(sorted({scs for scs, _ in entries}), dtype=np.int64)
+    grid = np.zeros((len(scs_values), max(bw for _, bw in entries) + 1), dtype=np.int64)
+    for (scs, bw), nrb in entries.items():
+        grid[np.searchsorted(scs_values, scs), bw] = nrb
+    return scs_values, grid
+
+def get_nr_NumberOfPRBs(channelBW, SubcarrierSpacing, mode="table", fr=None):
+    """Bandwidth (MHz) and SCS (kHz) arrays -> PRB count array (same modes as nr5gmodule)"""
+    bw = np.asarray(channelBW, dtype=np.float64)
+    scs = np.asarray(SubcarrierSpacing, dtype=np.float64)
+    valid = (bw > 0) & (scs > 0)
+    prbs = np.trunc(np.where(valid, bw * 1000 / np.where(valid, scs, 1) / 12, 0)).astype(np.int64) - 4
+    if mode == "table":
+        scs_values, grid = _nrb_grid(fr)
+        row = np.minimum(np.searchsorted(scs_values, scs), len(scs_values) - 1)
+        column = np.where((bw == np.trunc(bw)) & (bw < grid.shape[1]) & valid, bw, 0).astype(np.int64)
+        nrb = np.where(scs_values[row] == scs, grid[row, column], 0)
+        prbs = np.where(nrb > 0, nrb, prbs)  # formula where 38.101 has no entry
+    elif mode != "formula":
+        raise ValueError(f"unknown PRB mode: {mode!r}")
+    return np.where(valid, prbs, INVALID_INT), valid
+
+def get_nr_NumberOfPRBs_from_numerology(numerology, channelBW):
+    """Numerology and bandwidth (MHz) arrays -> PRB count array, as menu option 12"""
+    scs, valid = get_NRsubcarrier_spacing_from_numerology(numerology)
+    bw = np.asarray(channelBW, dtype=np.float64)
+    prbs, prb_valid = get_nr_NumberOfPRBs(bw, scs)
+    valid &= prb_valid & (bw >= 1)
+    return np.where(valid, prbs, INVALID_INT), valid
@@ -0,0 +1,163 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : NR 5G Non-interactive Batch Mode                     ###
+###                 Streams operation records from CSV / JSON-lines      ###
+###                 (file or stdin), groups identical operations per     ###
+###                 chunk for the vectorized path, writes results as     ###
+###                 it goes                                              ###
+###  Created On   : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+"""
+
+import csv
+import json
+import sys
+from itertools import islice
+from nr5gops import lookup_operation, PARAMETER_NAMES
+
+FORMATS = ("csv", "jsonl")
+
+# Records held in memory at a time; memory use does not grow with the input
+CHUNK_SIZE = 65536
+
+CSV_COLUMNS = ["op", *PARAMETER_NAMES, "result", "error"]
+
+# ---------------------- Input / Output Helpers ----------------------
+
+def detect_format(path, fmt=None):
+    """Returns 'csv' or 'jsonl' from an explicit format or the file extension"""
+    if fmt:
+        if fmt not in FORMATS:
+            raise ValueError(f"unknown batch format: {fmt!r} (expected one of {', '.join(FORMATS)})")
+        return fmt
+    if path and path != "-" and path.lower().endswith(".csv"):
+        return "csv"
+    return "jsonl"
+
+def _open(path, mode):
+    if path in (None, "-"):
+        return None
+    return open(path, mode, newline="", encoding="utf-8")
+
+def _read_records(stream, fmt):
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+        return
+    for line_no, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            record = {"_error": f"line {line_no}: invalid JSON ({exc.msg})"}
+        if not isinstance(record, dict):
+            record = {"_error": f"line {line_no}: expected a JSON object"}
+        yield record
+
+# ---------------------- Chunk Evaluation ----------------------
+
+def evaluate_chunk(records):
+    """
+    Evaluates a list of records. Rows with the same operation go through the
+    vectorized implementation together; returns (result, error) per record,
+    in input order.
+    """
+    outcomes = [None] * len(records)
+    groups = {}
+    operations = {}  # 'op' field value -> Operation, resolved once per chunk
+    for index, record in enumerate(records):
+        try:
+            if "_error" in record:
+                raise ValueError(record["_error"])
+            key = record.get("op")
+            try:
+                op = operations[key]
+            except KeyError:
+                op = operations[key] = lookup_operation(key)
+            except TypeError:  # unhashable value such as a list: always an unknown operation
+                op = lookup_operation(key)
+            args = op.parse_args(record)
+        except ValueError as exc:
+            outcomes[index] = (None, str(exc))
+            continue
+        _, rows, arguments = groups.setdefault(op.menu, (op, [], []))
+        rows.append(index)
+        arguments.append(args)
+
+    for op, rows, arguments in groups.values():
+        columns = [list(column) for column in zip(*arguments)]
+        for index, result in zip(rows, op.run_batch(columns)):
+            outcomes[index] = (result, None) if result is not None else (None, op.error)
+    return outcomes
+
+# ---------------------- Writers ----------------------
+
+class _JsonlWriter:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, record, result, error):
+        record = {key: value for key, value in record.items() if key != "_error"}
+        record.update({"error": error} if error else {"result": result})
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+class _CsvWriter:
+    def __init__(self, stream):
+        self.writer = csv.DictWriter(stream, CSV_COLUMNS, extrasaction="ignore")
+        self.writer.writeheader()
+
+    def write(self, record, result, error):
+        row = {key: record.get(key, "") for key in CSV_COLUMNS}
+        if isinstance(result, (list, tuple)):
+            result = json.dumps(list(result))
+        row["result"] = "" if result is None else result
+        row["error"] = error or ""
+        self.writer.writerow(row)
+
+# ---------------------- Batch Runner ----------------------
+
+def audit_entries(records, outcomes):
+    """(label, result, error) audit entries for evaluated records"""
+    return [(f"{record.get('op')}", result, error) for record, (result, error) in zip(records, outcomes)]
+
+def run_batch(input_path="-", output_path="-", fmt=None, output_fmt=None, chunk_size=CHUNK_SIZE, audit=None):
+    """
+    Streams records from input_path ('-' = stdin) to output_path ('-' = stdout).
+    With an nr5gaudit.AuditLog as `audit`, every result is also queued on it
+    (one queue item per chunk). Returns (processed, failed) record counts.
+    """
+    in_fmt = detect_format(input_path, fmt)
+    if output_fmt or str(output_path).lower().endswith((".csv", ".jsonl")):
+        out_fmt = detect_format(output_path, output_fmt)
+    else:
+        out_fmt = in_fmt  # stdout or no known extension: answer in the input's format
+    if chunk_size < 1:
+        raise ValueError("chunk size must be at least 1")
+
+    in_file = _open(input_path, "r")
+    out_file = _open(output_path, "w")
+    processed = failed = 0
+    try:
+        writer = (_CsvWriter if out_fmt == "csv" else _JsonlWriter)(out_file or sys.stdout)
+        records = _read_records(in_file or sys.stdin, in_fmt)
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                break
+            outcomes = evaluate_chunk(chunk)
+            for record, (result, error) in zip(chunk, outcomes):
+                writer.write(record, result, error)
+                failed += error is not None
+            if audit is not None:
+                audit.write_many(audit_entries(chunk, outcomes))
+            processed += len(chunk)
+    finally:
+        for handle in (in_file, out_file):
+            if handle is not None:
+                handle.close()
+    return processed, failed
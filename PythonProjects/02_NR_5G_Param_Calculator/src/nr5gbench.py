@@ -0,0 +1,294 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : NR 5G Conversion Engine Benchmark                    ###
+###                 Times every NR5GMenu operation on the nrarfcn,       ###
+###                 table, cached and vectorized paths over seeded FR1 / ###
+###                 FR2 inputs, cross-checks their results and keeps a   ###
+###                 JSON baseline for regression comparison              ###
+###  Created On   : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+from nr5gmodule import NR5GMenu
+from nr5gops import OPERATIONS
+from nr5gtables import get_tables, NA
+from nr5gprb import number_of_prbs
+import nr5gbatch
+
+BENCH_SEED = 2026
+DEFAULT_COUNT = 2000
+DEFAULT_REPEATS = 3
+
+# A run slower than baseline x tolerance is reported as a regression
+REGRESSION_TOLERANCE = 1.25
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "nr5gbench_baseline.json")
+
+# nrarfcn: the library per value; table: NRRasterTables methods; cached: the nr5gmodule
+# functions (table engine + band LRU); vectorized: nr5gbatch over whole arrays
+ENGINES = ("nrarfcn", "table", "cached", "vectorized")
+
+# ---------------------- Seeded Inputs ----------------------
+
+def make_inputs(count=DEFAULT_COUNT, seed=BENCH_SEED):
+    """
+    Random parameter columns, half in FR1 and half in FR2 where the parameter
+    has a frequency, all inside the ranges the menu accepts. Same seed, same inputs.
+    """
+    rng = np.random.default_rng(seed)
+    fr1, fr2 = count // 2, count - count // 2
+
+    def split(low1, high1, low2, high2, draw):
+        values = np.concatenate([draw(low1, high1, fr1), draw(low2, high2, fr2)])
+        return rng.permutation(values)
+
+    integers = lambda low, high, size: rng.integers(low, high + 1, size)
+    floats = lambda low, high, size: rng.uniform(low, high, size).round(3)
+    return {
+        "arfcn": split(82000, 875000, 2016667, 3279164, integers).tolist(),   # 410 - 7125 MHz / FR2
+        "freq": split(410.001, 7125.0, 24250.0, 70999.999, floats).tolist(),
+        "gscn": split(2, 9000, 22256, 26639, integers).tolist(),
+        "band": rng.choice(get_tables().bands, count).tolist(),
+        "direction": rng.choice(["", "dl", "ul"], count).tolist(),
+        "numerology": rng.integers(0, 5, count).tolist(),
+        "bandwidth": rng.choice([5, 10, 20, 40, 50, 100, 200, 400], count).tolist(),
+    }
+
+# ---------------------- Engines per Operation ----------------------
+
+def _scalar_engines(menu):
+    """{engine: function(*args)} for the scalar paths of one operation"""
+    import nrarfcn as NR_5G
+    tables = get_tables()
+    library = {
+        NR5GMenu.ARFCN_TO_FREQ: NR_5G.get_frequency,
+        NR5GMenu.FREQ_TO_ARFCN: NR_5G.get_nrarfcn,
+        NR5GMenu.FREQ_TO_BANDLIST: NR_5G.get_bands_by_frequency,
+        NR5GMenu.ARFCN_TO_BANDLIST: NR_5G.get_bands_by_nrarfcn,
+        NR5GMenu.BAND_TO_DUPLEX: NR_5G.get_duplex_mode,
+        NR5GMenu.BAND_TO_ARFCN_RANGE: lambda band, direction: NR_5G.get_nrarfcn_range(band),
+        NR5GMenu.BAND_TO_FREQ_RANGE: NR_5G.get_frequency_range,
+        NR5GMenu.GSCN_TO_FREQ: NR_5G.get_frequency_by_gscn,
+        NR5GMenu.FREQ_TO_GSCN: lambda freq: NR_5G.get_gscn_by_frequency(int(freq)),
+        NR5GMenu.BAND_TO_GSCN_RANGE: NR_5G.get_gscn_range,
+    }
+    table = {
+        NR5GMenu.ARFCN_TO_FREQ: tables.frequency,
+        NR5GMenu.FREQ_TO_ARFCN: tables.nrarfcn,
+        NR5GMenu.FREQ_TO_BANDLIST: tables.bands_by_frequency,
+        NR5GMenu.ARFCN_TO_BANDLIST: tables.bands_by_nrarfcn,
+        NR5GMenu.BAND_TO_DUPLEX: tables.duplex_mode,
+        NR5GMenu.BAND_TO_ARFCN_RANGE: lambda band, direction: tables.nrarfcn_range(band),
+        NR5GMenu.BAND_TO_FREQ_RANGE: tables.frequency_range,
+        NR5GMenu.GSCN_TO_FREQ: tables.frequency_by_gscn,
+        NR5GMenu.FREQ_TO_GSCN: lambda freq: tables.gscn_by_frequency(int(freq)),
+        NR5GMenu.BAND_TO_GSCN_RANGE: tables.gscn_range,
+        NR5GMenu.NUMEROLOGY_TO_SCS: lambda numerology: 15 * 2 ** numerology,
+        NR5GMenu.PRB_CALCULATION: lambda numerology, bandwidth: number_of_prbs(bandwidth, 15 * 2 ** numerology),
+    }
+    engines = {"nrarfcn": library.get(menu), "table": table[menu], "cached": OPERATIONS[menu].scalar}
+    return {engine: function for engine, function in engines.items() if function is not None}
+
+
+def _vector_call(op, columns):
+    """Zero-argument call of the nr5gbatch function over NumPy columns (one call per direction)"""
+    function = getattr(nr5gbatch, op.vector)
+    names = [name for name, _ in op.params]
+    arrays = [np.asarray(columns[names.index(name)]) for name in names]
+    if "direction" not in names or op.menu == NR5GMenu.BAND_TO_ARFCN_RANGE:
+        vector_args = [arrays[names.index(name)] for name in names if name != "direction"]
+        return lambda: function(*vector_args)
+    band, direction = arrays
+    groups = [(band[direction == value], value) for value in np.unique(direction).tolist()]
+    return lambda: [function(rows, value) for rows, value in groups]
+
+# ---------------------- Correctness ----------------------
+
+def _comparable(result):
+    # Errors, -1 and 'N/A' ranges all mean "no answer"; tuples and lists compare equal
+    if isinstance(result, (tuple, list)):
+        return None if NA in result else list(result)
+    return None if result == -1 else result
+
+
+def _scalar_results(function, rows):
+    results = []
+    for args in rows:
+        try:
+            results.append(_comparable(function(*args)))
+        except ValueError:
+            results.append(None)
+    return results
+
+
+def cross_check(inputs):
+    """
+    Runs every operation on every engine over the same inputs; returns a list
+    of (operation, engine, args, expected, got) where an engine disagrees with
+    the reference (nrarfcn, or the table engine where nrarfcn has no API).
+    """
+    mismatches = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for menu, op in OPERATIONS.items():
+            columns = [inputs[name] for name, _ in op.params]
+            rows = list(zip(*columns))
+            results = {engine: _scalar_results(function, rows) for engine, function in _scalar_engines(menu).items()}
+            results["vectorized"] = [_comparable(value) if value is not None else None for value in op.run_batch(columns)]
+            reference = next(iter(results))
+            for engine, values in results.items():
+                mismatches.extend((op.name, engine, args, want, got)
+                                  for args, want, got in zip(rows, results[reference], values) if want != got)
+    return mismatches
+
+# ---------------------- Timing ----------------------
+
+def _measure(run, count, repeats):
+    best = min(_timed(run) for _ in range(repeats))
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"ns_per_call": best / count * 1e9, "calls_per_s": count / best, "peak_kib": peak / 1024}
+
+
+def _call_each(function, rows):
+    # nrarfcn and the table engine raise for some inputs (e.g. the GSCN range of a SUL band)
+    for args in rows:
+        try:
+            function(*args)
+        except ValueError:
+            pass
+
+
+def _timed(run):
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def run_benchmarks(inputs, repeats=DEFAULT_REPEATS, operations=None):
+    """
+    {operation: {engine: {"ns_per_call", "calls_per_s", "peak_kib"}}} over the
+    inputs. Best of `repeats` passes; memory is the tracemalloc peak of one
+    extra pass. The band cache is warm (cross_check or a first pass fills it).
+    """
+    results = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for menu, op in OPERATIONS.items():
+            if operations and op.name not in operations:
+                continue
+            columns = [inputs[name] for name, _ in op.params]
+            rows = list(zip(*columns))
+            count = len(rows)
+            runs = {engine: (lambda function=function: _call_each(function, rows))
+                    for engine, function in _scalar_engines(menu).items()}
+            runs["vectorized"] = _vector_call(op, columns)
+            results[op.name] = {}
+            for engine, run in runs.items():
+                run()  # warm-up: caches, lazily built arrays
+                results[op.name][engine] = _measure(run, count, repeats)
+    return results
+
+# ---------------------- Baseline ----------------------
+
+def save_baseline(results, count, seed, path=None):
+    """Writes the results with the run settings as a JSON baseline"""
+    baseline = {
+        "seed": seed,
+        "count": count,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {operation: {engine: {key: round(value, 1) for key, value in numbers.items()}
+                                for engine, numbers in engines.items()}
+                    for operation, engines in results.items()},
+    }
+    with open(path or BASELINE_FILE, "w", encoding="utf-8") as handle:
+        json.dump(baseline, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def load_baseline(path=None):
+    with open(path or BASELINE_FILE, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def compare_to_baseline(results, baseline, tolerance=REGRESSION_TOLERANCE):
+    """(operation, engine, baseline ns, ns, ratio) for every entry slower than baseline x tolerance"""
+    regressions = []
+    for operation, engines in results.items():
+        for engine, numbers in engines.items():
+            before = baseline["results"].get(operation, {}).get(engine)
+            if before is None:
+                continue
+            ratio = numbers["ns_per_call"] / before["ns_per_call"]
+            if ratio > tolerance:
+                regressions.append((operation, engine, before["ns_per_call"], numbers["ns_per_call"], ratio))
+    return regressions
+
+# ---------------------- Report ----------------------
+
+def format_report(results, baseline=None):
+    lines = [f"{'Operation':<20} {'Engine':<11} {'ns/call':>10} {'calls/s':>12} {'peak KiB':>9}"
+             + (f" {'vs base':>8}" if baseline else "")]
+    for operation, engines in results.items():
+        for engine, numbers in engines.items():
+            line = (f"{operation:<20} {engine:<11} {numbers['ns_per_call']:>10.0f} "
+                    f"{numbers['calls_per_s']:>12,.0f} {numbers['peak_kib']:>9.1f}")
+            before = baseline and baseline["results"].get(operation, {}).get(engine)
+            if before:
+                line += f" {numbers['ns_per_call'] / before['ns_per_call']:>7.2f}x"
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the NR 5G conversion engines")
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help="Inputs per operation")
+    parser.add_argument("--seed", type=int, default=BENCH_SEED, help="Random seed for the inputs")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="Timed passes (best is kept)")
+    parser.add_argument("--save-baseline", nargs="?", const=BASELINE_FILE, metavar="PATH",
+                        help="Write the results as the JSON baseline")
+    parser.add_argument("--compare", nargs="?", const=BASELINE_FILE, metavar="PATH",
+                        help="Compare with a JSON baseline; exit 1 on a regression")
+    args = parser.parse_args(argv)
+
+    inputs = make_inputs(args.count, args.seed)
+    mismatches = cross_check(inputs)
+    print(f"Cross-check: {args.count} inputs per operation, seed {args.seed}: {len(mismatches)} mismatches")
+    for mismatch in mismatches[:20]:
+        print(mismatch)
+
+    results = run_benchmarks(inputs, args.repeats)
+    baseline = load_baseline(args.compare) if args.compare else None
+    print(format_report(results, baseline))
+
+    status = 1 if mismatches else 0
+    if baseline:
+        regressions = compare_to_baseline(results, baseline)
+        print(f"\n{len(regressions)} regressions over {REGRESSION_TOLERANCE:.2f}x the baseline")
+        for operation, engine, before, now, ratio in regressions:
+            print(f"  {operation} / {engine}: {before:.0f} -> {now:.0f} ns/call ({ratio:.2f}x)")
+        status = status or (1 if regressions else 0)
+    if args.save_baseline:
+        save_baseline(results, args.count, args.seed, args.save_baseline)
+        print(f"\nBaseline written to {args.save_baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : NR 5G Band Query Cache                               ###
+###                 Bounded LRU over band-level answers (duplex, ARFCN / ###
+###                 frequency / GSCN ranges) keyed by normalized band    ###
+###                 names, with hit/miss statistics and warm-up          ###
+###  Created On   : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+"""
+
+from functools import lru_cache
+from nr5gtables import get_tables
+
+# Large enough to hold every band x query x direction after warm_up()
+BAND_CACHE_SIZE = 1024
+
+DIRECTIONS = ("", "dl", "ul")
+
+# Band-level queries of NRRasterTables; True = takes a direction
+BAND_QUERIES = {
+    "duplex_mode": False,
+    "nrarfcn_range": True,
+    "frequency_range": True,
+    "gscn_range": False,
+}
+
+# ---------------------- Key Normalization ----------------------
+
+def normalize_band(band):
+    """' N78 ' -> 'n78'; anything that is not a string is rejected"""
+    if not isinstance(band, str):
+        raise ValueError(f"No table entry for {band!r}.")
+    return band.strip().lower()
+
+def normalize_direction(direction):
+    """None / ' UL ' -> '' / 'ul'"""
+    return "" if direction is None else str(direction).strip().lower()
+
+# ---------------------- Cached Lookups ----------------------
+
+@lru_cache(maxsize=BAND_CACHE_SIZE)
+def _answer(query, band, direction):
+    # Unknown bands are cached too (as None), so repeated bad input stays cheap
+    lookup = getattr(get_tables(), query)
+    try:
+        return lookup(band, direction) if BAND_QUERIES[query] else lookup(band)
+    except ValueError:
+        return None
+
+def band_query(query, band, direction=""):
+    """
+    Band-level answer from the cache, e.g. band_query("frequency_range", "N78", "UL").
+    Raises ValueError for an unknown band or direction, like NRRasterTables.
+    """
+    key = normalize_band(band)
+    result = _answer(query, key, normalize_direction(direction) if BAND_QUERIES[query] else "")
+    if result is None:
+        raise ValueError(f"No table entry for {band!r}.")
+    return result
+
+# ---------------------- Statistics / Warm-up ----------------------
+
+def cache_info():
+    """(hits, misses, maxsize, currsize) of the band cache"""
+    return _answer.cache_info()
+
+def cache_clear():
+    """Empties the band cache and resets its statistics"""
+    _answer.cache_clear()
+
+def warm_up():
+    """Preloads every defined band for every query and direction; returns the cache size"""
+    for band in get_tables().bands:
+        for query, directional in BAND_QUERIES.items():
+            for direction in DIRECTIONS if directional else ("",):
+                _answer(query, band, direction)
+    return cache_info().currsize
@@ -0,0 +1,129 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : NR 5G Calculator Thin Client                         ###
+###                 Talks to a running nr5gserver over a Unix socket or  ###
+###                 localhost TCP. Standard library only, so it starts   ###
+###                 without importing nrarfcn / NumPy                    ###
+###  Created On   : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+"""
+
+import json
+import socket
+import sys
+
+DEFAULT_ADDRESS = "/tmp/nr5gcalc.sock"
+
+# Requests sent ahead of reading responses; bounded so neither side can block
+# on a full socket buffer while the other is still writing
+PIPELINE_WINDOW = 1024
+
+# ---------------------- Addresses ----------------------
+
+def parse_address(address):
+    """
+    '/path/to.sock' or 'unix:/path' -> (AF_UNIX, path);
+    'host:port' or ('host', port) -> (AF_INET, (host, port))
+    """
+    if isinstance(address, tuple):
+        return socket.AF_INET, address
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:"):]
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit() and not address.startswith(("/", ".")):
+        return socket.AF_INET, (host or "127.0.0.1", int(port))
+    return socket.AF_UNIX, address
+
+def connect(address):
+    """Opens a client socket to the server address"""
+    family, target = parse_address(address)
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.connect(target)
+        if family == socket.AF_INET:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+# ---------------------- Client ----------------------
+
+class NR5GClient:
+    """
+    One connection to the calculator server. Requests are JSON objects, one
+    per line; responses come back in the same order with `result` or `error`.
+    """
+
+    def __init__(self, address=DEFAULT_ADDRESS):
+        self.sock = connect(address)
+        self.reader = self.sock.makefile("rb")
+
+    def call(self, op, **params):
+        """Runs one operation; raises ValueError with the server's message on invalid input"""
+        response = self.pipeline([{"op": op, **params}])[0]
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response["result"]
+
+    def pipeline(self, requests):
+        """Sends requests without waiting for each response; returns the response dicts in order"""
+        requests = list(requests)
+        responses = []
+        for start in range(0, len(requests), PIPELINE_WINDOW):
+            window = requests[start:start + PIPELINE_WINDOW]
+            self.sock.sendall(b"".join(json.dumps(request).encode() + b"\n" for request in window))
+            for _ in window:
+                line = self.reader.readline()
+                if not line:
+                    raise ConnectionError("server closed the connection")
+                responses.append(json.loads(line))
+        return responses
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# ---------------------- Command Line ----------------------
+
+def _parse_param(text):
+    name, sep, value = text.partition("=")
+    if not sep:
+        raise ValueError(f"expected name=value, got {text!r}")
+    try:
+        return name, json.loads(value)
+    except json.JSONDecodeError:
+        return name, value  # bare strings such as band=n78
+
+def main(argv=None):
+    """nr5gclient.py [--address ADDR] OP name=value ...  (e.g. ARFCN_TO_FREQ arfcn=620000)"""
+    argv = list(sys.argv[1:] if argv is None else argv)
+    address = DEFAULT_ADDRESS
+    if argv[:1] == ["--address"] and len(argv) >= 2:
+        address, argv = argv[1], argv[2:]
+    if not argv:
+        print(main.__doc__, file=sys.stderr)
+        return 2
+    try:
+        params = dict(_parse_param(arg) for arg in argv[1:])
+        with NR5GClient(address) as client:
+            print(json.dumps(client.call(argv[0], **params)))
+    except ValueError as exc:
+        print(f"❌ {exc}", file=sys.stderr)
+        return 1
+    except OSError as exc:
+        print(f"❌ Cannot reach calculator server at {address}: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
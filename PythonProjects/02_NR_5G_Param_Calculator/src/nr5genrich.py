@@ -0,0 +1,235 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : NR 5G Cell-List Enrichment                           ###
+###                 Streams a neighbor-cell CSV (ARFCN, PCI, bandwidth)  ###
+###                 in chunks and adds frequency, band list, duplex      ###
+###                 mode, SCS and PRB count with the vectorized engine;  ###
+###                 chunks can be spread over a process pool             ###
+###  Created On   : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+"""
+
+import csv
+import io
+import json
+import sys
+from itertools import islice
+import numpy as np
+from nr5gcache import band_query
+from nr5gssb import FR1_MAX_FREQ, FR2_1_MAX_FREQ
+import nr5gbatch
+
+# Rows read, enriched and written at a time
+CHUNK_SIZE = 65536
+
+# Accepted header names per input column (case-insensitive); scs is optional
+INPUT_COLUMNS = {
+    "arfcn": ("arfcn", "nrarfcn", "nr_arfcn", "nr-arfcn", "ssb_arfcn"),
+    "pci": ("pci", "nr_pci", "physcellid"),
+    "bw": ("bw", "bandwidth", "bw_mhz", "channel_bw"),
+    "scs": ("scs", "scs_khz", "subcarrier_spacing"),
+}
+REQUIRED_COLUMNS = ("arfcn", "pci", "bw")
+
+ENRICHED_COLUMNS = ["freq_mhz", "bands", "duplex", "scs_khz", "prbs", "error"]
+
+# SCS assumed for the PRB count when the file has no scs column
+DEFAULT_SCS = {"FR1": 30, "FR2-1": 120, "FR2-2": 120}
+FREQUENCY_RANGES = ("FR1", "FR2-1", "FR2-2")
+
+MAX_PCI = 1007
+
+# ---------------------- Column Mapping ----------------------
+
+def map_columns(header):
+    """{'arfcn': index, 'pci': index, 'bw': index[, 'scs': index]} for a CSV header"""
+    names = [name.strip().lower() for name in header]
+    found = {}
+    for column, aliases in INPUT_COLUMNS.items():
+        for alias in aliases:
+            if alias in names:
+                found[column] = names.index(alias)
+                break
+    missing = [column for column in REQUIRED_COLUMNS if column not in found]
+    if missing:
+        raise ValueError(f"cell list has no {', '.join(missing)} column (header: {', '.join(header)})")
+    return found
+
+def _numbers(values):
+    # CSV strings -> float array; blanks and text become NaN (flagged invalid later)
+    try:
+        return np.array(values, dtype=np.float64)
+    except ValueError:
+        pass
+    out = np.full(len(values), np.nan)
+    for index, value in enumerate(values):
+        try:
+            out[index] = float(value)
+        except (TypeError, ValueError):
+            pass
+    return out
+
+# ---------------------- Enrichment ----------------------
+
+def _band_answers(band_tuples):
+    # Band list -> (JSON list, duplex modes) per distinct band tuple
+    answers = {}
+    for bands in band_tuples:
+        if bands not in answers:
+            modes = dict.fromkeys(band_query("duplex_mode", band) for band in bands)
+            answers[bands] = (json.dumps(list(bands)), "/".join(modes))
+    return answers
+
+def enrich_columns(arfcn, pci, bw, scs=None):
+    """
+    Derived columns for equal-length arrays of ARFCN, PCI, bandwidth (MHz)
+    and optionally SCS (kHz; NaN = default for the frequency range). Each
+    distinct ARFCN is converted once and the results are spread with the
+    inverse index; neighbor lists repeat a handful of carriers. Returns a
+    dict of ENRICHED_COLUMNS arrays ('' where not available).
+    """
+    arfcn = np.asarray(arfcn, dtype=np.float64)
+    pci = np.asarray(pci, dtype=np.float64)
+    bw = np.asarray(bw, dtype=np.float64)
+    count = len(arfcn)
+
+    distinct, inverse = np.unique(np.where(np.isfinite(arfcn), arfcn, -1.0), return_inverse=True)
+    freq_distinct, valid_distinct = nr5gbatch.get_nr_Freq_from_nr_Arfcn(distinct)
+    bands_distinct, _ = nr5gbatch.get_nr_Bands_from_nr_Freq(np.where(valid_distinct, freq_distinct, -1.0))
+    freq, arfcn_ok = freq_distinct[inverse], valid_distinct[inverse]
+
+    answers = _band_answers(bands_distinct[valid_distinct].tolist())
+    band_text = np.array([answers[b][0] if ok else "" for b, ok in zip(bands_distinct, valid_distinct)], dtype=object)
+    duplex_text = np.array([answers[b][1] if ok else "" for b, ok in zip(bands_distinct, valid_distinct)], dtype=object)
+
+    fr = np.searchsorted([FR1_MAX_FREQ, FR2_1_MAX_FREQ], np.where(arfcn_ok, freq, 0.0))
+    scs = np.full(count, np.nan) if scs is None else np.asarray(scs, dtype=np.float64)
+    scs = np.where(np.isfinite(scs), scs, np.choose(fr, [DEFAULT_SCS[name] for name in FREQUENCY_RANGES]))
+    prbs = np.full(count, nr5gbatch.INVALID_INT, dtype=np.int64)
+    prb_ok = np.zeros(count, dtype=bool)
+    for index, name in enumerate(FREQUENCY_RANGES):
+        rows = arfcn_ok & (fr == index)
+        if rows.any():
+            prbs[rows], prb_ok[rows] = nr5gbatch.get_nr_NumberOfPRBs(bw[rows], scs[rows], fr=name)
+    pci_ok = np.isfinite(pci) & (pci == np.trunc(pci)) & (pci >= 0) & (pci <= MAX_PCI)
+
+    error = np.full(count, "", dtype=object)
+    error[~prb_ok] = "invalid bandwidth / SCS"
+    error[~pci_ok] = "invalid PCI (0 - 1007)"
+    error[~arfcn_ok] = "ENTER VALID NR-ARFCN (0 - 3279165)"
+    return {
+        "freq_mhz": np.where(arfcn_ok, freq, np.nan),
+        "bands": band_text[inverse],
+        "duplex": duplex_text[inverse],
+        "scs_khz": np.where(arfcn_ok, scs, np.nan),
+        "prbs": np.where(prb_ok, prbs, nr5gbatch.INVALID_INT),
+        "error": error,
+    }
+
+def enrich_rows(rows, columns, width=0):
+    """Enriches a list of CSV rows (lists of strings, short ones padded to width); returns the output rows"""
+    def column(name):
+        return _numbers([row[columns[name]] if columns[name] < len(row) else "" for row in rows])
+    derived = enrich_columns(column("arfcn"), column("pci"), column("bw"),
+                             column("scs") if "scs" in columns else None)
+    freq, scs, prbs = derived["freq_mhz"].tolist(), derived["scs_khz"].tolist(), derived["prbs"].tolist()
+    out = []
+    for index, row in enumerate(rows):
+        ok = freq[index] == freq[index]  # NaN = invalid ARFCN
+        out.append(row + [""] * (width - len(row)) + [freq[index] if ok else "", derived["bands"][index], derived["duplex"][index],
+                          int(scs[index]) if ok else "", prbs[index] if prbs[index] >= 0 else "",
+                          derived["error"][index]])
+    return out
+
+# ---------------------- Pipeline ----------------------
+
+def enrich_text(text, columns, width=0):
+    """
+    Enriches a block of CSV text (whole records, no header); returns
+    (CSV text, rows, failed). Parsing and formatting happen here, so a
+    process-pool worker receives and returns one string per chunk.
+    """
+    rows = enrich_rows(list(csv.reader(io.StringIO(text))), columns, width)
+    out = io.StringIO()
+    csv.writer(out).writerows(rows)
+    return out.getvalue(), len(rows), sum(1 for row in rows if row[-1])
+
+def _enrich_chunk(arguments):
+    # Process-pool entry point: one picklable argument
+    return enrich_text(*arguments)
+
+def _read_records(lines, count):
+    # Up to `count` lines, extended until quotes balance (a quoted field may hold a newline)
+    block = list(islice(lines, count))
+    while block and sum(line.count('"') for line in block) % 2:
+        line = next(lines, None)
+        if line is None:
+            break
+        block.append(line)
+    return "".join(block)
+
+def _chunks(lines, chunk_size):
+    while True:
+        text = _read_records(lines, chunk_size)
+        if not text:
+            return
+        yield text
+
+def enrich_cell_list(input_path="-", output_path="-", chunk_size=CHUNK_SIZE, workers=1):
+    """
+    Streams a cell-list CSV ('-' = stdin) to an enriched CSV ('-' = stdout):
+    the input columns followed by ENRICHED_COLUMNS, in input order. Only
+    chunk_size rows are held per chunk. With workers > 1 the chunks are
+    enriched in a process pool, at most 2 x workers chunks in flight.
+    Returns (rows, failed).
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk size must be at least 1")
+    in_file = None if input_path in (None, "-") else open(input_path, newline="", encoding="utf-8")
+    out_file = None if output_path in (None, "-") else open(output_path, "w", newline="", encoding="utf-8")
+    processed = failed = 0
+    try:
+        lines = iter(in_file or sys.stdin)
+        header = next(csv.reader(io.StringIO(_read_records(lines, 1))), None)
+        if not header:
+            raise ValueError("cell list is empty")
+        columns = map_columns(header)
+        out = out_file or sys.stdout
+        csv.writer(out).writerow(header + ENRICHED_COLUMNS)
+        chunks = ((text, columns, len(header)) for text in _chunks(lines, chunk_size))
+        for text, rows, errors in _map_chunks(chunks, workers):
+            out.write(text)
+            processed += rows
+            failed += errors
+    finally:
+        for handle in (in_file, out_file):
+            if handle is not None:
+                handle.close()
+    return processed, failed
+
+def _map_chunks(chunks, workers):
+    # Ordered results; the pool only ever holds a bounded number of chunks
+    if workers <= 1:
+        yield from map(_enrich_chunk, chunks)
+        return
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_enrich_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+if __name__ == "__main__":
+    # python nr5genrich.py cells.csv enriched.csv [workers]
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python nr5genrich.py INPUT.csv OUTPUT.csv [WORKERS]")
+        sys.exit(2)
+    rows, errors = enrich_cell_list(sys.argv[1], sys.argv[2], workers=int(sys.argv[3]) if len(sys.argv) == 4 else 1)
+    print(f"Enriched {rows} cells, {errors} errors")
@@ -10,8 +10,10 @@
 #############################################################################
 """
 
-import nrarfcn as NR_5G  # External library for NR ARFCN utilities
 from enum import IntEnum
+from nr5gtables import get_tables  # 38.104 raster/band tables (table file, nrarfcn as fallback)
+from nr5gcache import band_query   # bounded LRU over band-level answers
+from nr5gprb import number_of_prbs  # 38.101 N_RB tables (formula as fallback)
 # ---------------------- Enum for Menu Choices ----------------------
 
 class NR5GMenu(IntEnum):
@@ -29,67 +31,75 @@ class NR5GMenu(IntEnum):
     PRB_CALCULATION = 12
 
 # ------------------------- 5G Parameter Conversion Functions -------------------------
+# Every conversion is a bisect / dictionary lookup in the precomputed tables;
+# results and invalid-input handling are the same as calling nrarfcn directly.
+# A band is valid exactly when it has a table entry (n1 - n104, n257 - n263);
+# band names are matched case-insensitively, ignoring surrounding spaces.
 
 def get_nr_Freq_from_nr_Arfcn(nrarfcn):
     """Converts NR ARFCN to frequency in MHz"""
     if 0 < nrarfcn < 3279165:
-        return NR_5G.get_frequency(nrarfcn)
+        return get_tables().frequency(nrarfcn)
     print("ENTER VALID NR-ARFCN (0 - 3279165)")
     return -1
 
 def get_nr_Arfcn_from_nr_Freq(nrfreq):
     """Converts NR frequency (MHz) to ARFCN"""
     if 410 < nrfreq < 71000:
-        return NR_5G.get_nrarfcn(nrfreq)
+        return get_tables().nrarfcn(nrfreq)
     print("ENTER VALID NR-FREQ (410 - 71000 MHz)")
     return -1
 
 def get_nr_Bands_from_nr_Freq(nrfreq):
     """Returns NR band list for given frequency (MHz)"""
     if 410 < nrfreq < 71000:
-        return NR_5G.get_bands_by_frequency(nrfreq)
+        return get_tables().bands_by_frequency(nrfreq)
     print("ENTER VALID NR-FREQ (410 - 71000 MHz)")
     return -1
 
 def get_nr_Bands_from_nr_Arfcn(nrarfcn):
     """Returns NR band list for given ARFCN"""
     if 0 < nrarfcn < 3279165:
-        return NR_5G.get_bands_by_nrarfcn(nrarfcn)
+        return get_tables().bands_by_nrarfcn(nrarfcn)
     print("ENTER VALID NR-ARFCN (0 - 3279165)")
     return -1
 
+def get_nr_Bands_from_nr_FreqRange(lowfreq, highfreq, direction=""):
+    """Returns NR bands whose UL and/or DL range overlaps [lowfreq, highfreq] (MHz)"""
+    # direction "ul" / "dl" restricts the ranges searched; "" searches both (SUL/SDL included)
+    from nr5gbandindex import get_band_index
+    try:
+        if 0 <= lowfreq <= highfreq <= 100000:
+            return get_band_index(direction).bands_overlapping(lowfreq, highfreq)
+    except (TypeError, ValueError):
+        pass
+    print("ENTER VALID NR-FREQ RANGE (0 - 100000 MHz, low <= high) AND DIRECTION (ul/dl)")
+    return -1
+
 def get_duplex_mode_from_nr_Band(nrband):
     """Returns duplex mode (FDD/TDD) for given NR band"""
-    temp = nrband
     try:
-        nrband_num = int(nrband[1:])
-        if (1 <= nrband_num <= 104) or ("n257" <= nrband <= "n263"):
-            return NR_5G.get_duplex_mode(temp)
-    except:
+        return band_query("duplex_mode", nrband)
+    except ValueError:
         pass
     print("ENTER VALID NR BAND Values (n1 - n263)")
     return -1
 
 def get_nr_ArfcnRange_from_nr_Band(nrband, direction):
     """Returns ARFCN range (DL/UL) for a given band"""
-    temp = nrband
+    # As before, the range is the band's default (DL, or UL for SUL bands) regardless of direction
     try:
-        nrband_num = int(nrband[1:])
-        if (1 <= nrband_num <= 104) or ("n257" <= nrband <= "n263"):
-            return NR_5G.get_nrarfcn_range(temp)
-    except:
+        return band_query("nrarfcn_range", nrband)
+    except ValueError:
         pass
     print("ENTER VALID NR BAND Values (n1 - n263)")
     return -1
 
 def get_nr_Freqrange_from_nr_Band(nrband, direction):
     """Returns frequency range (MHz) for a band and direction"""
-    temp = nrband
     try:
-        nrband_num = int(nrband[1:])
-        if (1 <= nrband_num <= 104) or ("n257" <= nrband <= "n263"):
-            return NR_5G.get_frequency_range(temp, direction)
-    except:
+        return band_query("frequency_range", nrband, direction)
+    except ValueError:
         pass
     print("ENTER VALID NR BAND Values (n1 - n263)")
     return -1
@@ -98,7 +108,7 @@ def get_nr_Freq_from_nr_GSCN(nrgscn):
     """Returns frequency for given GSCN"""
     nrgscn = int(nrgscn)
     if 2 <= nrgscn <= 26639:
-        return NR_5G.get_frequency_by_gscn(nrgscn)
+        return get_tables().frequency_by_gscn(nrgscn)
     print("ENTER VALID GSCN (2 - 26639)")
     return -1
 
@@ -106,18 +116,53 @@ def get_nr_GSCN_from_nr_Freq(nrfreq):
     """Returns GSCN for a given frequency"""
     nrfreq = int(nrfreq)
     if 410 <= nrfreq <= 71000:
-        return NR_5G.get_gscn_by_frequency(nrfreq)
+        return get_tables().gscn_by_frequency(nrfreq)
     print("ENTER VALID FREQUENCY (410 - 71000 MHz)")
     return -1
 
 def get_nr_GSCNRange_from_nr_Band(nrband):
     """Returns GSCN range for a band"""
-    temp = nrband
     try:
-        nrband_num = int(nrband[1:])
-        if (1 <= nrband_num <= 104) or ("n257" <= nrband <= "n263"):
-            return NR_5G.get_gscn_range(temp)
-    except:
+        return band_query("gscn_range", nrband)
+    except ValueError:
+        pass
+    print("ENTER VALID BAND (n1 - n263)")
+    return -1
+
+def get_nr_ArfcnRaster_from_nr_Band(nrband, scs=None, direction="", chunk_size=None):
+    """Returns an iterator over every channel-raster ARFCN of a band (ascending)"""
+    # scs (kHz) picks the raster row, None = every row; with chunk_size the iterator yields NumPy arrays
+    import nr5graster
+    try:
+        spans = nr5graster.channel_raster_spans(nrband, scs, direction)
+        if chunk_size is not None:
+            return nr5graster.raster_point_chunks(spans, chunk_size)
+        return nr5graster.iter_raster_points(spans)
+    except (TypeError, ValueError):
+        pass
+    print("ENTER VALID NR BAND Values (n1 - n263), SCS AND DIRECTION (ul/dl)")
+    return -1
+
+def get_nr_GSCNRaster_from_nr_Band(nrband, scs=None, chunk_size=None):
+    """Returns an iterator over every GSCN of a band's sync raster (ascending)"""
+    import nr5graster
+    try:
+        spans = nr5graster.sync_raster_spans(nrband, scs)
+        if chunk_size is not None:
+            return nr5graster.raster_point_chunks(spans, chunk_size)
+        return nr5graster.iter_raster_points(spans)
+    except (TypeError, ValueError):
+        pass
+    print("ENTER VALID BAND (n1 - n263) AND SSB SCS")
+    return -1
+
+def get_nr_SSB_positions(center_freq, channelBW, SubcarrierSpacing, nrband):
+    """Returns every GSCN whose SSB fits in the carrier, with k_SSB and offsetToPointA"""
+    # Vectorized over the band's whole sync raster; see nr5gssb.plan_ssb_batch for many carriers
+    import nr5gssb
+    try:
+        return nr5gssb.plan_ssb(center_freq, channelBW, SubcarrierSpacing, nrband)
+    except ValueError:
         pass
     print("ENTER VALID BAND (n1 - n263)")
     return -1
@@ -126,8 +171,8 @@ def get_NRsubcarrier_spacing_from_numerology(numerology):
     """Returns subcarrier spacing in kHz for numerology (0–4)"""
     return 15 * (2 ** numerology)
 
-def get_nr_NumberOfPRBs(channelBW, SubcarrierSpacing):
-    """Calculates number of physical resource blocks (PRBs)"""
-    channelBW_kHz = channelBW * 1000
-    totalPRBs = (channelBW_kHz / SubcarrierSpacing) / 12
-    return int(totalPRBs) - 4  # Adjusting for guard bands
+def get_nr_NumberOfPRBs(channelBW, SubcarrierSpacing, mode="table", fr=None):
+    """Returns number of physical resource blocks (PRBs): 38.101 N_RB, or the formula"""
+    # mode="formula" keeps the old int(BW / (12 x SCS)) - 4 estimate; "table" uses it
+    # only for bandwidth/SCS combinations that 38.101 does not define (fr: FR1 / FR2-1 / FR2-2)
+    return number_of_prbs(channelBW, SubcarrierSpacing, mode, fr)
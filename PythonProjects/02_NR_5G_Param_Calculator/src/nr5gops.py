@@ -0,0 +1,220 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : NR 5G Operation Registry                             ###
+###                 One entry per NR5GMenu operation: parameter names,   ###
+###                 scalar and vectorized implementations, log label.    ###
+###                 Shared by the non-interactive calculator modes       ###
+###  Created On   : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+"""
+
+import contextlib
+import io
+
+import nr5gmodule as nrmod
+from nr5gmodule import NR5GMenu
+
+# ---------------------- Parameter Parsing ----------------------
+
+def _int(value):
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, bool) or isinstance(value, float):
+        raise ValueError(f"expected an integer, got {value!r}")
+    return int(value)
+
+def _float(value):
+    if isinstance(value, bool):
+        raise ValueError(f"expected a number, got {value!r}")
+    return float(value)
+
+def _band(value):
+    if not isinstance(value, str) or not value:
+        raise ValueError(f"expected a band such as n78, got {value!r}")
+    return value
+
+def _direction(value):
+    return "" if value is None else str(value).lower()
+
+PARSERS = {"int": _int, "float": _float, "band": _band, "direction": _direction}
+
+# Parameters that may be left out of a record, with their default
+OPTIONAL = {"direction": ""}
+
+# ---------------------- Operations ----------------------
+
+class Operation:
+    """
+    One calculator operation.
+
+    `params` lists (name, kind) pairs read from a request record. `scalar`
+    is the nr5gmodule function; `vector` is the nr5gbatch function name,
+    resolved on first use so NumPy is only imported by the batch paths, and
+    `vector_params` the parameters it takes (default: all of them). `valid`
+    is an optional input check for scalars that do not validate themselves.
+    """
+
+    def __init__(self, menu, label, params, scalar, vector, error, vector_params=None, valid=None):
+        self.menu = menu
+        self.name = menu.name
+        self.label = label
+        self.params = params
+        self.scalar = scalar
+        self.vector = vector
+        self.error = error
+        self.valid = valid
+        names = [name for name, _ in params]
+        self._vector_columns = [names.index(name) for name in (vector_params or names)]
+
+    def parse_args(self, record):
+        """Reads and converts this operation's parameters from a record (dict)"""
+        args = []
+        for name, kind in self.params:
+            if name in record and record[name] not in (None, ""):
+                value = record[name]
+            elif name in OPTIONAL:
+                value = OPTIONAL[name]
+            else:
+                raise ValueError(f"missing parameter '{name}'")
+            try:
+                args.append(PARSERS[kind](value))
+            except (TypeError, ValueError):
+                raise ValueError(f"invalid {name}: {value!r}") from None
+        return tuple(args)
+
+    def run(self, *args):
+        """
+        Runs the scalar implementation on parsed arguments.
+        Returns (result, error) like nr5gbatchmode.evaluate_chunk: error is
+        None on success, result is None for an invalid value.
+        """
+        if self.valid is not None and not self.valid(*args):
+            return None, self.error
+        with contextlib.redirect_stdout(io.StringIO()):  # nr5gmodule prints its 'ENTER VALID ...' hint
+            result = self.scalar(*args)
+        if isinstance(result, int) and result == -1:
+            return None, self.error
+        return (list(result) if isinstance(result, tuple) else result), None
+
+    def run_batch(self, columns):
+        """
+        Runs the vectorized implementation over argument columns (lists).
+        Returns one result per row, None where the input is invalid.
+        """
+        import nr5gbatch
+        vector = getattr(nr5gbatch, self.vector)
+        count = len(columns[0]) if columns else 0
+        # Direction is a scalar argument of the batch functions: one call per value
+        scalar_columns = [i for i in self._vector_columns if self.params[i][1] == "direction"]
+        groups = {}
+        for row in range(count):
+            groups.setdefault(tuple(columns[i][row] for i in scalar_columns), []).append(row)
+        results = [None] * count
+        for key, rows in groups.items():
+            scalars = dict(zip(scalar_columns, key))
+            args = [scalars[i] if i in scalars else [columns[i][row] for row in rows]
+                    for i in self._vector_columns]
+            *values, valid = vector(*args)
+            for position, ok in enumerate(valid.tolist()):
+                if not ok:
+                    continue
+                if len(values) == 2:
+                    result = (_plain(values[0][position], True), _plain(values[1][position], True))
+                else:
+                    result = _plain(values[0][position])
+                results[rows[position]] = result
+        return results
+
+
+def _plain(value, range_bound=False):
+    # NumPy scalars / band tuples -> the Python values the scalar functions return
+    if isinstance(value, tuple):
+        return list(value)
+    if hasattr(value, "item"):
+        value = value.item()
+    if range_bound and isinstance(value, float) and value.is_integer():
+        return int(value)  # range tables hold integers except for a few .5 MHz edges
+    return value
+
+
+def _valid_numerology(numerology):
+    return 0 <= numerology <= 4
+
+def _valid_prb_input(numerology, bandwidth):
+    return 0 <= numerology <= 4 and bandwidth >= 1
+
+def _prbs_from_numerology(numerology, bandwidth):
+    return nrmod.get_nr_NumberOfPRBs(bandwidth, nrmod.get_NRsubcarrier_spacing_from_numerology(numerology))
+
+def _range_ignoring_direction(band, direction):
+    # Same behaviour as menu option 6: the band's default range is returned
+    return nrmod.get_nr_ArfcnRange_from_nr_Band(band, direction)
+
+
+OPERATIONS = {op.menu: op for op in (
+    Operation(NR5GMenu.ARFCN_TO_FREQ, "ARFCN ➡ Frequency", (("arfcn", "int"),),
+              nrmod.get_nr_Freq_from_nr_Arfcn, "get_nr_Freq_from_nr_Arfcn", "ENTER VALID NR-ARFCN (0 - 3279165)"),
+    Operation(NR5GMenu.FREQ_TO_ARFCN, "Frequency ➡ ARFCN", (("freq", "float"),),
+              nrmod.get_nr_Arfcn_from_nr_Freq, "get_nr_Arfcn_from_nr_Freq", "ENTER VALID NR-FREQ (410 - 71000 MHz)"),
+    Operation(NR5GMenu.FREQ_TO_BANDLIST, "Frequency ➡ Band List", (("freq", "float"),),
+              nrmod.get_nr_Bands_from_nr_Freq, "get_nr_Bands_from_nr_Freq", "ENTER VALID NR-FREQ (410 - 71000 MHz)"),
+    Operation(NR5GMenu.ARFCN_TO_BANDLIST, "ARFCN ➡ Band List", (("arfcn", "int"),),
+              nrmod.get_nr_Bands_from_nr_Arfcn, "get_nr_Bands_from_nr_Arfcn", "ENTER VALID NR-ARFCN (0 - 3279165)"),
+    Operation(NR5GMenu.BAND_TO_DUPLEX, "Band ➡ Duplex", (("band", "band"),),
+              nrmod.get_duplex_mode_from_nr_Band, "get_duplex_mode_from_nr_Band", "ENTER VALID NR BAND Values (n1 - n263)"),
+    Operation(NR5GMenu.BAND_TO_ARFCN_RANGE, "Band ➡ ARFCN Range", (("band", "band"), ("direction", "direction")),
+              _range_ignoring_direction, "get_nr_ArfcnRange_from_nr_Band", "ENTER VALID NR BAND Values (n1 - n263)",
+              vector_params=("band",)),
+    Operation(NR5GMenu.BAND_TO_FREQ_RANGE, "Band ➡ Frequency Range", (("band", "band"), ("direction", "direction")),
+              nrmod.get_nr_Freqrange_from_nr_Band, "get_nr_Freqrange_from_nr_Band", "ENTER VALID NR BAND Values (n1 - n263)"),
+    Operation(NR5GMenu.GSCN_TO_FREQ, "GSCN ➡ Frequency", (("gscn", "int"),),
+              nrmod.get_nr_Freq_from_nr_GSCN, "get_nr_Freq_from_nr_GSCN", "ENTER VALID GSCN (2 - 26639)"),
+    Operation(NR5GMenu.FREQ_TO_GSCN, "Frequency ➡ GSCN", (("freq", "float"),),
+              nrmod.get_nr_GSCN_from_nr_Freq, "get_nr_GSCN_from_nr_Freq", "ENTER VALID FREQUENCY (410 - 71000 MHz)"),
+    Operation(NR5GMenu.BAND_TO_GSCN_RANGE, "Band ➡ GSCN Range", (("band", "band"),),
+              nrmod.get_nr_GSCNRange_from_nr_Band, "get_nr_GSCNRange_from_nr_Band", "ENTER VALID BAND (n1 - n263)"),
+    Operation(NR5GMenu.NUMEROLOGY_TO_SCS, "Numerology ➡ SCS", (("numerology", "int"),),
+              nrmod.get_NRsubcarrier_spacing_from_numerology, "get_NRsubcarrier_spacing_from_numerology",
+              "ENTER VALID NUMEROLOGY (0 - 4)", valid=_valid_numerology),
+    Operation(NR5GMenu.PRB_CALCULATION, "PRB Calculation", (("numerology", "int"), ("bandwidth", "float")),
+              _prbs_from_numerology, "get_nr_NumberOfPRBs_from_numerology",
+              "ENTER VALID NUMEROLOGY (0 - 4) AND BANDWIDTH (MHz)", valid=_valid_prb_input),
+)}
+
+# Every parameter name used by any operation, in a stable order (CSV columns)
+PARAMETER_NAMES = list(dict.fromkeys(name for op in OPERATIONS.values() for name, _ in op.params))
+
+# One-shot CLI commands (nr5gCalculator.py arfcn2freq 620000); arguments in `params` order
+COMMANDS = {
+    "arfcn2freq": NR5GMenu.ARFCN_TO_FREQ,
+    "freq2arfcn": NR5GMenu.FREQ_TO_ARFCN,
+    "freq2bands": NR5GMenu.FREQ_TO_BANDLIST,
+    "arfcn2bands": NR5GMenu.ARFCN_TO_BANDLIST,
+    "band2duplex": NR5GMenu.BAND_TO_DUPLEX,
+    "band2arfcn": NR5GMenu.BAND_TO_ARFCN_RANGE,
+    "band2freq": NR5GMenu.BAND_TO_FREQ_RANGE,
+    "gscn2freq": NR5GMenu.GSCN_TO_FREQ,
+    "freq2gscn": NR5GMenu.FREQ_TO_GSCN,
+    "band2gscn": NR5GMenu.BAND_TO_GSCN_RANGE,
+    "num2scs": NR5GMenu.NUMEROLOGY_TO_SCS,
+    "prbs": NR5GMenu.PRB_CALCULATION,
+}
+
+
+def lookup_operation(op):
+    """Finds an operation by NR5GMenu name ('ARFCN_TO_FREQ') or number (1 / '1')"""
+    try:
+        if isinstance(op, str) and not op.strip().isdigit():
+            return OPERATIONS[NR5GMenu[op.strip().upper()]]
+        return OPERATIONS[NR5GMenu(int(op))]
+    except (KeyError, ValueError, TypeError):
+        raise ValueError(f"unknown operation: {op!r}") from None
+
+
+def command_usage(name):
+    """'arfcn2freq ARFCN' / 'band2freq BAND [DIRECTION]'"""
+    params = OPERATIONS[COMMANDS[name]].params
+    return " ".join([name] + [f"[{p.upper()}]" if p in OPTIONAL else p.upper() for p, _ in params])
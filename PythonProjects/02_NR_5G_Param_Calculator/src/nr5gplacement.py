@@ -0,0 +1,164 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : NR 5G Carrier Placement Optimizer                    ###
+###                 Every valid carrier (centre ARFCN, bandwidth, SCS)   ###
+###                 inside an operator's spectrum block, with SSB        ###
+###                 options, ranked by usable PRBs                       ###
+###  Created On   : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+"""
+
+import math
+import sys
+import numpy as np
+from nr5gtables import get_tables, NA
+from nr5gcache import normalize_band, normalize_direction
+from nr5gprb import NRB_TABLE
+from nr5graster import channel_raster_spans
+import nr5gbatch
+import nr5gssb
+
+# ---------------------- Result Type ----------------------
+
+class CarrierPlacement:
+    """
+    All placements of one (SCS, bandwidth) in a block. The centre ARFCNs are
+    every raster point whose channel fits; `ssb_positions` counts the usable
+    SSB positions per centre (None for bands without a sync raster).
+    """
+
+    def __init__(self, band, fr, scs, bandwidth, n_rb, arfcns, frequencies, ssb_positions):
+        self.band = band
+        self.fr = fr
+        self.scs = scs
+        self.bandwidth = bandwidth
+        self.n_rb = n_rb
+        self.arfcns = arfcns
+        self.frequencies = frequencies
+        self.ssb_positions = ssb_positions
+
+    @property
+    def count(self):
+        return len(self.arfcns)
+
+    @property
+    def occupied_mhz(self):
+        """Transmission bandwidth N_RB x 12 x SCS (MHz)"""
+        return self.n_rb * 12 * self.scs / 1000
+
+    def placements(self):
+        """Yields one dict per centre ARFCN"""
+        ssb = self.ssb_positions.tolist() if self.ssb_positions is not None else [None] * self.count
+        for arfcn, freq, positions in zip(self.arfcns.tolist(), self.frequencies.tolist(), ssb):
+            yield {"arfcn": arfcn, "freq": freq, "bandwidth": self.bandwidth, "scs": self.scs,
+                   "n_rb": self.n_rb, "ssb_positions": positions}
+
+    def __repr__(self):
+        return (f"CarrierPlacement({self.band} {self.bandwidth} MHz @ {self.scs} kHz: N_RB={self.n_rb}, "
+                f"{self.count} centres {self.arfcns[0] if self.count else '-'}..{self.arfcns[-1] if self.count else '-'})")
+
+# ---------------------- Interval Arithmetic ----------------------
+
+def _first_arfcn_at_or_above(tables, freq):
+    n = tables.nrarfcn(freq)
+    while tables.frequency(n) < freq - 1e-9:
+        n += 1
+    while n > 0 and tables.frequency(n - 1) >= freq - 1e-9:
+        n -= 1
+    return n
+
+def _last_arfcn_at_or_below(tables, freq):
+    n = tables.nrarfcn(freq)
+    while tables.frequency(n) > freq + 1e-9:
+        n -= 1
+    while tables.frequency(n + 1) <= freq + 1e-9:
+        n += 1
+    return n
+
+def _centre_arfcns(tables, spans, centre_low, centre_high):
+    """Raster points with centre_low <= F <= centre_high: one arithmetic progression per raster row"""
+    if centre_high < centre_low:
+        return np.empty(0, dtype=np.int64)
+    n_low = _first_arfcn_at_or_above(tables, centre_low)
+    n_high = _last_arfcn_at_or_below(tables, centre_high)
+    progressions = []
+    for first, step, last in spans:
+        start = first + max(0, math.ceil((n_low - first) / step)) * step
+        progressions.append(np.arange(start, min(n_high, last) + 1, step, dtype=np.int64))
+    return np.unique(np.concatenate(progressions)) if progressions else np.empty(0, dtype=np.int64)
+
+def _frequency_range_name(fr, low):
+    if fr == "FR1":
+        return "FR1"
+    return "FR2-2" if low >= nr5gssb.FR2_1_MAX_FREQ else "FR2-1"
+
+# ---------------------- Search ----------------------
+
+def find_carrier_placements(block_low, block_high, band, direction="", scs=None, bandwidths=None,
+                            require_ssb=True):
+    """
+    Ranked CarrierPlacement list for a spectrum block [block_low, block_high] MHz.
+
+    Candidate (SCS, bandwidth) pairs come from the 38.101 N_RB tables of the
+    band's frequency range; `scs` / `bandwidths` restrict them. For each pair
+    the admissible centre interval is [low + BW/2, high - BW/2] intersected
+    with the band, mapped to ARFCNs and snapped to the band's channel raster;
+    SSB positions are counted per centre by interval search over the sync
+    raster. With require_ssb, centres without a usable SSB position are
+    dropped (bands without a sync raster are not filtered). Ranked by N_RB,
+    then bandwidth, then number of centres. Raises ValueError for an
+    unknown band or a direction the band does not have.
+    """
+    tables = get_tables()
+    key = normalize_band(band)
+    direction = normalize_direction(direction)
+    band_low, band_high = tables.frequency_range(key, direction)
+    if NA in (band_low, band_high):
+        raise ValueError(f"{band!r} has no {direction or 'default'} direction.")
+    ul_low, _, dl_low, _, _, fr = tables.band_info[key]
+    uplink = direction == "ul" or (direction == "" and dl_low == NA)
+    low, high = max(block_low, band_low), min(block_high, band_high)
+    fr_name = _frequency_range_name(fr, band_low)
+    has_ssb = bool(tables.sync_raster.get(key))
+
+    results = []
+    for (table_fr, carrier_scs, bandwidth), n_rb in NRB_TABLE.items():
+        if table_fr != fr_name or bandwidth > high - low:
+            continue
+        if (scs is not None and carrier_scs not in np.atleast_1d(scs)) or \
+                (bandwidths is not None and bandwidth not in np.atleast_1d(bandwidths)):
+            continue
+        try:
+            spans = channel_raster_spans(key, carrier_scs, "ul" if uplink else "dl")
+        except ValueError:
+            continue  # no channel raster in this direction
+        arfcns = _centre_arfcns(tables, spans, low + bandwidth / 2, high - bandwidth / 2)
+        if not len(arfcns):
+            continue
+        frequencies, _ = nr5gbatch.get_nr_Freq_from_nr_Arfcn(arfcns)
+        ssb = nr5gssb.count_ssb_positions(frequencies, carrier_scs, key, n_rb) if has_ssb else None
+        if require_ssb and ssb is not None:
+            keep = ssb > 0
+            arfcns, frequencies, ssb = arfcns[keep], frequencies[keep], ssb[keep]
+            if not len(arfcns):
+                continue
+        results.append(CarrierPlacement(key, fr_name, carrier_scs, bandwidth, n_rb, arfcns, frequencies, ssb))
+
+    results.sort(key=lambda option: (-option.n_rb, -option.bandwidth, -option.count, option.scs))
+    return results
+
+
+if __name__ == "__main__":
+    # python nr5gplacement.py n78 3400 3500
+    if len(sys.argv) != 4:
+        print("Usage: python nr5gplacement.py BAND BLOCK_LOW_MHZ BLOCK_HIGH_MHZ")
+        sys.exit(2)
+    options = find_carrier_placements(float(sys.argv[2]), float(sys.argv[3]), sys.argv[1])
+    print(f"{'BW':>6} {'SCS':>4} {'N_RB':>5} {'Centres':>8}  {'ARFCN range':<18} {'SSB positions':>13}")
+    for option in options:
+        ssb = f"{option.ssb_positions.min()}-{option.ssb_positions.max()}" if option.ssb_positions is not None else "-"
+        print(f"{option.bandwidth:>6} {option.scs:>4} {option.n_rb:>5} {option.count:>8}  "
+              f"{option.arfcns[0]}-{option.arfcns[-1]:<10} {ssb:>13}")
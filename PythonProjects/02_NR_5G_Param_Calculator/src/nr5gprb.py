@@ -0,0 +1,83 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : NR 5G Maximum Transmission Bandwidth (N_RB) Tables   ###
+###                 38.101-1 / 38.101-2 Table 5.3.2-1 keyed by           ###
+###                 (FR, SCS, bandwidth), plus the legacy formula and a  ###
+###                 report of where the two differ                       ###
+###  Created On   : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+"""
+
+PRB_MODES = ("table", "formula")
+
+# Frequency ranges in lookup order when the caller does not name one
+FREQUENCY_RANGES = ("FR1", "FR2-1", "FR2-2")
+
+# {(FR, SCS kHz): {channel bandwidth MHz: N_RB}}
+_NRB = {
+    # 38.101-1 Table 5.3.2-1 (Rel-17)
+    ("FR1", 15): {5: 25, 10: 52, 15: 79, 20: 106, 25: 133, 30: 160, 35: 188, 40: 216, 45: 242, 50: 270},
+    ("FR1", 30): {5: 11, 10: 24, 15: 38, 20: 51, 25: 65, 30: 78, 35: 92, 40: 106, 45: 119, 50: 133,
+                  60: 162, 70: 189, 80: 217, 90: 245, 100: 273},
+    ("FR1", 60): {10: 11, 15: 18, 20: 24, 25: 31, 30: 38, 35: 44, 40: 51, 45: 58, 50: 65,
+                  60: 79, 70: 93, 80: 107, 90: 121, 100: 135},
+    # 38.101-2 Table 5.3.2-1, FR2-1 (24.25 - 52.6 GHz)
+    ("FR2-1", 60): {50: 66, 100: 132, 200: 264},
+    ("FR2-1", 120): {50: 32, 100: 66, 200: 132, 400: 264},
+    # 38.101-2 Table 5.3.2-1, FR2-2 (52.6 - 71 GHz)
+    ("FR2-2", 120): {100: 66, 400: 264},
+    ("FR2-2", 480): {400: 66, 800: 124, 1600: 248},
+    ("FR2-2", 960): {400: 33, 800: 62, 1600: 124, 2000: 148},
+}
+
+# Flat O(1) index: (FR, SCS, BW) -> N_RB, and (None, SCS, BW) -> first FR that defines it
+NRB_TABLE = {(fr, scs, bw): nrb for (fr, scs), column in _NRB.items() for bw, nrb in column.items()}
+for _fr in reversed(FREQUENCY_RANGES):
+    NRB_TABLE.update({(None, scs, bw): nrb for (fr, scs, bw), nrb in list(NRB_TABLE.items()) if fr == _fr})
+
+# ---------------------- Lookups ----------------------
+
+def get_nrb(channel_bw, scs, fr=None):
+    """N_RB from the 38.101 tables; raises ValueError for a combination they do not define"""
+    try:
+        return NRB_TABLE[fr, scs, channel_bw]
+    except (KeyError, TypeError):
+        raise ValueError(f"No N_RB entry for {channel_bw} MHz at {scs} kHz ({fr or 'any FR'}).") from None
+
+def formula_prbs(channel_bw, scs):
+    """Legacy estimate: int(BW / (12 x SCS)) - 4 guard RBs"""
+    return int(channel_bw * 1000 / scs / 12) - 4
+
+def number_of_prbs(channel_bw, scs, mode="table", fr=None):
+    """
+    PRB count in the given mode. 'table' uses N_RB where 38.101 defines the
+    combination and falls back to the formula elsewhere; 'formula' always
+    uses the formula.
+    """
+    if mode not in PRB_MODES:
+        raise ValueError(f"unknown PRB mode: {mode!r} (expected one of {', '.join(PRB_MODES)})")
+    if mode == "table":
+        nrb = NRB_TABLE.get((fr, scs, channel_bw))
+        if nrb is not None:
+            return nrb
+    return formula_prbs(channel_bw, scs)
+
+# ---------------------- Table vs. Formula ----------------------
+
+def formula_differences():
+    """(FR, SCS, BW, table N_RB, formula PRBs) for every table entry the formula gets wrong"""
+    return [(fr, scs, bw, nrb, formula_prbs(bw, scs))
+            for (fr, scs, bw), nrb in NRB_TABLE.items()
+            if fr is not None and formula_prbs(bw, scs) != nrb]
+
+
+if __name__ == "__main__":
+    differences = formula_differences()
+    entries = sum(1 for key in NRB_TABLE if key[0] is not None)
+    print(f"Formula differs from 38.101 N_RB in {len(differences)} of {entries} entries\n")
+    print(f"{'FR':<6} {'SCS':>4} {'BW':>5} {'N_RB':>5} {'Formula':>8} {'Diff':>5}")
+    for fr, scs, bw, nrb, estimate in differences:
+        print(f"{fr:<6} {scs:>4} {bw:>5} {nrb:>5} {estimate:>8} {estimate - nrb:>+5}")
@@ -0,0 +1,129 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : NR 5G Channel / Sync Raster Enumeration              ###
+###                 Every channel-raster ARFCN and every GSCN of a band  ###
+###                 (optionally per SCS) with the band's raster steps,   ###
+###                 streamed point by point or as NumPy chunks           ###
+###  Created On   : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+"""
+
+import heapq
+from nr5gtables import get_tables, NA
+from nr5gcache import normalize_band, normalize_direction
+
+# Points per NumPy chunk
+CHUNK_SIZE = 65536
+
+# ---------------------- Raster Spans ----------------------
+
+def _select_rows(rows, scs):
+    # Rows for this SCS (or the 100 kHz raster); bands with only a 15 kHz row use it for every SCS
+    if scs is None:
+        return list(rows)
+    return [row for row in rows if row[0] in (scs, 100)] or [row for row in rows if row[0] <= scs]
+
+def channel_raster_spans(band, scs=None, direction=""):
+    """
+    (first, step, last) ARFCN progressions of a band's channel raster (38.101
+    Table 5.4.2.3-1) for one SCS, or every row when scs is None. Direction ''
+    is DL, or UL for SUL bands. Raises ValueError for an unknown band or a
+    direction the band does not have.
+    """
+    key = normalize_band(band)
+    direction = normalize_direction(direction)
+    rows = get_tables().channel_raster.get(key)
+    if not rows or direction not in ("", "dl", "ul"):
+        raise ValueError(f"No channel raster for {band!r} {direction}.")
+    uplink = direction == "ul" or (direction == "" and rows[0][4] == NA)
+    spans = [(ul_first, ul_step, ul_last) if uplink else (dl_first, dl_step, dl_last)
+             for _, ul_first, ul_step, ul_last, dl_first, dl_step, dl_last in _select_rows(rows, scs)]
+    spans = [span for span in spans if NA not in span]
+    if not spans:
+        raise ValueError(f"No {direction or 'default'} channel raster for {band!r}.")
+    return spans
+
+def sync_raster_spans(band, scs=None):
+    """
+    (first, step, last) GSCN progressions of a band's sync raster (38.101
+    Table 5.4.3.3-1) for one SSB SCS, or every row when scs is None; rows that
+    list explicit GSCNs (n263) give one single-point span per GSCN. Raises
+    ValueError for a band without a sync raster (SUL) or without that SCS.
+    """
+    key = normalize_band(band)
+    rows = [row for row in get_tables().sync_raster.get(key, ()) if scs is None or row[0] == scs]
+    if not rows:
+        raise ValueError(f"No sync raster for {band!r}{f' at {scs} kHz' if scs else ''}.")
+    spans = []
+    for _, _, first, step, last, listed in rows:
+        spans.extend([(first, step, last)] if first and last else [(gscn, 1, gscn) for gscn in listed])
+    return spans
+
+# ---------------------- Enumeration ----------------------
+
+def iter_raster_points(spans):
+    """Lazily yields the union of the progressions in ascending order, each point once"""
+    previous = None
+    for point in heapq.merge(*(range(first, last + 1, step) for first, step, last in spans)):
+        if point != previous:
+            yield point
+            previous = point
+
+def raster_point_chunks(spans, chunk_size=CHUNK_SIZE):
+    """
+    Iterator over the same points as iter_raster_points, as int64 NumPy
+    arrays of chunk_size points (the last may be shorter). The value axis is walked in
+    windows of chunk_size x the smallest step; each window is one np.arange
+    per progression, merged with np.unique when progressions overlap.
+    """
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("chunk size must be a positive integer")
+    return _chunks(spans, chunk_size)
+
+def _chunks(spans, chunk_size):
+    import numpy as np
+    low = min(first for first, _, _ in spans)
+    high = max(last for _, _, last in spans)
+    width = chunk_size * min(step for _, step, _ in spans)
+    pending = np.empty(0, dtype=np.int64)
+    for start in range(low, high + 1, width):
+        end = min(start + width, high + 1)
+        parts = []
+        for first, step, last in spans:
+            begin = first + max(0, -(-(start - first) // step)) * step
+            if begin < min(end, last + 1):
+                parts.append(np.arange(begin, min(end, last + 1), step, dtype=np.int64))
+        if not parts:
+            continue
+        block = parts[0] if len(parts) == 1 else np.unique(np.concatenate(parts))
+        pending = np.concatenate([pending, block]) if len(pending) else block
+        while len(pending) >= chunk_size:
+            yield pending[:chunk_size]
+            pending = pending[chunk_size:]
+    if len(pending):
+        yield pending
+
+def raster_point_count(spans):
+    """Number of distinct points; exact without enumerating when the progressions do not overlap"""
+    ordered = sorted(spans)
+    if all(last < next_first for (_, _, last), (next_first, _, _) in zip(ordered, ordered[1:])):
+        return sum((last - first) // step + 1 for first, step, last in spans)
+    return sum(len(chunk) for chunk in raster_point_chunks(spans))
+
+# ---------------------- Several Bands ----------------------
+
+def band_raster_chunks(bands, kind="arfcn", scs=None, direction="", chunk_size=CHUNK_SIZE):
+    """
+    Yields (band, chunk) for each band in turn; kind is 'arfcn' (channel
+    raster) or 'gscn' (sync raster). Bands without that raster are skipped.
+    """
+    for band in bands:
+        try:
+            spans = channel_raster_spans(band, scs, direction) if kind == "arfcn" else sync_raster_spans(band, scs)
+        except ValueError:
+            continue
+        for chunk in raster_point_chunks(spans, chunk_size):
+            yield normalize_band(band), chunk
@@ -0,0 +1,141 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : NR 5G Calculator Server                              ###
+###                 Long-running process answering NR5GMenu operations   ###
+###                 as JSON lines over a Unix socket or localhost TCP.   ###
+###                 Pipelined requests are evaluated together            ###
+###  Created On   : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+from nr5gclient import parse_address
+from nr5gbatchmode import evaluate_chunk, audit_entries
+from nr5gtables import get_tables
+import nr5gcache
+
+RECV_SIZE = 65536
+
+# A request line longer than this closes the connection
+MAX_LINE_BYTES = 1 << 20
+
+# ---------------------- Protocol ----------------------
+
+def _decode(line):
+    try:
+        request = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        return {"_error": f"invalid JSON ({exc})"}
+    if not isinstance(request, dict):
+        return {"_error": "expected a JSON object"}
+    return request
+
+def answer(lines, audit=None):
+    """
+    Evaluates a group of request lines (bytes) and returns the response bytes,
+    one JSON line per request, in order. Requests may carry an "id", echoed back.
+    Results are queued on `audit` (an nr5gaudit.AuditLog) if given; the disk
+    write happens on its writer thread.
+    """
+    requests = [_decode(line) for line in lines]
+    outcomes = evaluate_chunk(requests)
+    if audit is not None:
+        audit.write_many(audit_entries(requests, outcomes))
+    out = []
+    for request, (result, error) in zip(requests, outcomes):
+        response = {"id": request["id"]} if "id" in request else {}
+        response.update({"error": error} if error else {"result": result})
+        out.append(json.dumps(response, ensure_ascii=False).encode())
+    return b"\n".join(out) + b"\n"
+
+# ---------------------- Connection Handling ----------------------
+
+class _Handler(socketserver.BaseRequestHandler):
+    def setup(self):
+        if self.request.family == socket.AF_INET:
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        pending = b""
+        while True:
+            data = self.request.recv(RECV_SIZE)
+            if not data:
+                return
+            pending += data
+            # Every complete line received so far is answered as one group
+            *lines, pending = pending.split(b"\n")
+            if len(pending) > MAX_LINE_BYTES:
+                return
+            lines = [line for line in lines if line.strip()]
+            if lines:
+                self.request.sendall(answer(lines, self.server.audit))
+                self.server.requests += len(lines)
+
+
+class _ServerMixin:
+    daemon_threads = True
+    allow_reuse_address = True
+    requests = 0
+    audit = None  # nr5gaudit.AuditLog for per-request results
+
+
+class UnixCalculatorServer(_ServerMixin, socketserver.ThreadingUnixStreamServer):
+    """Calculator server on a Unix domain socket path"""
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)  # stale socket from an earlier run
+        super().server_bind()
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+class TCPCalculatorServer(_ServerMixin, socketserver.ThreadingTCPServer):
+    """Calculator server on a localhost TCP port"""
+
+# ---------------------- Server Lifecycle ----------------------
+
+def warm_up():
+    """Loads the tables, band cache and batch arrays before the first request arrives"""
+    get_tables()
+    nr5gcache.warm_up()
+    evaluate_chunk([{"op": "ARFCN_TO_FREQ", "arfcn": 620000}, {"op": "BAND_TO_DUPLEX", "band": "n78"}])
+
+def make_server(address, audit=None):
+    """Creates a warmed-up server bound to a socket path or 'host:port' (port 0 = any free port)"""
+    family, target = parse_address(address)
+    warm_up()
+    server_class = UnixCalculatorServer if family == socket.AF_UNIX else TCPCalculatorServer
+    server = server_class(target, _Handler)
+    server.audit = audit
+    return server
+
+def start_in_thread(address, audit=None):
+    """Starts a server on a background thread; returns it (call shutdown() and server_close())"""
+    server = make_server(address, audit)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def serve(address, audit=None):
+    """Runs the server until interrupted"""
+    with make_server(address, audit) as server:
+        bound = server.server_address
+        logging.info(f"Server listening on {bound}")
+        print(f"📡 5G NR Calculator server listening on {bound} (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        logging.info(f"Server stopped after {server.requests} requests")
+        print(f"✅ Server stopped after {server.requests} requests")
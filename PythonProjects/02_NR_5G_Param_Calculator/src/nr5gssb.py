@@ -0,0 +1,171 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : NR 5G SSB / Sync Raster Planner                      ###
+###                 For a carrier (centre, bandwidth, SCS) lists every   ###
+###                 GSCN whose SS/PBCH block fits inside it, with k_SSB  ###
+###                 and offsetToPointA; vectorized over GSCNs and        ###
+###                 carriers                                             ###
+###  Created On   : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+"""
+
+import numpy as np
+from functools import lru_cache
+from nr5gtables import get_tables
+from nr5gcache import normalize_band
+import nr5gbatch
+
+SSB_SUBCARRIERS = 240      # 20 RBs; SS_REF is the centre of subcarrier 120 (38.211 7.4.3.1)
+FR1_MAX_FREQ = 7125        # MHz; above this offsetToPointA / k_SSB use FR2 units
+FR2_1_MAX_FREQ = 52600     # MHz; FR2-2 above (N_RB tables only)
+
+# Carriers evaluated together; each chunk holds chunk x GSCN-count booleans
+CARRIER_CHUNK = 4096
+
+PLAN_FIELDS = ("carrier", "gscn", "freq", "ssb_scs", "k_ssb", "offset_to_point_a")
+
+# ---------------------- Sync Raster Candidates ----------------------
+
+@lru_cache(maxsize=None)
+def _band_candidates(band):
+    """Every sync raster entry of a band as arrays: GSCN, SS_REF (Hz), SSB SCS (kHz)"""
+    rows = get_tables().sync_raster.get(band)
+    if not rows:
+        raise ValueError(f"No sync raster for {band!r}.")
+    gscns, scs = [], []
+    for ssb_scs, pattern, first, step, last, note in rows:
+        values = np.array(note, dtype=np.int64) if not (first and last) else np.arange(first, last + 1, step)
+        gscns.append(values)
+        scs.append(np.full(len(values), ssb_scs, dtype=np.int64))
+    # Rows may overlap (n79 lists a 16-step and a 1-step raster): keep each (GSCN, SCS) once
+    pairs = np.unique(np.stack([np.concatenate(gscns), np.concatenate(scs)], axis=1), axis=0)
+    gscn, scs = pairs[:, 0], pairs[:, 1]
+    freq, _ = nr5gbatch.get_nr_Freq_from_nr_GSCN(gscn)
+    return gscn, np.rint(freq * 1e6).astype(np.int64), scs
+
+# ---------------------- Planner ----------------------
+
+def _carrier_prbs(channel_bw, scs, center_hz):
+    # 38.101 N_RB of the frequency range each carrier sits in
+    prbs = np.zeros(len(center_hz), dtype=np.int64)
+    fr = np.searchsorted([FR1_MAX_FREQ * 1_000_000, FR2_1_MAX_FREQ * 1_000_000], center_hz)
+    for index, name in enumerate(("FR1", "FR2-1", "FR2-2")):
+        rows = fr == index
+        if rows.any():
+            values, valid = nr5gbatch.get_nr_NumberOfPRBs(channel_bw[rows], scs[rows], fr=name)
+            prbs[rows] = np.where(valid, values, 0)
+    return prbs
+
+def _plan_band(band, center_hz, scs_khz, n_rb, carrier_index):
+    gscn, ss_ref, ssb_scs = _band_candidates(band)
+    ssb_scs_hz = ssb_scs * 1000
+    half = SSB_SUBCARRIERS // 2
+    ssb_sc0 = ss_ref - half * ssb_scs_hz                          # centre of SSB subcarrier 0
+    ssb_low = ssb_sc0 - ssb_scs_hz // 2                           # lower edge of subcarrier 0
+    ssb_high = ss_ref + (half - 1) * ssb_scs_hz + ssb_scs_hz // 2 # upper edge of subcarrier 239
+
+    out = {field: [] for field in PLAN_FIELDS}
+    for start in range(0, len(center_hz), CARRIER_CHUNK):
+        part = slice(start, start + CARRIER_CHUNK)
+        fc, scs_hz, rbs = center_hz[part, None], scs_khz[part, None] * 1000, n_rb[part, None]
+        fr2 = fc > FR1_MAX_FREQ * 1_000_000
+        point_a = fc - 6 * rbs * scs_hz                       # 38.104 5.4.2.2: Fc is RE 6*N_RB of the grid
+        crb_hz = 12 * scs_hz
+        k_unit = np.where(fr2, scs_hz, 15_000)                 # k_SSB: 15 kHz (FR1) / common SCS (FR2)
+        rb_unit = np.where(fr2, 12 * 60_000, 12 * 15_000)      # offsetToPointA: 15 / 60 kHz RBs
+
+        delta = ssb_sc0[None, :] - point_a
+        n_crb = np.floor_divide(delta, crb_hz)
+        remainder = delta - n_crb * crb_hz
+        fits = ((rbs > 0) & (ssb_low[None, :] >= point_a - scs_hz // 2)
+                & (ssb_high[None, :] <= point_a + (12 * rbs) * scs_hz - scs_hz // 2)
+                & (remainder % k_unit == 0))
+        rows, cols = np.nonzero(fits)
+        out["carrier"].append(carrier_index[part][rows])
+        out["gscn"].append(gscn[cols])
+        out["freq"].append(ss_ref[cols] / 1e6)
+        out["ssb_scs"].append(ssb_scs[cols])
+        out["k_ssb"].append((remainder // k_unit)[rows, cols])
+        out["offset_to_point_a"].append((n_crb * crb_hz // rb_unit)[rows, cols])
+    return out
+
+def plan_ssb_batch(center_freq, channel_bw, scs, band, n_rb=None):
+    """
+    SSB positions for many carriers at once.
+
+    center_freq (MHz), channel_bw (MHz), scs (kHz) and band are array-likes of
+    the same length (band may also be a single band for every carrier). N_RB
+    defaults to the 38.101 table value for the carrier's frequency range;
+    pass n_rb to plan a specific grid.
+    Returns a dict of flat arrays (PLAN_FIELDS), one entry per fitting GSCN,
+    ordered by carrier then GSCN; carriers whose band has no sync raster get
+    no entries.
+    """
+    center_hz = np.rint(np.atleast_1d(np.asarray(center_freq, dtype=np.float64)) * 1e6).astype(np.int64)
+    count = len(center_hz)
+    scs_khz = np.broadcast_to(np.asarray(scs, dtype=np.int64), (count,))
+    if n_rb is None:
+        n_rb = _carrier_prbs(np.broadcast_to(np.asarray(channel_bw, dtype=np.float64), (count,)), scs_khz, center_hz)
+    n_rb = np.broadcast_to(np.asarray(n_rb, dtype=np.int64), (count,))
+    bands = np.broadcast_to(np.asarray(band, dtype=object), (count,))
+
+    parts = {field: [] for field in PLAN_FIELDS}
+    for raw_band in dict.fromkeys(bands.tolist()):
+        try:
+            key = normalize_band(raw_band)
+            _band_candidates(key)
+        except ValueError:
+            continue
+        rows = np.flatnonzero(bands == raw_band)
+        for field, values in _plan_band(key, center_hz[rows], scs_khz[rows], n_rb[rows], rows).items():
+            parts[field].extend(values)
+
+    plan = {field: np.concatenate(values) if values else np.empty(0, dtype=np.float64 if field == "freq" else np.int64)
+            for field, values in parts.items()}
+    order = np.lexsort((plan["gscn"], plan["carrier"]))
+    return {field: values[order] for field, values in plan.items()}
+
+def plan_ssb(center_freq, channel_bw, scs, band, n_rb=None):
+    """
+    SSB positions for one carrier: list of dicts (gscn, freq, ssb_scs, k_ssb,
+    offset_to_point_a). Raises ValueError if the band has no sync raster.
+    """
+    _band_candidates(normalize_band(band))
+    plan = plan_ssb_batch([center_freq], channel_bw, scs, band, n_rb)
+    fields = PLAN_FIELDS[1:]
+    return [dict(zip(fields, values)) for values in zip(*(plan[field].tolist() for field in fields))]
+
+def count_ssb_positions(center_freq, scs, band, n_rb):
+    """
+    Number of SSB positions plan_ssb_batch would list, per carrier, without
+    building the carriers x GSCNs matrix: for each SSB SCS and alignment
+    residue the fitting SS_REF interval is located with two binary searches.
+    """
+    gscn, ss_ref, ssb_scs = _band_candidates(normalize_band(band))
+    center_hz = np.rint(np.atleast_1d(np.asarray(center_freq, dtype=np.float64)) * 1e6).astype(np.int64)
+    scs_hz = np.broadcast_to(np.asarray(scs, dtype=np.int64), center_hz.shape) * 1000
+    n_rb = np.broadcast_to(np.asarray(n_rb, dtype=np.int64), center_hz.shape)
+    point_a = center_hz - 6 * n_rb * scs_hz
+    grid_low = point_a - scs_hz // 2
+    grid_high = point_a + 12 * n_rb * scs_hz - scs_hz // 2
+    k_unit = np.where(center_hz > FR1_MAX_FREQ * 1_000_000, scs_hz, 15_000)
+    half = SSB_SUBCARRIERS // 2
+
+    counts = np.zeros(center_hz.shape, dtype=np.int64)
+    for ssb in np.unique(ssb_scs):
+        ssb_hz = int(ssb) * 1000
+        refs = ss_ref[ssb_scs == ssb]
+        lowest = grid_low + half * ssb_hz + ssb_hz // 2           # smallest SS_REF that fits
+        highest = grid_high - (half - 1) * ssb_hz - ssb_hz // 2   # largest SS_REF that fits
+        for unit in np.unique(k_unit):
+            residues = (refs - half * ssb_hz) % unit              # SSB subcarrier 0 vs. the k_SSB grid
+            for residue in np.unique(residues):
+                aligned = np.sort(refs[residues == residue])
+                rows = (k_unit == unit) & (n_rb > 0) & (point_a % unit == residue)
+                found = (np.searchsorted(aligned, highest[rows], side="right")
+                         - np.searchsorted(aligned, lowest[rows], side="left"))
+                counts[rows] += np.maximum(found, 0)
+    return counts
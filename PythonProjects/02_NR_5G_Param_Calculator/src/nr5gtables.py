@@ -0,0 +1,520 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : NR 5G Raster & Band Lookup Tables                    ###
+###                 Loads the 38.104 global raster, sync raster and band ###
+###                 tables once into sorted arrays for bisect lookups;   ###
+###                 a prebuilt binary table file is memory-mapped so     ###
+###                 nrarfcn is only imported as a fallback               ###
+###  Created On   : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+"""
+
+import math
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from functools import lru_cache
+
+DEFAULT_RELEASE = 17
+MAX_NRARFCN = 3279165
+MIN_GSCN = 2
+MAX_GSCN = 26639
+MAX_FREQ = 100000
+NA = "N/A"
+
+# ---------------------- Table Engine ----------------------
+
+class NRRasterTables:
+    """
+    Table-driven replacement for the per-call nrarfcn API.
+
+    Raster rows are kept sorted by their upper bound so a conversion is a
+    single bisect. Band membership is precomputed per elementary frequency
+    segment (every band edge, and every gap between two edges), so a
+    frequency -> band list query is one bisect plus a tuple copy. Band-level
+    answers (duplex, ARFCN/frequency/GSCN ranges) are precomputed per band.
+    Results and error cases match nrarfcn exactly (see validate_against_nrarfcn).
+    """
+
+    def __init__(self, raw, segments=None):
+        # raw = {table_id: list of rows}, as produced by load_raw_tables();
+        # segments = (band_edges, point_bands, gap_bands) restored from the table file
+        self.raw = raw
+
+        # Global frequency raster (38.104 Table 5.4.2.1-1)
+        self.arfcn_rows = [tuple(row) for row in raw["freq_nrarfcn"]]
+        self._arfcn_n_max = [row[6] for row in self.arfcn_rows]
+        self._arfcn_f_max = [row[1] for row in self.arfcn_rows]
+
+        # Global synchronization raster (38.104 Table 5.4.3.1-1)
+        self.gscn_rows = [tuple(row) for row in raw["gscn_parameters"]]
+        self._gscn_max = [row[12] for row in self.gscn_rows]
+        self._gscn_f_max = [row[1] for row in self.gscn_rows]
+
+        # Band definitions, channel raster and sync raster per band
+        self.band_info = {}
+        self.channel_raster = {}
+        self.sync_raster = {}
+        for fr, key in (("FR1", "bands_fr1"), ("FR2", "bands_fr2")):
+            for band, ul_low, ul_high, dl_low, dl_high, duplex in raw[key]:
+                self.band_info[band] = (ul_low, ul_high, dl_low, dl_high, duplex, fr)
+        for key in ("applicable_nrarfcn_fr1", "applicable_nrarfcn_fr2"):
+            for row in raw[key]:
+                self.channel_raster.setdefault(row[0], []).append(tuple(row[1:]))
+        for key in ("applicable_ss_raster_fr1", "applicable_ss_raster_fr2"):
+            for band, scs, pattern, first, step, last, note in raw[key]:
+                self.sync_raster.setdefault(band, []).append((scs, pattern, first, step, last, tuple(sorted(note))))
+
+        if segments is None:
+            self._build_band_segments()
+        else:
+            self.band_edges, self.point_bands, self.gap_bands = segments
+        self._build_band_answers()
+
+    # ---------- Raster conversions ----------
+
+    def frequency(self, nrarfcn):
+        """NR-ARFCN -> frequency (MHz)"""
+        if not isinstance(nrarfcn, int):
+            raise ValueError("NR-ARFCN must be an integer.")
+        if nrarfcn < 0 or nrarfcn > MAX_NRARFCN:
+            raise ValueError("NR-ARFCN must be between 0 and 3,279,165.")
+        f_min, f_max, delta_f, f_offset, n_offset, n_min, n_max = self.arfcn_rows[bisect_left(self._arfcn_n_max, nrarfcn)]
+        return round((int(f_offset * 1000) + delta_f * (nrarfcn - n_offset)) / 1000, 3)
+
+    def nrarfcn(self, frequency):
+        """Frequency (MHz) -> NR-ARFCN"""
+        if not isinstance(frequency, (float, int)):
+            raise ValueError("Frequency must be a float or an integer.")
+        if frequency < 0 or frequency > MAX_FREQ:
+            raise ValueError("Frequency must be between 0 and 100,000 (MHz).")
+        f_min, f_max, delta_f, f_offset, n_offset, n_min, n_max = self.arfcn_rows[bisect_left(self._arfcn_f_max, frequency)]
+        return min(round(n_offset + (frequency - f_offset) * 1000. / delta_f), MAX_NRARFCN)
+
+    def frequency_by_gscn(self, gscn):
+        """GSCN -> SS block frequency (MHz)"""
+        if not isinstance(gscn, int):
+            raise ValueError("GSCN must be an integer")
+        if gscn < MIN_GSCN or gscn > MAX_GSCN:
+            raise ValueError("GSCN must be between 2 and 26639")
+        row = self.gscn_rows[bisect_left(self._gscn_max, gscn)]
+        f_min, f_max, n_min, n_max, m_set, f_offs, n_coeff, m_coeff, g_offs, g_n_coeff, g_m_coeff, _, _ = row
+        if not m_set:
+            return round(f_offs + n_coeff * (gscn - g_offs), 3)
+        if gscn % 3 == 0:
+            n, m = gscn // g_n_coeff, 3
+        elif gscn % 3 == 1:
+            n, m = gscn // g_n_coeff, 5
+        else:
+            n, m = (gscn + 1) // g_n_coeff, 1
+        return round(f_offs + n_coeff * n + m_coeff * m, 3)
+
+    def gscn_by_frequency(self, frequency):
+        """Frequency (MHz) -> nearest GSCN"""
+        if not isinstance(frequency, (float, int)):
+            raise ValueError("Frequency must be a float or an integer")
+        if frequency < 0 or frequency > MAX_FREQ:
+            raise ValueError("Frequency must be between 0 and 100,000 (MHz)")
+        row = self.gscn_rows[bisect_left(self._gscn_f_max, frequency)]
+        f_min, f_max, n_min, n_max, m_set, f_offs, n_coeff, m_coeff, g_offs, g_n_coeff, g_m_coeff, _, _ = row
+        if not m_set:
+            return int(g_offs + round((frequency - f_offs) / n_coeff))
+        n = round((frequency - m_coeff * sum(m_set) / len(m_set)) / n_coeff)
+        m = min((abs(frequency - (n * n_coeff + candidate * m_coeff)), candidate) for candidate in m_set)[1]
+        return int(g_offs + n * g_n_coeff + m * g_m_coeff)
+
+    # ---------- Band lookups ----------
+
+    def bands_by_frequency(self, frequency):
+        """Frequency (MHz) -> NR bands (FR1 table order, then FR2)"""
+        if not isinstance(frequency, (float, int)):
+            raise ValueError("Frequency must be a float or an integer.")
+        if frequency < 0 or frequency > MAX_FREQ:
+            raise ValueError("Frequency must be between 0 and 100,000 (MHz).")
+        return list(self._segment_bands(frequency))
+
+    def bands_by_nrarfcn(self, nrarfcn):
+        """NR-ARFCN -> NR bands"""
+        return list(self._segment_bands(self.frequency(nrarfcn)))
+
+    def duplex_mode(self, band):
+        return self._answer(self._duplex, band)
+
+    def nrarfcn_range(self, band, direction=""):
+        return self._answer(self._arfcn_range, (band, direction))
+
+    def frequency_range(self, band, direction=""):
+        return self._answer(self._freq_range, (band, direction))
+
+    def gscn_range(self, band):
+        return self._answer(self._gscn_range, band)
+
+    @property
+    def bands(self):
+        """All defined bands, FR1 table order then FR2"""
+        return list(self.band_info)
+
+    # ---------- Precomputation ----------
+
+    def _band_intervals(self):
+        # Intervals that make a frequency belong to a band, in nrarfcn's order
+        for band, (ul_low, ul_high, dl_low, dl_high, duplex, fr) in self.band_info.items():
+            if fr == "FR2":
+                yield band, [(ul_low, ul_high)] if ul_low else []
+            else:
+                yield band, [(low, high) for low, high in ((ul_low, ul_high), (dl_low, dl_high))
+                             if not isinstance(low, str) and not isinstance(high, str)]
+
+    def _build_band_segments(self):
+        intervals = list(self._band_intervals())
+        self.band_edges = sorted({edge for _, spans in intervals for span in spans for edge in span})
+
+        def members(frequency):
+            return tuple(band for band, spans in intervals if any(low <= frequency <= high for low, high in spans))
+
+        # point_bands[i]: bands at exactly band_edges[i];
+        # gap_bands[i]:   bands strictly between band_edges[i] and band_edges[i + 1]
+        self.point_bands = [members(edge) for edge in self.band_edges]
+        self.gap_bands = [members((low + high) / 2) for low, high in zip(self.band_edges, self.band_edges[1:])]
+
+    def _segment_bands(self, frequency):
+        index = bisect_left(self.band_edges, frequency)
+        if index < len(self.band_edges) and self.band_edges[index] == frequency:
+            return self.point_bands[index]
+        if index == 0 or index == len(self.band_edges):
+            return ()
+        return self.gap_bands[index - 1]
+
+    def _build_band_answers(self):
+        self._duplex = {band: info[4] for band, info in self.band_info.items()}
+        self._freq_range, self._arfcn_range, self._gscn_range = {}, {}, {}
+        for direction in ("", "dl", "ul"):
+            for band, (ul_low, ul_high, dl_low, dl_high, _, _) in self.band_info.items():
+                if (direction == "" and dl_low == NA) or direction == "ul":
+                    self._freq_range[band, direction] = (ul_low, ul_high)
+                else:
+                    self._freq_range[band, direction] = (dl_low, dl_high)
+            for band, rows in self.channel_raster.items():
+                spans = []
+                for f_raster, ul_first, ul_step, ul_last, dl_first, dl_step, dl_last in rows:
+                    if (direction == "" and dl_first == NA) or direction == "ul":
+                        spans.append((ul_first, ul_last))
+                    else:
+                        spans.append((dl_first, dl_last))
+                try:
+                    self._arfcn_range[band, direction] = (min(spans, key=lambda x: x[0])[0],
+                                                          max(spans, key=lambda x: x[1])[1])
+                except TypeError:
+                    pass  # 'N/A' mixed with numbers; nrarfcn raises here as well
+        for band, rows in self.sync_raster.items():
+            spans = [(first, last) if first and last else (min(note), max(note))
+                     for scs, pattern, first, step, last, note in rows]
+            self._gscn_range[band] = (min(spans, key=lambda x: x[0])[0], max(spans, key=lambda x: x[1])[1])
+
+    @staticmethod
+    def _answer(answers, key):
+        try:
+            return answers[key]
+        except (KeyError, TypeError):
+            raise ValueError(f"No table entry for {key!r}.") from None
+
+# ---------------------- Loading ----------------------
+
+TABLE_IDS = (
+    "freq_nrarfcn", "gscn_parameters", "bands_fr1", "bands_fr2",
+    "applicable_nrarfcn_fr1", "applicable_nrarfcn_fr2",
+    "applicable_ss_raster_fr1", "applicable_ss_raster_fr2",
+)
+
+
+def load_raw_tables(release_3gpp=DEFAULT_RELEASE):
+    """Reads the 3GPP tables shipped with nrarfcn as plain lists of rows"""
+    from nrarfcn.tables import get_table
+    return {table_id: [list(row) for row in get_table(table_id, release_3gpp).data] for table_id in TABLE_IDS}
+
+
+@lru_cache(maxsize=None)
+def get_tables(release_3gpp=DEFAULT_RELEASE):
+    """Loads the lookup tables once per release: table file first, nrarfcn as fallback"""
+    try:
+        return load_table_file(TABLE_FILE, release_3gpp)
+    except (OSError, ValueError):
+        return NRRasterTables(load_raw_tables(release_3gpp))
+
+# ---------------------- Binary Table File ----------------------
+
+# Set NR5G_TABLE_FILE to another path (or a missing one, to force the nrarfcn fallback)
+TABLE_FILE = os.environ.get("NR5G_TABLE_FILE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "nr5gtables.bin"))
+
+TABLE_MAGIC = b"NR5GTBL\0"
+TABLE_FILE_VERSION = 1
+_HEADER = struct.Struct("<8sHHH")     # magic, file version, 3GPP release, section count
+_SECTION = struct.Struct("<24sII")    # section name, byte offset, byte length
+
+# Column kinds per table, one float64 cell each:
+# n = number ('N/A' stored as NaN), s = index into the string pool, m = offset into the set pool
+TABLE_SCHEMAS = {
+    "freq_nrarfcn": "nnnnnnn",
+    "gscn_parameters": "nnnnmnnnnnnnn",
+    "bands_fr1": "snnnns",
+    "bands_fr2": "snnnns",
+    "applicable_nrarfcn_fr1": "snnnnnnn",
+    "applicable_nrarfcn_fr2": "snnnnnnn",
+    "applicable_ss_raster_fr1": "snsnnnm",
+    "applicable_ss_raster_fr2": "snsnnnm",
+}
+
+
+def _encode_tables(tables, release_3gpp):
+    strings, sets = {}, []
+
+    def cell(kind, value):
+        if kind == "s":
+            return strings.setdefault(value, len(strings))
+        if kind == "m":
+            sets.extend((len(value), *sorted(value)))
+            return len(sets) - len(value) - 1
+        return math.nan if value == NA else value
+
+    sections = {}
+    for table_id, schema in TABLE_SCHEMAS.items():
+        cells = [cell(kind, value) for row in tables.raw[table_id] for kind, value in zip(schema, row)]
+        sections[table_id] = struct.pack(f"<{len(cells)}d", *cells)
+
+    # Band segments: every point set, then every gap set, as string indices
+    offsets, members = [0], []
+    for bands in tables.point_bands + tables.gap_bands:
+        members.extend(strings.setdefault(band, len(strings)) for band in bands)
+        offsets.append(len(members))
+    sections["band_edges"] = struct.pack(f"<{len(tables.band_edges)}d", *tables.band_edges)
+    sections["segment_offsets"] = struct.pack(f"<{len(offsets)}I", *offsets)
+    sections["segment_bands"] = struct.pack(f"<{len(members)}H", *members)
+    sections["sets"] = struct.pack(f"<{len(sets)}i", *sets)
+    sections["strings"] = "\0".join(strings).encode()
+
+    directory_size = _HEADER.size + _SECTION.size * len(sections)
+    header, payload = [_HEADER.pack(TABLE_MAGIC, TABLE_FILE_VERSION, release_3gpp, len(sections))], []
+    offset = directory_size
+    for name, data in sections.items():
+        header.append(_SECTION.pack(name.encode(), offset, len(data)))
+        payload.append(data)
+        offset += len(data)
+    return b"".join(header + payload)
+
+
+def _read_sections(buffer, release_3gpp):
+    # {section name: copied-out values}; every view into the buffer is released before returning
+    magic, version, release, count = _HEADER.unpack_from(buffer, 0)
+    if magic != TABLE_MAGIC or version != TABLE_FILE_VERSION or release != release_3gpp:
+        raise ValueError(f"Table file is not version {TABLE_FILE_VERSION} / Rel-{release_3gpp}.")
+    formats = {"strings": None, "sets": "i", "segment_offsets": "I", "segment_bands": "H"}
+    sections = {}
+    with memoryview(buffer) as view:
+        for index in range(count):
+            name, offset, length = _SECTION.unpack_from(buffer, _HEADER.size + index * _SECTION.size)
+            name = name.rstrip(b"\0").decode()
+            with view[offset:offset + length] as data:
+                fmt = formats.get(name, "d")
+                sections[name] = data.tobytes().decode() if fmt is None else data.cast(fmt).tolist()
+    return sections
+
+
+def _number(cell):
+    # nrarfcn has no integral floats, so integral cells are the table's ints
+    return int(cell) if cell.is_integer() else cell
+
+
+def _decode_tables(buffer, release_3gpp):
+    sections = _read_sections(buffer, release_3gpp)
+    strings = sections["strings"].split("\0")
+    sets = sections["sets"]
+
+    def value(kind, cell):
+        if kind == "s":
+            return strings[int(cell)]
+        if kind == "m":
+            start = int(cell)
+            members = sets[start + 1:start + 1 + sets[start]]
+            return set(members) if members else {}   # nrarfcn writes an empty set as {}
+        if math.isnan(cell):
+            return NA
+        return _number(cell)
+
+    raw = {}
+    for table_id, schema in TABLE_SCHEMAS.items():
+        cells, width = sections[table_id], len(schema)
+        raw[table_id] = [[value(kind, cell) for kind, cell in zip(schema, cells[start:start + width])]
+                         for start in range(0, len(cells), width)]
+
+    band_edges = [_number(edge) for edge in sections["band_edges"]]
+    offsets, members = sections["segment_offsets"], sections["segment_bands"]
+    segments = [tuple(strings[index] for index in members[start:end]) for start, end in zip(offsets, offsets[1:])]
+    points = len(band_edges)
+    return NRRasterTables(raw, (band_edges, segments[:points], segments[points:]))
+
+
+def write_table_file(path=None, release_3gpp=DEFAULT_RELEASE):
+    """
+    Build step: serializes the nrarfcn tables (bands, ARFCN / GSCN rasters,
+    duplex modes) and the precomputed band segments into a versioned binary
+    file. The file is decoded back and compared before it is written.
+    Returns the file size in bytes.
+    """
+    path = path or TABLE_FILE
+    tables = NRRasterTables(load_raw_tables(release_3gpp))
+    data = _encode_tables(tables, release_3gpp)
+    loaded = _decode_tables(data, release_3gpp)
+    if not tables_equal(tables, loaded):
+        raise ValueError("Table file round trip changed the tables.")
+    with open(path, "wb") as handle:
+        handle.write(data)
+    return len(data)
+
+
+def load_table_file(path=None, release_3gpp=DEFAULT_RELEASE):
+    """Memory-maps a table file written by write_table_file(); raises OSError / ValueError if unusable"""
+    with open(path or TABLE_FILE, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            try:
+                return _decode_tables(buffer, release_3gpp)
+            except (struct.error, KeyError, IndexError, TypeError, UnicodeDecodeError) as exc:
+                raise ValueError(f"Corrupt table file ({exc}).") from None
+
+
+def tables_equal(first, second):
+    """True if two NRRasterTables hold identical rows and segments, value and type"""
+    def typed(value):
+        if isinstance(value, (list, tuple)):
+            return [typed(item) for item in value]
+        if isinstance(value, dict) and not value:
+            return ("set", ())
+        if isinstance(value, (set, frozenset, dict)):
+            return ("set", tuple(sorted(value)))
+        return (type(value).__name__, value)
+
+    return all(typed(getattr(first, name)) == typed(getattr(second, name))
+               for name in ("arfcn_rows", "gscn_rows", "band_edges", "point_bands", "gap_bands")) and \
+        all(typed(list(getattr(first, name).items())) == typed(list(getattr(second, name).items()))
+            for name in ("band_info", "channel_raster", "sync_raster"))
+
+# ---------------------- Validation ----------------------
+
+def validate_against_nrarfcn(arfcn_step=1, gscn_step=1, freq_step=1.0, band_arfcn_step=None, tables=None):
+    """
+    Cross-checks the table engine against the nrarfcn API.
+
+    Covers every ARFCN (every `arfcn_step`-th) and GSCN in range, frequency
+    -> ARFCN/GSCN/bands on a `freq_step` MHz grid plus every band edge and its
+    neighbours, ARFCN -> bands around every band edge, and every band-level
+    query. Returns a list of (operation, input, expected, got) mismatches.
+    """
+    import nrarfcn as NR_5G
+
+    tables = tables or get_tables()
+    mismatches = []
+
+    def check(operation, value, reference, candidate):
+        try:
+            expected = reference(value)
+        except ValueError:
+            expected = ValueError
+        try:
+            got = candidate(value)
+        except ValueError:
+            got = ValueError
+        if expected != got:
+            mismatches.append((operation, value, expected, got))
+
+    for nrarfcn in range(0, MAX_NRARFCN + 1, arfcn_step):
+        check("frequency", nrarfcn, NR_5G.get_frequency, tables.frequency)
+    for gscn in range(MIN_GSCN, MAX_GSCN + 1, gscn_step):
+        check("frequency_by_gscn", gscn, NR_5G.get_frequency_by_gscn, tables.frequency_by_gscn)
+        frequency = NR_5G.get_frequency_by_gscn(gscn)
+        check("gscn_by_frequency", frequency, NR_5G.get_gscn_by_frequency, tables.gscn_by_frequency)
+
+    steps = int(MAX_FREQ / freq_step)
+    frequencies = [round(i * freq_step, 3) for i in range(steps + 1)]
+    for edge in tables.band_edges:
+        frequencies.extend((edge - 0.001, edge, edge + 0.001))
+    for frequency in frequencies:
+        check("nrarfcn", frequency, NR_5G.get_nrarfcn, tables.nrarfcn)
+        check("gscn_by_frequency", frequency, NR_5G.get_gscn_by_frequency, tables.gscn_by_frequency)
+        check("bands_by_frequency", frequency, NR_5G.get_bands_by_frequency, tables.bands_by_frequency)
+
+    edge_arfcns = set()
+    for edge in tables.band_edges:
+        center = NR_5G.get_nrarfcn(edge)
+        edge_arfcns.update(n for n in range(center - 2, center + 3) if 0 <= n <= MAX_NRARFCN)
+    if band_arfcn_step:
+        edge_arfcns.update(range(0, MAX_NRARFCN + 1, band_arfcn_step))
+    for nrarfcn in sorted(edge_arfcns):
+        check("bands_by_nrarfcn", nrarfcn, NR_5G.get_bands_by_nrarfcn, tables.bands_by_nrarfcn)
+
+    for band in tables.bands + ["n0", "n999", "x1"]:
+        check("duplex_mode", band, NR_5G.get_duplex_mode, tables.duplex_mode)
+        check("gscn_range", band, NR_5G.get_gscn_range, tables.gscn_range)
+        for direction in ("", "dl", "ul", "up"):
+            check("nrarfcn_range", band, lambda b: NR_5G.get_nrarfcn_range(b, direction),
+                  lambda b: tables.nrarfcn_range(b, direction))
+            check("frequency_range", band, lambda b: NR_5G.get_frequency_range(b, direction),
+                  lambda b: tables.frequency_range(b, direction))
+    return mismatches
+
+
+# ---------------------- Cold-Start Benchmark ----------------------
+
+_COLD_START = """
+import sys, time
+start = time.perf_counter()
+import nr5gmodule
+nr5gmodule.get_nr_Freq_from_nr_Arfcn(620000)
+print(time.perf_counter() - start, "nrarfcn" in sys.modules)
+"""
+
+
+def cold_start_benchmark(runs=5):
+    """
+    Import + first ARFCN -> frequency conversion in fresh interpreters, with the
+    table file and with the nrarfcn fallback. Returns {mode: (median seconds,
+    nrarfcn imported)}.
+    """
+    import statistics
+    import subprocess
+    import sys
+
+    src = os.path.dirname(os.path.abspath(__file__))
+    results = {}
+    for mode, table_file in (("table_file", TABLE_FILE), ("nrarfcn", os.path.join(src, "missing.bin"))):
+        env = dict(os.environ, NR5G_TABLE_FILE=table_file)
+        timings, imported = [], set()
+        for _ in range(runs):
+            out = subprocess.run([sys.executable, "-c", _COLD_START], cwd=src, env=env,
+                                 capture_output=True, text=True, check=True).stdout.split()
+            timings.append(float(out[0]))
+            imported.add(out[1] == "True")
+        results[mode] = (statistics.median(timings), any(imported))
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    if sys.argv[1:2] == ["--build"]:
+        size = write_table_file(sys.argv[2] if len(sys.argv) > 2 else None)
+        print(f"Wrote {sys.argv[2] if len(sys.argv) > 2 else TABLE_FILE} ({size} bytes, "
+              f"format v{TABLE_FILE_VERSION}, Rel-{DEFAULT_RELEASE})")
+    elif sys.argv[1:2] == ["--benchmark"]:
+        for mode, (seconds, imported) in cold_start_benchmark().items():
+            print(f"{mode:<12} import + first conversion: {seconds * 1000:7.1f} ms "
+                  f"(nrarfcn imported: {'yes' if imported else 'no'})")
+    else:
+        start = time.perf_counter()
+        problems = validate_against_nrarfcn()
+        print(f"Validated table engine against nrarfcn in {time.perf_counter() - start:.1f} s: "
+              f"{len(problems)} mismatches")
+        for problem in problems[:20]:
+            print(problem)
@@ -0,0 +1,34 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Shared pytest fixtures for the NR 5G tests           ###
+###                 Request records used by batch mode and the server    ###
+###  Created On   : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+"""
+
+import pytest
+
+# One valid and one invalid record per operation
+RECORDS = [
+    {"op": "ARFCN_TO_FREQ", "arfcn": 620000}, {"op": "ARFCN_TO_FREQ", "arfcn": -5},
+    {"op": "FREQ_TO_ARFCN", "freq": 3500}, {"op": "FREQ_TO_ARFCN", "freq": 100},
+    {"op": "FREQ_TO_BANDLIST", "freq": 1710}, {"op": "FREQ_TO_BANDLIST", "freq": 80000},
+    {"op": "ARFCN_TO_BANDLIST", "arfcn": 620000}, {"op": "ARFCN_TO_BANDLIST", "arfcn": 0},
+    {"op": "BAND_TO_DUPLEX", "band": "n80"}, {"op": "BAND_TO_DUPLEX", "band": "n0"},
+    {"op": "BAND_TO_ARFCN_RANGE", "band": "n80", "direction": "dl"}, {"op": "BAND_TO_ARFCN_RANGE", "band": "x"},
+    {"op": "BAND_TO_FREQ_RANGE", "band": "n78", "direction": "ul"}, {"op": "BAND_TO_FREQ_RANGE", "band": "n105"},
+    {"op": "GSCN_TO_FREQ", "gscn": 7711}, {"op": "GSCN_TO_FREQ", "gscn": 1},
+    {"op": "FREQ_TO_GSCN", "freq": 3500}, {"op": "FREQ_TO_GSCN", "freq": 200},
+    {"op": "BAND_TO_GSCN_RANGE", "band": "n78"}, {"op": "BAND_TO_GSCN_RANGE", "band": "n80"},
+    {"op": "NUMEROLOGY_TO_SCS", "numerology": 2}, {"op": "NUMEROLOGY_TO_SCS", "numerology": 7},
+    {"op": 12, "numerology": 1, "bandwidth": 100}, {"op": "12", "numerology": 1, "bandwidth": 0},
+]
+
+
+@pytest.fixture
+def records():
+    """One valid and one invalid request record per operation (a fresh copy per test)"""
+    return [dict(record) for record in RECORDS]
@@ -0,0 +1,169 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the NR 5G audit log writer            ###
+###                 Formats, batching, rotation, flush on exit, batch    ###
+###                 mode and server auditing                             ###
+###  Created On   : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+"""
+
+import sys
+import os
+
+# Add the src/ directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import json
+import re
+import subprocess
+import pytest
+from nr5gaudit import AuditLog
+from nr5gbatchmode import run_batch
+from nr5gclient import NR5GClient
+from nr5gserver import start_in_thread
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# ---------------------- Formats ----------------------
+
+def test_text_format_keeps_old_layout(tmp_path):
+    log = AuditLog(str(tmp_path / "calc.log"))
+    log.write("ARFCN ➡ Frequency", 3300.0)
+    log.write("Frequency ➡ Band List", ["n77", "n78"])
+    log.write("ARFCN_TO_FREQ", error="ENTER VALID NR-ARFCN (0 - 3279165)")
+    log.close()
+    lines = (tmp_path / "calc.log").read_text(encoding="utf-8").splitlines()
+    stamp = r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d{3} - "
+    assert re.fullmatch(stamp + "ARFCN ➡ Frequency: 3300.0", lines[0])
+    assert re.fullmatch(stamp + re.escape("Frequency ➡ Band List: ['n77', 'n78']"), lines[1])
+    assert lines[2].endswith("ARFCN_TO_FREQ: error: ENTER VALID NR-ARFCN (0 - 3279165)")
+
+def test_jsonl_format(tmp_path):
+    log = AuditLog(str(tmp_path / "calc.jsonl"), fmt="jsonl")
+    log.write_many([("BAND_TO_DUPLEX", "TDD", None), ("BAND_TO_DUPLEX", None, "unknown band")])
+    log.close()
+    entries = [json.loads(line) for line in (tmp_path / "calc.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [entry.get("result") for entry in entries] == ["TDD", None]
+    assert entries[1]["error"] == "unknown band" and entries[0]["time"] == entries[1]["time"]
+    with pytest.raises(ValueError):
+        AuditLog(str(tmp_path / "x.log"), fmt="xml")
+
+# ---------------------- Batching, Rotation, Exit ----------------------
+
+def test_writes_are_batched_and_do_not_wait_for_disk(tmp_path):
+    # A long flush interval parks the writer thread: write() must return
+    # before anything reaches the file, and batches stay batch_size large
+    path = tmp_path / "calc.log"
+    log = AuditLog(str(path), batch_size=1000, flush_interval=60)
+    for n in range(999):
+        log.write("ARFCN ➡ Frequency", n)
+    assert path.stat().st_size == 0 and log.entries_written == 0
+    for n in range(999, 20000):
+        log.write("ARFCN ➡ Frequency", n)
+    assert log.flush(timeout=10)
+    assert log.entries_written == 20000
+    assert log.batches_written <= 20000 // 1000 + 1
+    log.close()
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 20000
+
+def test_size_rotation_keeps_backups(tmp_path):
+    path = tmp_path / "calc.log"
+    log = AuditLog(str(path), max_bytes=4096, backups=2, batch_size=10)
+    for n in range(2000):
+        log.write("GSCN ➡ Frequency", n)
+        if n % 10 == 9:
+            log.flush()
+    log.close()
+    assert log.rotations > 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["calc.log", "calc.log.1", "calc.log.2"]
+    assert all(p.stat().st_size <= 4096 for p in tmp_path.iterdir())
+    assert path.read_text(encoding="utf-8").splitlines()[-1].endswith(": 1999")
+
+def test_failed_batches_keep_writer_alive(tmp_path, monkeypatch):
+    import nr5gaudit
+
+    class Unprintable:
+        def __format__(self, spec):
+            raise RuntimeError("cannot format")
+
+    def fail(source, target):
+        raise PermissionError(source)
+
+    path = tmp_path / "calc.log"
+    log = AuditLog(str(path), max_bytes=200, backups=1, batch_size=1)
+    log.write("GSCN ➡ Frequency", Unprintable())
+    assert log.flush(timeout=10) and log.write_errors == 1
+    monkeypatch.setattr(nr5gaudit.os, "replace", fail)
+    for n in range(10):
+        log.write("GSCN ➡ Frequency", n)
+        assert log.flush(timeout=10)
+    assert log.write_errors > 1 and not log._file.closed
+    monkeypatch.undo()
+    log.write("GSCN ➡ Frequency", 10)
+    assert log.flush(timeout=10)
+    log.close()
+    assert log.rotations == 1
+    assert path.read_text(encoding="utf-8").endswith("GSCN ➡ Frequency: 10\n")
+    # Batches that could not rotate were still written, to the old file
+    backup = (tmp_path / "calc.log.1").read_text(encoding="utf-8").splitlines()
+    assert [line.rsplit(": ", 1)[1] for line in backup] == [str(n) for n in range(10)]
+
+def test_write_after_close_is_refused(tmp_path):
+    log = AuditLog(str(tmp_path / "calc.log"))
+    log.write("ARFCN ➡ Frequency", 3300.0)
+    log.close()
+    with pytest.raises(ValueError, match="closed"):
+        log.write("ARFCN ➡ Frequency", 3300.0)
+    with pytest.raises(ValueError, match="closed"):
+        log.write_many([("BAND_TO_DUPLEX", "TDD", None)])
+    assert len((tmp_path / "calc.log").read_text(encoding="utf-8").splitlines()) == 1
+
+def test_process_wide_log_reopens_after_close(tmp_path):
+    import logging
+    import nr5gaudit
+    path = tmp_path / "calc.log"
+    nr5gaudit.configure(str(path), lazy=True)
+    nr5gaudit.audit("ARFCN ➡ Frequency", 3300.0)
+    first = nr5gaudit.get_audit_log()
+    first.close()
+    nr5gaudit.audit("GSCN ➡ Frequency", 3450.72)
+    logging.info("Batch run: 2 records")
+    second = nr5gaudit.get_audit_log()
+    assert second is not first and not second._closed
+    second.close()
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [line.split(" - ", 1)[1] for line in lines] == [
+        "ARFCN ➡ Frequency: 3300.0", "GSCN ➡ Frequency: 3450.72", "Batch run: 2 records"]
+
+def test_queued_entries_are_flushed_at_exit(tmp_path):
+    path = tmp_path / "calc.log"
+    script = (f"import nr5gaudit\nlog = nr5gaudit.AuditLog({str(path)!r}, flush_interval=60)\n"
+              "for n in range(5000):\n    log.write('ARFCN ➡ Frequency', n)\n")
+    subprocess.run([sys.executable, "-c", script], cwd=SRC, check=True)
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 5000
+
+# ---------------------- Batch Mode / Server ----------------------
+
+def test_batch_mode_results_are_audited(tmp_path):
+    source, out = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    source.write_text('{"op": 1, "arfcn": 620000}\n{"op": 5, "band": "x1"}\n', encoding="utf-8")
+    log = AuditLog(str(tmp_path / "audit.jsonl"), fmt="jsonl")
+    assert run_batch(str(source), str(out), audit=log) == (2, 1)
+    log.close()
+    entries = [json.loads(line) for line in (tmp_path / "audit.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert entries[0]["result"] == 3300.0 and "error" in entries[1]
+
+def test_server_results_are_audited(tmp_path):
+    log = AuditLog(str(tmp_path / "audit.log"))
+    server = start_in_thread("127.0.0.1:0", audit=log)
+    try:
+        host, port = server.server_address
+        assert NR5GClient(f"{host}:{port}").call("ARFCN_TO_FREQ", arfcn=620000) == 3300.0
+    finally:
+        server.shutdown()
+        server.server_close()
+    log.close()
+    assert (tmp_path / "audit.log").read_text(encoding="utf-8").strip().endswith("ARFCN_TO_FREQ: 3300.0")
@@ -0,0 +1,73 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the NR 5G band interval index         ###
+###                 Point, range and sorted-batch queries vs. brute      ###
+###                 force and the table engine                           ###
+###  Created On   : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+"""
+
+import sys
+import os
+
+# Add the src/ directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import numpy as np
+import pytest
+import nr5gmodule as mod
+from nr5gtables import get_tables
+from nr5gbandindex import get_band_index, band_intervals
+
+RNG = np.random.default_rng(2026)
+
+
+def _probe_frequencies():
+    edges = get_tables().band_edges
+    probes = [edge + delta for edge in edges for delta in (-0.001, 0, 0.001)]
+    return sorted(set(RNG.uniform(0, 100000, 5000).round(3).tolist() + probes))
+
+
+def _brute_force(direction, low, high):
+    intervals = band_intervals(direction)
+    bands = dict.fromkeys(band for band, _, _ in intervals)
+    return [band for band in bands if any(b == band and l <= high and h >= low for b, l, h in intervals)]
+
+# ---------------------- Point Queries ----------------------
+
+def test_point_queries_match_table_engine():
+    index, tables = get_band_index(), get_tables()
+    for frequency in _probe_frequencies():
+        assert index.bands_at(frequency) == tables.bands_by_frequency(frequency)
+
+def test_sorted_batch_matches_point_queries():
+    frequencies = _probe_frequencies()
+    for direction in ("", "ul", "dl"):
+        index = get_band_index(direction)
+        assert [list(bands) for bands in index.bands_at_sorted(frequencies)] == [index.bands_at(f) for f in frequencies]
+    with pytest.raises(ValueError):
+        get_band_index().bands_at_sorted([3500, 3400])
+
+# ---------------------- Range Queries ----------------------
+
+def test_range_queries_match_brute_force():
+    for low in RNG.uniform(300, 72000, 1500).tolist():
+        high = low + float(RNG.choice([0, 0.5, 20, 400, 3000]))
+        for direction in ("", "ul", "dl"):
+            assert get_band_index(direction).bands_overlapping(low, high) == _brute_force(direction, low, high)
+
+def test_c_band_and_sul_sdl_directions():
+    assert get_band_index().bands_overlapping(3300, 3800) == ["n48", "n77", "n78"]
+    assert "n80" in get_band_index("UL").bands_overlapping(1710, 1785)      # SUL: uplink only
+    assert "n80" not in get_band_index("dl").bands_overlapping(1710, 1785)
+    assert "n75" in get_band_index("dl").bands_at(1450)                     # SDL: downlink only
+    assert "n75" not in get_band_index("ul").bands_at(1450)
+
+def test_module_range_function(capsys):
+    assert mod.get_nr_Bands_from_nr_FreqRange(3300, 3800) == ["n48", "n77", "n78"]
+    assert mod.get_nr_Bands_from_nr_FreqRange(3800, 3300) == -1
+    assert mod.get_nr_Bands_from_nr_FreqRange(3300, 3800, "up") == -1
+    assert "ENTER VALID" in capsys.readouterr().out
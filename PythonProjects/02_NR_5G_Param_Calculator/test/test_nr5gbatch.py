@@ -0,0 +1,75 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for NR 5G vectorized batch conversions    ###
+###                 Batch results and masks vs. the scalar nr5gmodule    ###
+###  Created On   : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+"""
+
+import sys
+import os
+
+# Add the src/ directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import numpy as np
+import nr5gmodule as mod
+import nr5gbatch as batch
+
+RNG = np.random.default_rng(2026)
+ARFCNS = np.concatenate([RNG.integers(-10, 3279175, 5000), [0, 1, 599999, 600000, 2016666, 2016667, 3279164, 3279165]])
+FREQS = np.concatenate([RNG.uniform(300, 72000, 5000).round(3), [410, 410.001, 3000, 3300, 3800, 24250, 70999.999, 71000]])
+
+
+def _matches_scalar(scalar, inputs, values, valid, capsys):
+    expected = [scalar(x) for x in inputs]
+    capsys.readouterr()  # scalar path prints on invalid input
+    for want, got, ok in zip(expected, values, valid):
+        if want == -1:
+            assert not ok
+        else:
+            assert ok and (list(got) if isinstance(got, tuple) else got) == want
+    return True
+
+
+# ---------------------- Conversions vs. Scalar Path ----------------------
+
+def test_arfcn_frequency_batches(capsys):
+    assert _matches_scalar(mod.get_nr_Freq_from_nr_Arfcn, ARFCNS.tolist(), *batch.get_nr_Freq_from_nr_Arfcn(ARFCNS), capsys)
+    assert _matches_scalar(mod.get_nr_Arfcn_from_nr_Freq, FREQS.tolist(), *batch.get_nr_Arfcn_from_nr_Freq(FREQS), capsys)
+
+def test_band_list_batches(capsys):
+    assert _matches_scalar(mod.get_nr_Bands_from_nr_Freq, FREQS.tolist(), *batch.get_nr_Bands_from_nr_Freq(FREQS), capsys)
+    assert _matches_scalar(mod.get_nr_Bands_from_nr_Arfcn, ARFCNS.tolist(), *batch.get_nr_Bands_from_nr_Arfcn(ARFCNS), capsys)
+
+def test_gscn_batches_every_gscn(capsys):
+    gscns = np.arange(-2, 26642)
+    freqs, valid = batch.get_nr_Freq_from_nr_GSCN(gscns)
+    assert _matches_scalar(mod.get_nr_Freq_from_nr_GSCN, gscns.tolist(), freqs, valid, capsys)
+    probe = np.concatenate([freqs[valid], FREQS])
+    assert _matches_scalar(mod.get_nr_GSCN_from_nr_Freq, probe.tolist(), *batch.get_nr_GSCN_from_nr_Freq(probe), capsys)
+
+# ---------------------- Band-level Queries and Masks ----------------------
+
+def test_band_queries_and_masks():
+    bands = np.array(["n78", "n80", "n29", "x1", "n263", "n78"])
+    duplex, valid = batch.get_duplex_mode_from_nr_Band(bands)
+    assert duplex.tolist() == ["TDD", "SUL", "SDL", None, "TDD", "TDD"]
+    assert valid.tolist() == [True, True, True, False, True, True]
+
+    low, high, valid = batch.get_nr_Freqrange_from_nr_Band(bands, "ul")
+    assert valid.tolist() == [True, True, False, False, True, True]  # n29 is downlink only
+    assert (low[0], high[0]) == mod.get_nr_Freqrange_from_nr_Band("n78", "ul")
+
+    low, high, valid = batch.get_nr_GSCNRange_from_nr_Band(bands)
+    assert valid.tolist() == [True, False, True, False, True, True]  # n80 (SUL) has no sync raster
+
+def test_prbs_and_numerology():
+    scs, valid = batch.get_NRsubcarrier_spacing_from_numerology([0, 1, 2, 3, 4, 5])
+    assert scs[valid].tolist() == [15, 30, 60, 120, 240] and not valid[5]
+    prbs, valid = batch.get_nr_NumberOfPRBs([100, 20, 0], [30, 15, 30])
+    assert prbs[:2].tolist() == [mod.get_nr_NumberOfPRBs(100, 30), mod.get_nr_NumberOfPRBs(20, 15)]
+    assert valid.tolist() == [True, True, False]
@@ -0,0 +1,78 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the NR 5G non-interactive batch mode  ###
+###                 CSV / JSON-lines round trips vs. the scalar path     ###
+###  Created On   : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+"""
+
+import sys
+import os
+import csv
+import json
+
+# Add the src/ directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import pytest
+import nr5gCalculator
+from nr5gops import OPERATIONS, lookup_operation
+from nr5gbatchmode import run_batch, evaluate_chunk
+
+def _run(record):
+    op = lookup_operation(record["op"])
+    return op.run(*op.parse_args(record))
+
+def _scalar(record):
+    return _run(record)[0]
+
+
+# ---------------------- Grouped Evaluation vs. Scalar Path ----------------------
+
+def test_every_operation_matches_scalar(records, capsys):
+    assert {lookup_operation(r["op"]).menu for r in records} == set(OPERATIONS)
+    outcomes = evaluate_chunk(records)
+    for record, (result, error) in zip(records, outcomes):
+        expected, expected_error = _run(record)
+        assert (list(result) if isinstance(result, tuple) else result) == expected, record
+        assert error == expected_error, record
+    assert capsys.readouterr().out == ""  # invalid values are reported, not printed
+
+def test_bad_records_become_error_rows():
+    outcomes = evaluate_chunk([{"op": "NOPE"}, {"op": "ARFCN_TO_FREQ"}, {"op": "ARFCN_TO_FREQ", "arfcn": "abc"},
+                               {"op": ["x"]}, {"op": "ARFCN_TO_FREQ", "arfcn": 620000}])
+    errors = [error for _, error in outcomes]
+    assert errors[0].startswith("unknown operation") and errors[1] == "missing parameter 'arfcn'"
+    assert errors[2].startswith("invalid arfcn") and errors[3].startswith("unknown operation")
+    assert outcomes[4] == (3300.0, None)
+
+# ---------------------- Streaming Files ----------------------
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1000])
+def test_jsonl_round_trip_keeps_order(tmp_path, chunk_size, records):
+    src, out = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    src.write_text("".join(json.dumps(r) + "\n" for r in records) + "\nnot json\n")
+    assert run_batch(str(src), str(out), chunk_size=chunk_size) == (len(records) + 1, len(records) // 2 + 1)
+    rows = [json.loads(line) for line in out.read_text().splitlines()]
+    assert rows[-1]["error"].startswith("line 26: invalid JSON")
+    for record, row in zip(records, rows):
+        assert {k: row[k] for k in record} == record
+        assert row.get("result") == _scalar(record)
+
+def test_csv_input_and_output(tmp_path, capsys):
+    src, out = tmp_path / "in.csv", tmp_path / "out.csv"
+    src.write_text("op,arfcn,band,direction\nARFCN_TO_FREQ,620000,,\nBAND_TO_FREQ_RANGE,,n78,ul\nARFCN_TO_FREQ,x,,\n")
+    assert run_batch(str(src), str(out)) == (3, 1)
+    rows = list(csv.DictReader(out.open()))
+    assert [row["result"] for row in rows] == ["3300.0", "[3300, 3800]", ""]
+    assert rows[2]["error"] == "invalid arfcn: 'x'"
+
+def test_cli_batch_mode(tmp_path, capsys):
+    src, out = tmp_path / "in.jsonl", tmp_path / "out.csv"
+    src.write_text('{"op":"ARFCN_TO_FREQ","arfcn":620000}\n')
+    assert nr5gCalculator.main(["--batch", str(src), "--output", str(out), "--log-file", str(tmp_path / "calc.log")]) == 0
+    assert list(csv.DictReader(out.open()))[0]["result"] == "3300.0"
+    assert nr5gCalculator.main(["--batch", str(tmp_path / "missing.jsonl"), "--log-file", str(tmp_path / "calc.log")]) == 1
@@ -0,0 +1,66 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the NR 5G engine benchmark harness    ###
+###                 Seeded inputs, cross-engine correctness, timings and ###
+###                 baseline comparison                                  ###
+###  Created On   : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+"""
+
+import sys
+import os
+
+# Add the src/ directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import copy
+import pytest
+import nr5gbench as bench
+from nr5gops import OPERATIONS
+
+INPUTS = bench.make_inputs(200)
+
+
+@pytest.fixture(scope="module")
+def results():
+    return bench.run_benchmarks(INPUTS, repeats=1)
+
+# ---------------------- Inputs and Correctness ----------------------
+
+def test_inputs_are_seeded_and_cover_fr1_fr2():
+    assert bench.make_inputs(200) == INPUTS
+    assert bench.make_inputs(200, seed=1) != INPUTS
+    assert any(f < 7125 for f in INPUTS["freq"]) and any(f > 24250 for f in INPUTS["freq"])
+    assert any(n < 875001 for n in INPUTS["arfcn"]) and any(n > 2016666 for n in INPUTS["arfcn"])
+
+def test_engines_agree_on_the_benchmark_inputs():
+    assert bench.cross_check(INPUTS) == []
+
+# ---------------------- Timings and Baseline ----------------------
+
+def test_every_operation_and_engine_is_timed(results):
+    assert list(results) == [op.name for op in OPERATIONS.values()]
+    assert set(results["ARFCN_TO_FREQ"]) == set(bench.ENGINES)
+    assert "nrarfcn" not in results["PRB_CALCULATION"]  # no library API for PRBs
+    for engines in results.values():
+        for numbers in engines.values():
+            assert numbers["ns_per_call"] > 0 and numbers["calls_per_s"] > 0 and numbers["peak_kib"] >= 0
+
+def test_baseline_round_trip_and_regressions(results, tmp_path):
+    path = tmp_path / "baseline.json"
+    bench.save_baseline(results, 200, bench.BENCH_SEED, str(path))
+    baseline = bench.load_baseline(str(path))
+    assert bench.compare_to_baseline(results, baseline) == []
+    faster = copy.deepcopy(baseline)
+    faster["results"]["ARFCN_TO_FREQ"]["table"]["ns_per_call"] /= 2
+    regressions = bench.compare_to_baseline(results, faster)
+    assert [(op, engine) for op, engine, *_ in regressions] == [("ARFCN_TO_FREQ", "table")]
+    assert "vs base" in bench.format_report(results, faster)
+
+def test_shipped_baseline_covers_every_operation():
+    baseline = bench.load_baseline()
+    assert baseline["seed"] == bench.BENCH_SEED
+    assert set(baseline["results"]) == {op.name for op in OPERATIONS.values()}
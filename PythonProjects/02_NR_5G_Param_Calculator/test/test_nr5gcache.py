@@ -0,0 +1,65 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the NR 5G band query cache            ###
+###                 Normalized keys, LRU bound, statistics, warm-up      ###
+###  Created On   : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+"""
+
+import sys
+import os
+
+# Add the src/ directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import pytest
+import nr5gcache
+import nr5gmodule as mod
+from nr5gtables import get_tables
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    nr5gcache.cache_clear()
+    yield
+    nr5gcache.cache_clear()
+
+
+# ---------------------- Normalized Keys ----------------------
+
+@pytest.mark.parametrize("band", ["n78", "N78", " n78 ", "n78\n"])
+def test_band_spellings_share_one_entry(band):
+    nr5gcache.band_query("duplex_mode", "n78")
+    assert mod.get_duplex_mode_from_nr_Band(band) == "TDD"
+    assert mod.get_nr_Freqrange_from_nr_Band(band, " UL ") == (3300, 3800)
+    info = nr5gcache.cache_info()
+    assert info.currsize == 2 and info.hits == 1
+
+def test_unknown_bands_raise_and_are_cached():
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            nr5gcache.band_query("gscn_range", "n999")
+    assert nr5gcache.cache_info().misses == 1
+    with pytest.raises(ValueError):
+        nr5gcache.band_query("gscn_range", 78)  # not a band name: never reaches the cache
+    with pytest.raises(ValueError):
+        nr5gcache.band_query("frequency_range", "n78", "up")
+
+# ---------------------- Statistics / Bound / Warm-up ----------------------
+
+def test_warm_up_answers_every_band_from_cache():
+    size = nr5gcache.warm_up()
+    assert size == nr5gcache.cache_info().currsize <= nr5gcache.BAND_CACHE_SIZE
+    for band in get_tables().bands:
+        mod.get_duplex_mode_from_nr_Band(band)
+        mod.get_nr_Freqrange_from_nr_Band(band, "dl")
+    info = nr5gcache.cache_info()
+    assert info.misses == size and info.hits == 2 * len(get_tables().bands)
+
+def test_cache_is_bounded():
+    for number in range(nr5gcache.BAND_CACHE_SIZE + 200):
+        nr5gcache._answer("duplex_mode", f"n{number}", "")
+    assert nr5gcache.cache_info().currsize == nr5gcache.BAND_CACHE_SIZE
@@ -0,0 +1,65 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the NR 5G calculator CLI startup      ###
+###                 One-shot commands, lazy log file, import / startup   ###
+###                 time in fresh interpreters                           ###
+###  Created On   : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+"""
+
+import sys
+import os
+
+# Add the src/ directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import pytest
+import nr5gCalculator
+import nr5gaudit
+from nr5gops import COMMANDS, OPERATIONS
+
+@pytest.mark.parametrize("argv, expected", [
+    (["arfcn2freq", "620000"], "3300.0"),
+    (["freq2arfcn", "3500"], "633333"),
+    (["freq2bands", "3500"], "n77 n78"),
+    (["band2duplex", " N78 "], "TDD"),
+    (["band2freq", "n1", "ul"], "1920 1980"),
+    (["num2scs", "2"], "60"),
+    (["prbs", "1", "100"], "273"),
+])
+def test_one_shot_commands(argv, expected, capsys):
+    assert nr5gCalculator.main(argv) == 0
+    assert capsys.readouterr().out.strip() == expected
+
+def test_one_shot_matches_scalar_path(capsys):
+    assert nr5gCalculator.main(["gscn2freq", "7711"]) == 0
+    assert float(capsys.readouterr().out) == OPERATIONS[COMMANDS["gscn2freq"]].scalar(7711)
+
+def test_one_shot_errors(capsys):
+    assert nr5gCalculator.main(["arfcn2freq", "99999999"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == "" and "ENTER VALID NR-ARFCN" in captured.err
+    assert nr5gCalculator.main(["arfcn2freq", "x"]) == 2
+    assert nr5gCalculator.main(["prbs", "1"]) == 2
+    assert "usage: nr5gCalculator.py prbs NUMEROLOGY BANDWIDTH" in capsys.readouterr().err
+
+def test_test_mode_creates_no_log_file(tmp_path):
+    log_file = tmp_path / "calc.log"
+    nr5gCalculator.main(["--test", "--log-file", str(log_file)])
+    assert not log_file.exists()
+    # The first logged result opens the configured file
+    nr5gCalculator.log_result("ARFCN ➡ Frequency", 3300.0)
+    assert nr5gaudit.get_audit_log().flush(5)
+    assert "ARFCN ➡ Frequency: 3300.0" in log_file.read_text(encoding="utf-8")
+    nr5gaudit.get_audit_log().close()
+
+def test_startup_benchmark():
+    results = nr5gCalculator.startup_benchmark(runs=3)
+    for scenario, result in results.items():
+        assert not result["log_file"]
+        assert "nrarfcn" not in result["modules"] and "numpy" not in result["modules"], result["modules"]
+        assert result["import"] < 1.0, f"{scenario}: import took {result['import'] * 1000:.1f} ms"
+    assert results["one_shot"]["modules"] == []
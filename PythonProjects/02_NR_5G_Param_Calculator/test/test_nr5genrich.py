@@ -0,0 +1,99 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the NR 5G cell-list enrichment        ###
+###                 Derived columns vs. the scalar path, error rows,     ###
+###                 chunking and process pool vs. a single pass          ###
+###  Created On   : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+"""
+
+import sys
+import os
+import csv
+import json
+import random
+
+# Add the src/ directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import pytest
+import nr5gmodule as nrmod
+import nr5gCalculator
+from nr5genrich import enrich_cell_list, map_columns, ENRICHED_COLUMNS, DEFAULT_SCS
+
+ARFCNS = [620000, 633984, 151600, 427970, 123456, 531000, 2079167, 2564083, 399000, 2016667]
+
+def _write_cells(path, rows, header=("ARFCN", "PCI", "BW", "site")):
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+def _read(path):
+    with open(path, newline="", encoding="utf-8") as handle:
+        return list(csv.DictReader(handle))
+
+def test_matches_scalar_path(tmp_path, capsys):
+    random.seed(2026)
+    cells = [(random.choice(ARFCNS), random.randint(0, 1007), random.choice([10, 20, 50, 100, 200]), f"s{i}")
+             for i in range(3000)]
+    _write_cells(tmp_path / "cells.csv", cells)
+    assert enrich_cell_list(str(tmp_path / "cells.csv"), str(tmp_path / "out.csv"), chunk_size=500)[0] == 3000
+    for (arfcn, pci, bw, site), row in zip(cells, _read(tmp_path / "out.csv")):
+        freq = nrmod.get_nr_Freq_from_nr_Arfcn(arfcn)
+        bands = nrmod.get_nr_Bands_from_nr_Arfcn(arfcn)
+        fr = "FR1" if freq <= 7125 else "FR2-1" if freq <= 52600 else "FR2-2"
+        assert row["site"] == site and float(row["freq_mhz"]) == freq
+        assert json.loads(row["bands"]) == bands
+        assert row["duplex"].split("/") == list(dict.fromkeys(nrmod.get_duplex_mode_from_nr_Band(b) for b in bands))
+        assert int(row["scs_khz"]) == DEFAULT_SCS[fr]
+        assert int(row["prbs"]) == nrmod.get_nr_NumberOfPRBs(bw, DEFAULT_SCS[fr], fr=fr)
+        assert row["error"] == ""
+
+def test_error_rows(tmp_path):
+    _write_cells(tmp_path / "cells.csv", [
+        (620000, 1, 100), (0, 1, 100), ("", 1, 100), ("abc", 1, 100),
+        (620000, 1008, 100), (620000, "x", 100), (620000, 1, ""), (620000, 1, -5), (620000, 1),
+    ], header=("arfcn", "pci", "bw"))
+    assert enrich_cell_list(str(tmp_path / "cells.csv"), str(tmp_path / "out.csv")) == (9, 8)
+    rows = _read(tmp_path / "out.csv")
+    assert [row["prbs"] for row in rows[:1]] == ["273"]
+    assert all(row["error"].startswith("ENTER VALID NR-ARFCN") and row["freq_mhz"] == "" for row in rows[1:4])
+    assert all(row["error"] == "invalid PCI (0 - 1007)" and row["freq_mhz"] == "3300.0" for row in rows[4:6])
+    assert all(row["error"] == "invalid bandwidth / SCS" and row["prbs"] == "" for row in rows[6:])
+
+def test_columns_and_scs(tmp_path):
+    assert map_columns(["Site", "NR-ARFCN", "PhysCellId", "Bandwidth", "SCS"]) == {"arfcn": 1, "pci": 2, "bw": 3, "scs": 4}
+    with pytest.raises(ValueError):
+        map_columns(["arfcn", "pci"])
+    _write_cells(tmp_path / "cells.csv", [(620000, 7, 100, 60), (620000, 7, 20, 15), (620000, 7, 20, "")],
+                 header=("nrarfcn", "pci", "bw_mhz", "scs_khz"))
+    enrich_cell_list(str(tmp_path / "cells.csv"), str(tmp_path / "out.csv"))
+    assert [(row["scs_khz"], row["prbs"]) for row in _read(tmp_path / "out.csv")] == [("60", "135"), ("15", "106"), ("30", "51")]
+    (tmp_path / "empty.csv").write_text("")
+    with pytest.raises(ValueError):
+        enrich_cell_list(str(tmp_path / "empty.csv"), str(tmp_path / "out.csv"))
+
+def test_chunks_and_workers_agree(tmp_path):
+    random.seed(7)
+    cells = [(random.choice(ARFCNS + [-1]), random.randint(0, 1100), random.choice([20, 100, ""]), f'"site, {i}"\nline 2')
+             for i in range(2000)]
+    _write_cells(tmp_path / "cells.csv", cells)
+    outputs = []
+    for chunk_size, workers in ((65536, 1), (1, 1), (333, 1), (250, 2)):
+        out = tmp_path / f"out_{chunk_size}_{workers}.csv"
+        assert enrich_cell_list(str(tmp_path / "cells.csv"), str(out), chunk_size, workers)[0] == 2000
+        outputs.append(out.read_bytes())
+    assert all(output == outputs[0] for output in outputs)
+    assert _read(tmp_path / "out_1_1.csv")[5]["site"] == cells[5][3]
+
+def test_cli_enrich(tmp_path):
+    _write_cells(tmp_path / "cells.csv", [(620000, 1, 100, "a"), (0, 2, 3, "b")])
+    out, log = tmp_path / "out.csv", tmp_path / "calc.log"
+    assert nr5gCalculator.main(["--enrich", str(tmp_path / "cells.csv"), "--output", str(out), "--log-file", str(log)]) == 0
+    assert [row["error"] == "" for row in _read(out)] == [True, False]
+    assert list(_read(out)[0])[-len(ENRICHED_COLUMNS):] == ENRICHED_COLUMNS
+    assert nr5gCalculator.main(["--enrich", str(tmp_path / "missing.csv"), "--log-file", str(log)]) == 1
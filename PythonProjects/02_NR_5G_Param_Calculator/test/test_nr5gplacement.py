@@ -0,0 +1,72 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the NR 5G carrier placement optimizer ###
+###                 Interval search vs. brute force, ranking, FR2 scale  ###
+###  Created On   : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+"""
+
+import sys
+import os
+
+# Add the src/ directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import pytest
+import numpy as np
+import nr5gbatch
+import nr5gssb
+from nr5gplacement import find_carrier_placements
+from nr5gtables import get_tables
+
+
+def _brute_force(block_low, block_high, band, scs, bandwidth, n_rb):
+    # Every ARFCN in the block, filtered by raster membership and the full SSB planner
+    tables = get_tables()
+    rows = [row for row in tables.channel_raster[band] if row[0] in (scs, 100)] or \
+           [row for row in tables.channel_raster[band] if row[0] <= scs]
+    arfcns = np.arange(tables.nrarfcn(block_low) - 5, tables.nrarfcn(block_high) + 5)
+    on_raster = np.zeros(len(arfcns), dtype=bool)
+    for _, _, _, _, first, step, last in rows:
+        on_raster |= (arfcns >= first) & (arfcns <= last) & ((arfcns - first) % step == 0)
+    freqs, _ = nr5gbatch.get_nr_Freq_from_nr_Arfcn(arfcns)
+    fits = on_raster & (freqs - bandwidth / 2 >= block_low - 1e-9) & (freqs + bandwidth / 2 <= block_high + 1e-9)
+    candidates = arfcns[fits]
+    plan = nr5gssb.plan_ssb_batch(freqs[fits], bandwidth, scs, band, n_rb=n_rb)
+    return candidates[np.unique(plan["carrier"])].tolist()
+
+
+# ---------------------- Correctness ----------------------
+
+@pytest.mark.parametrize("band, low, high", [("n78", 3420, 3470), ("n3", 1805, 1825), ("n41", 2500, 2560)])
+def test_matches_brute_force(band, low, high):
+    options = find_carrier_placements(low, high, band)
+    assert options
+    for option in options:
+        assert option.arfcns.tolist() == _brute_force(low, high, band, option.scs, option.bandwidth, option.n_rb)
+
+def test_ranked_by_usable_prbs():
+    options = find_carrier_placements(3400, 3500, "n78")
+    assert options[0].bandwidth == 100 and options[0].n_rb == 273 and options[0].arfcns.tolist() == [630000]
+    ranks = [(-o.n_rb, -o.bandwidth, -o.count) for o in options]
+    assert ranks == sorted(ranks)
+
+def test_filters_and_bands_without_sync_raster():
+    options = find_carrier_placements(3400, 3500, "N78", scs=30, bandwidths=[20, 40])
+    assert {(o.scs, o.bandwidth) for o in options} == {(30, 20), (30, 40)}
+    sul = find_carrier_placements(1710, 1730, "n80")
+    assert sul and all(o.ssb_positions is None for o in sul)
+    with pytest.raises(ValueError):
+        find_carrier_placements(1710, 1730, "n0")
+    assert find_carrier_placements(3900, 4000, "n78") == []   # outside the band
+
+# ---------------------- Scale ----------------------
+
+def test_full_fr2_band_without_brute_force():
+    options = find_carrier_placements(26500, 29500, "n257")
+    assert options[0].n_rb == 264 and all(o.count > 0 for o in options)
+    first = next(options[0].placements())
+    assert first["ssb_positions"] > 0 and 26500 <= first["freq"] - 200 and first["freq"] + 200 <= 29500
@@ -0,0 +1,64 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the NR 5G N_RB tables                 ###
+###                 38.101 values, formula fallback, batch lookups       ###
+###  Created On   : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+"""
+
+import sys
+import os
+
+# Add the src/ directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import pytest
+import numpy as np
+import nr5gmodule as mod
+import nr5gbatch as batch
+from nr5gprb import get_nrb, formula_prbs, formula_differences, NRB_TABLE
+
+
+# ---------------------- Table Values ----------------------
+
+@pytest.mark.parametrize("bw, scs, fr, nrb", [
+    (20, 15, "FR1", 106), (100, 30, "FR1", 273), (100, 60, "FR1", 135), (5, 30, "FR1", 11),
+    (100, 60, "FR2-1", 132), (400, 120, "FR2-1", 264), (2000, 960, "FR2-2", 148), (1600, 480, "FR2-2", 248),
+])
+def test_38101_values(bw, scs, fr, nrb):
+    assert get_nrb(bw, scs, fr) == nrb
+    assert mod.get_nr_NumberOfPRBs(bw, scs, fr=fr) == nrb
+
+def test_unknown_combinations():
+    with pytest.raises(ValueError):
+        get_nrb(100, 15, "FR1")                 # 15 kHz stops at 50 MHz
+    with pytest.raises(ValueError):
+        get_nrb(400, 60)
+    assert get_nrb(50, 60) == 65                # no FR given: FR1 before FR2-1
+    assert mod.get_nr_NumberOfPRBs(12, 15) == formula_prbs(12, 15)  # not in 38.101: formula fallback
+
+# ---------------------- Formula Mode / Report ----------------------
+
+def test_formula_mode_and_differences():
+    assert mod.get_nr_NumberOfPRBs(20, 15, mode="formula") == 107
+    differences = formula_differences()
+    assert ("FR1", 15, 20, 106, 107) in differences
+    assert all(formula_prbs(bw, scs) == nrb for (fr, scs, bw), nrb in NRB_TABLE.items()
+               if fr and (fr, scs, bw, nrb, formula_prbs(bw, scs)) not in differences)
+    with pytest.raises(ValueError):
+        mod.get_nr_NumberOfPRBs(20, 15, mode="exact")
+
+# ---------------------- Batch ----------------------
+
+@pytest.mark.parametrize("mode", ["table", "formula"])
+def test_batch_matches_scalar(mode):
+    rng = np.random.default_rng(2026)
+    bw = rng.choice([5, 7.5, 12, 20, 50, 100, 200, 400, 800, 1600, 2000, 3000], 2000)
+    scs = rng.choice([15, 30, 60, 120, 240, 480, 960], 2000)
+    for fr in (None, "FR1", "FR2-1", "FR2-2"):
+        prbs, valid = batch.get_nr_NumberOfPRBs(bw, scs, mode, fr)
+        assert valid.all()
+        assert prbs.tolist() == [mod.get_nr_NumberOfPRBs(b, s, mode, fr) for b, s in zip(bw.tolist(), scs.tolist())]
@@ -0,0 +1,82 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for NR 5G raster enumeration              ###
+###                 ARFCN / GSCN generators and chunks vs. brute force   ###
+###                 over the raster tables                               ###
+###  Created On   : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+"""
+
+import sys
+import os
+
+# Add the src/ directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import types
+import numpy as np
+import nr5gmodule as mod
+import nr5graster as raster
+from nr5gtables import get_tables
+
+
+def _brute_force(spans):
+    return sorted({point for first, step, last in spans for point in range(first, last + 1, step)})
+
+# ---------------------- Channel Raster ----------------------
+
+def test_n78_rasters_per_scs():
+    assert list(mod.get_nr_ArfcnRaster_from_nr_Band("n78", 30)) == list(range(620000, 653333, 2))
+    assert list(mod.get_nr_ArfcnRaster_from_nr_Band("N78", 15)) == list(range(620000, 653334))
+    assert list(mod.get_nr_ArfcnRaster_from_nr_Band("n1", 15, "ul"))[:3] == [384000, 384020, 384040]  # 100 kHz raster
+
+def test_generators_are_lazy():
+    points = mod.get_nr_ArfcnRaster_from_nr_Band("n77")
+    assert isinstance(points, types.GeneratorType)
+    assert next(points) == 620000 and next(points) == 620001
+
+def test_every_band_matches_brute_force():
+    tables = get_tables()
+    for band in tables.bands:
+        for direction in ("", "ul", "dl"):
+            try:
+                spans = raster.channel_raster_spans(band, None, direction)
+            except ValueError:
+                continue
+            expected = _brute_force(spans)
+            assert list(raster.iter_raster_points(spans)) == expected
+            chunks = list(raster.raster_point_chunks(spans, 4096))
+            assert all(len(chunk) == 4096 for chunk in chunks[:-1])
+            assert np.concatenate(chunks).tolist() == expected
+            assert raster.raster_point_count(spans) == len(expected)
+
+def test_sul_band_directions(capsys):
+    assert list(mod.get_nr_ArfcnRaster_from_nr_Band("n80", 15))[:2] == [342000, 342020]   # UL only
+    assert mod.get_nr_ArfcnRaster_from_nr_Band("n80", 15, "dl") == -1
+    assert mod.get_nr_ArfcnRaster_from_nr_Band("x1") == -1
+    assert mod.get_nr_ArfcnRaster_from_nr_Band("n78", chunk_size=0) == -1
+    assert "ENTER VALID" in capsys.readouterr().out
+
+# ---------------------- Sync Raster ----------------------
+
+def test_gscns_match_ssb_candidates():
+    import nr5gssb
+    for band in get_tables().sync_raster:
+        gscn, _, _ = nr5gssb._band_candidates(band)
+        assert list(mod.get_nr_GSCNRaster_from_nr_Band(band)) == np.unique(gscn).tolist()
+
+def test_gscn_per_scs_and_listed_rows(capsys):
+    assert list(mod.get_nr_GSCNRaster_from_nr_Band("n41", 30))[:3] == [6252, 6255, 6258]
+    chunks = list(mod.get_nr_GSCNRaster_from_nr_Band("n263", 480, chunk_size=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 10, 4]
+    assert chunks[0][0] == 24162
+    assert mod.get_nr_GSCNRaster_from_nr_Band("n80") == -1
+    capsys.readouterr()
+
+def test_several_bands():
+    pairs = list(raster.band_raster_chunks(["n78", "n80", "n258"], kind="gscn", chunk_size=100000))
+    assert [band for band, _ in pairs] == ["n78", "n258"]   # n80 (SUL) has no sync raster
+    assert pairs[0][1].tolist() == list(range(7711, 8052))
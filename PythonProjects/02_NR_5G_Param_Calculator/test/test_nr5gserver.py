@@ -0,0 +1,94 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the NR 5G calculator server / client  ###
+###                 Every operation, pipelining, errors and latency      ###
+###  Created On   : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+"""
+
+import sys
+import os
+import json
+import time
+import socket
+import statistics
+
+# Add the src/ directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import pytest
+from nr5gclient import NR5GClient, parse_address
+from nr5gserver import start_in_thread
+from nr5gbatchmode import evaluate_chunk
+
+
+@pytest.fixture(scope="module", params=["unix", "tcp"])
+def server(request, tmp_path_factory):
+    address = str(tmp_path_factory.mktemp("srv") / "calc.sock") if request.param == "unix" else "127.0.0.1:0"
+    server = start_in_thread(address)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server):
+    address = server.server_address
+    if isinstance(address, tuple):
+        address = f"{address[0]}:{address[1]}"
+    return NR5GClient(address)
+
+
+# ---------------------- Protocol ----------------------
+
+def test_every_operation_matches_batch_path(server, records):
+    expected = evaluate_chunk(records)
+    with _client(server) as client:
+        for record, (result, error) in zip(records, expected):
+            response = client.pipeline([record])[0]
+            expected_response = {"error": error} if error else {"result": result}
+            assert response == json.loads(json.dumps(expected_response)), record
+
+def test_call_raises_on_invalid_input(server):
+    with _client(server) as client:
+        assert client.call("ARFCN_TO_FREQ", arfcn=620000) == 3300.0
+        assert client.call("BAND_TO_GSCN_RANGE", band="n78") == [7711, 8051]
+        with pytest.raises(ValueError, match="VALID NR-ARFCN"):
+            client.call("ARFCN_TO_FREQ", arfcn=-1)
+        with pytest.raises(ValueError, match="unknown operation"):
+            client.call("NOPE")
+
+def test_pipelined_requests_keep_order_and_ids(server):
+    requests = [{"id": i, "op": "ARFCN_TO_FREQ", "arfcn": 600000 + i} for i in range(5000)]
+    requests[7] = {"id": 7, "op": "BAND_TO_DUPLEX", "band": "n80"}
+    with _client(server) as client:
+        responses = client.pipeline(requests)
+    assert [r["id"] for r in responses] == list(range(5000))
+    assert responses[7]["result"] == "SUL" and responses[8]["result"] == 3000.12
+
+def test_malformed_lines_get_error_responses(server):
+    family, target = parse_address(server.server_address)
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.connect(target)
+        sock.sendall(b'not json\n[1]\n{"op":"ARFCN_TO_FREQ","arfcn":620000}\n')
+        reader = sock.makefile("rb")
+        lines = [reader.readline() for _ in range(3)]
+    assert b"invalid JSON" in lines[0] and b"expected a JSON object" in lines[1]
+    assert lines[2] == b'{"result": 3300.0}\n'
+
+# ---------------------- Latency ----------------------
+
+def test_median_latency_is_bounded(server):
+    # Typically well under a millisecond on loopback; the bound only catches
+    # regressions such as a per-request import or a Nagle delay
+    with _client(server) as client:
+        client.call("ARFCN_TO_FREQ", arfcn=620000)
+        samples = []
+        for arfcn in range(600000, 600500):
+            start = time.perf_counter()
+            client.call("ARFCN_TO_FREQ", arfcn=arfcn)
+            samples.append(time.perf_counter() - start)
+    median = statistics.median(samples)
+    assert median < 0.02, f"median request latency {median * 1e6:.0f} µs"
@@ -0,0 +1,81 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the NR 5G SSB / sync raster planner   ###
+###                 Fit, k_SSB / offsetToPointA and batch consistency    ###
+###  Created On   : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+"""
+
+import sys
+import os
+
+# Add the src/ directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import numpy as np
+import nr5gmodule as mod
+import nr5gssb
+import nr5gbatch
+
+
+def _fits(position, center_freq, scs, n_rb):
+    # Reference check in MHz, one position at a time
+    point_a = center_freq - 6 * n_rb * scs / 1000
+    ssb_scs = position["ssb_scs"] / 1000
+    return (position["freq"] - 120.5 * ssb_scs >= point_a - scs / 2000 - 1e-9
+            and position["freq"] + 119.5 * ssb_scs <= point_a + (12 * n_rb - 0.5) * scs / 1000 + 1e-9)
+
+
+# ---------------------- Single Carrier ----------------------
+
+def test_n78_carrier_positions():
+    positions = mod.get_nr_SSB_positions(3500.01, 100, 30, "n78")
+    assert len(positions) == 63
+    assert positions[0] == {"gscn": 7815, "freq": 3455.04, "ssb_scs": 30, "k_ssb": 14, "offset_to_point_a": 2}
+    assert all(_fits(p, 3500.01, 30, 273) for p in positions)
+    gscn_low, gscn_high = mod.get_nr_GSCNRange_from_nr_Band("n78")
+    assert all(gscn_low <= p["gscn"] <= gscn_high for p in positions)
+
+def test_k_ssb_and_offset_rebuild_ssb_position():
+    for center, bw, scs, band in ((1845.0, 20, 15, "n3"), (3499.98, 100, 30, "n78"), (28000.08, 100, 120, "n257")):
+        n_rb = mod.get_nr_NumberOfPRBs(bw, scs)
+        point_a = center - 6 * n_rb * scs / 1000
+        fr2 = center > nr5gssb.FR1_MAX_FREQ
+        for p in mod.get_nr_SSB_positions(center, bw, scs, band):
+            k_unit, rb_unit = (scs, 720) if fr2 else (15, 180)
+            sc0 = point_a + (p["offset_to_point_a"] * rb_unit + p["k_ssb"] * k_unit) / 1000
+            assert abs(sc0 + 120 * p["ssb_scs"] / 1000 - p["freq"]) < 1e-6
+            assert 0 <= p["k_ssb"] <= (11 if fr2 else 23)
+
+def test_misaligned_or_invalid_carriers():
+    assert mod.get_nr_SSB_positions(3500.0, 100, 30, "n78") == []   # not on the 15 kHz grid
+    assert mod.get_nr_SSB_positions(3500.01, 5, 30, "n78") == []    # narrower than an SSB
+    assert mod.get_nr_SSB_positions(1720, 20, 15, "n80") == -1      # SUL band: no sync raster
+
+# ---------------------- Batch ----------------------
+
+def test_batch_matches_single_carrier_plans():
+    rng = np.random.default_rng(2026)
+    centers = 3300 + 0.015 * rng.integers(4000, 29000, 40)
+    bands = np.where(np.arange(40) % 2, "n78", "N77")
+    plan = nr5gssb.plan_ssb_batch(centers, 100, 30, bands)
+    assert np.all(np.diff(plan["carrier"]) >= 0)
+    for index, center in enumerate(centers):
+        rows = plan["carrier"] == index
+        single = nr5gssb.plan_ssb(center, 100, 30, bands[index])
+        assert [p["gscn"] for p in single] == plan["gscn"][rows].tolist()
+        assert [p["k_ssb"] for p in single] == plan["k_ssb"][rows].tolist()
+
+def test_interval_count_matches_full_plan():
+    rng = np.random.default_rng(7)
+    for band, first, step, last, scs, bw in (("n78", 620000, 2, 653332, 30, 100), ("n3", 361000, 20, 376000, 15, 20),
+                                             ("n257", 2054167, 2, 2104165, 120, 100)):
+        arfcns = first + step * rng.integers(0, (last - first) // step, 500)
+        centers, _ = nr5gbatch.get_nr_Freq_from_nr_Arfcn(arfcns)
+        plan = nr5gssb.plan_ssb_batch(centers, bw, scs, band)
+        n_rb = mod.get_nr_NumberOfPRBs(bw, scs, fr="FR1" if centers[0] < nr5gssb.FR1_MAX_FREQ else "FR2-1")
+        counts = nr5gssb.count_ssb_positions(centers, scs, band, n_rb)
+        assert counts.tolist() == np.bincount(plan["carrier"], minlength=500).tolist()
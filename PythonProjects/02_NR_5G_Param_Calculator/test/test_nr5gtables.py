@@ -0,0 +1,93 @@
+"""
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the NR 5G raster/band lookup tables   ###
+###                 Cross-checks the table engine against nrarfcn        ###
+###  Created On   : 19-10-2026                                           ###
+###  Framework    : pytest                                               ###
+#############################################################################
+"""
+
+import sys
+import os
+import subprocess
+
+# Add the src/ directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import pytest
+import nrarfcn as NR_5G
+import nr5gmodule as mod
+from nr5gtables import (get_tables, validate_against_nrarfcn, NRRasterTables, load_raw_tables,
+                        load_table_file, write_table_file, tables_equal, TABLE_FILE)
+
+
+# ---------------------- Cross-check against nrarfcn ----------------------
+
+def test_tables_match_nrarfcn():
+    # Every GSCN, every band edge, every band-level query; ARFCNs and the
+    # frequency grid are strided here (run nr5gtables.py for the full sweep)
+    assert validate_against_nrarfcn(arfcn_step=1009, gscn_step=1, freq_step=13.0) == []
+
+def test_overlapping_bands_keep_table_order():
+    assert get_tables().bands_by_frequency(3500) == NR_5G.get_bands_by_frequency(3500)
+    assert get_tables().bands_by_frequency(1710) == NR_5G.get_bands_by_frequency(1710)
+
+# ---------------------- nr5gmodule on the table engine ----------------------
+
+@pytest.mark.parametrize("band", ["n78", "n80", "n29", "n263"])
+def test_band_queries_match_nrarfcn(band):
+    assert mod.get_duplex_mode_from_nr_Band(band) == NR_5G.get_duplex_mode(band)
+    assert mod.get_nr_ArfcnRange_from_nr_Band(band, "dl") == NR_5G.get_nrarfcn_range(band)
+    assert mod.get_nr_Freqrange_from_nr_Band(band, "ul") == NR_5G.get_frequency_range(band, "ul")
+
+@pytest.mark.parametrize("band", ["n0", "n105", "n078", "n256", 78, None])
+def test_invalid_bands_return_minus_one(band):
+    assert mod.get_duplex_mode_from_nr_Band(band) == -1
+    assert mod.get_nr_GSCNRange_from_nr_Band(band) == -1
+
+def test_sul_band_has_no_gscn_range():
+    assert mod.get_nr_GSCNRange_from_nr_Band("n80") == -1
+
+# ---------------------- Binary table file ----------------------
+
+def test_table_file_matches_nrarfcn_build():
+    # The shipped file must be rebuilt (python src/nr5gtables.py --build) when nrarfcn changes
+    built = NRRasterTables(load_raw_tables())
+    loaded = load_table_file()
+    assert tables_equal(built, loaded)
+    assert loaded.raw == built.raw
+
+def test_table_file_round_trip(tmp_path):
+    path = tmp_path / "tables.bin"
+    assert write_table_file(str(path)) == path.stat().st_size
+    assert validate_against_nrarfcn(arfcn_step=100003, gscn_step=97, freq_step=97.0,
+                                    tables=load_table_file(str(path))) == []
+
+def test_table_file_rejects_other_version_and_release(tmp_path):
+    path = tmp_path / "tables.bin"
+    write_table_file(str(path))
+    with pytest.raises(ValueError):
+        load_table_file(str(path), release_3gpp=16)
+    data = bytearray(path.read_bytes())
+    data[8] += 1  # format version
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        load_table_file(str(path))
+    path.write_bytes(b"NR5GTBL\0")
+    with pytest.raises(ValueError):
+        load_table_file(str(path))
+
+def test_cold_start_skips_nrarfcn():
+    # Import + first conversion in a fresh interpreter never loads nrarfcn when
+    # the table file is present (timings: python src/nr5gtables.py --benchmark)
+    src = os.path.join(os.path.dirname(__file__), '..', 'src')
+    check = ("import sys, nr5gmodule\n"
+             "nr5gmodule.get_nr_Freq_from_nr_Arfcn(620000)\n"
+             "print('nrarfcn' not in sys.modules)")
+    for table_file, skipped in ((TABLE_FILE, "True"), (os.path.join(src, "missing.bin"), "False")):
+        env = dict(os.environ, NR5G_TABLE_FILE=table_file)
+        out = subprocess.run([sys.executable, "-c", check], cwd=src, env=env,
+                             capture_output=True, text=True, check=True).stdout.strip()
+        assert out == skipped
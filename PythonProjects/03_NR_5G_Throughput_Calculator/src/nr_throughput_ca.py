@@ -0,0 +1,107 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : 5G NR Carrier Aggregation Throughput                 ###
+###                 Per-carrier model (FR, direction, bandwidth, SCS,    ###
+###                 layers, Qm, duplex, overhead) summed with NumPy,     ###
+###                 plus a batch form for many CA configurations         ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import numpy as np
+try:
+    from .nr_throughput_sweep import CODING_RATE, MAX_NUMEROLOGY, num_prbs, duplex_factor
+except ImportError:
+    from nr_throughput_sweep import CODING_RATE, MAX_NUMEROLOGY, num_prbs, duplex_factor
+
+# Overhead OH per frequency range and direction (formula header in nr_throughput_calculator)
+OVERHEADS = {("FR1", "DL"): 0.14, ("FR1", "UL"): 0.08, ("FR2", "DL"): 0.18, ("FR2", "UL"): 0.10}
+
+# Per-carrier columns used by the vectorized evaluation
+CARRIER_FIELDS = ("channel_bw", "numerology", "num_mimo", "mod_order", "scaling_factor", "overhead", "coding_rate")
+
+# -------------------- Component Carrier --------------------
+
+class ComponentCarrier:
+    """
+    One component carrier. Overhead defaults to the FR / direction value
+    from OVERHEADS and the scaling factor to the duplex mode's (FDD 1.0,
+    TDD 0.76, or a TDD slot pattern's symbol share for the direction);
+    either can be given explicitly.
+    """
+
+    def __init__(self, channel_bw, numerology, num_mimo, mod_order, duplex="FDD", fr="FR1", direction="DL",
+                 overhead=None, coding_rate=CODING_RATE, scaling_factor=None):
+        self.fr = str(fr).strip().upper()
+        self.direction = str(direction).strip().upper()
+        self.duplex = duplex if not isinstance(duplex, str) else duplex.strip().upper()
+        if (self.fr, self.direction) not in OVERHEADS:
+            raise ValueError(f"unknown FR / direction: {fr} {direction} (expected FR1 / FR2, DL / UL)")
+        if not 0 <= numerology <= MAX_NUMEROLOGY:
+            raise ValueError(f"numerology must be 0 - {MAX_NUMEROLOGY}")
+        try:
+            factor = duplex_factor(self.duplex, numerology, self.direction)
+        except ValueError as e:
+            raise ValueError(f"duplex must be FDD / TDD or a TDD pattern: {e}") from None
+        self.channel_bw = channel_bw
+        self.numerology = numerology
+        self.num_mimo = num_mimo
+        self.mod_order = mod_order
+        self.coding_rate = coding_rate
+        self.overhead = OVERHEADS[self.fr, self.direction] if overhead is None else overhead
+        self.scaling_factor = factor if scaling_factor is None else scaling_factor
+
+    def __repr__(self):
+        return (f"ComponentCarrier({self.fr} {self.direction} {self.duplex}, {self.channel_bw} MHz, "
+                f"mu={self.numerology}, {self.num_mimo}x Qm{self.mod_order})")
+
+    def num_prbs(self):
+        return int(num_prbs(self.channel_bw, self.numerology))
+
+    def throughput(self):
+        """This carrier's throughput (Mbps); the calculator formula with J = 1 and Ts = 1e-3 / (14 x 2^mu)"""
+        symbol_duration = 0.001 / (14 * 2 ** self.numerology)
+        return (self.num_mimo * self.mod_order * self.scaling_factor * self.coding_rate *
+                ((self.num_prbs() * 12) / symbol_duration) * (1 - self.overhead)) / 1_000_000
+
+# -------------------- Vectorized Evaluation --------------------
+
+def carrier_rates(channel_bw, numerology, num_mimo, mod_order, scaling_factor, overhead, coding_rate=CODING_RATE):
+    """Per-carrier throughput arrays (Mbps) from equal-length columns; NaN where a carrier has no PRB"""
+    prbs = num_prbs(channel_bw, numerology)
+    per_second = prbs * 12 * 14 * 1000.0 * 2.0 ** np.asarray(numerology, dtype=np.float64)
+    rates = (np.asarray(num_mimo, dtype=np.float64) * np.asarray(mod_order, dtype=np.float64)
+             * np.asarray(scaling_factor, dtype=np.float64) * np.asarray(coding_rate, dtype=np.float64)
+             * per_second * (1 - np.asarray(overhead, dtype=np.float64)) / 1_000_000)
+    return np.where(prbs > 0, rates, np.nan)
+
+def _carrier(carrier):
+    return carrier if isinstance(carrier, ComponentCarrier) else ComponentCarrier(**carrier)
+
+def carrier_columns(carriers):
+    """CARRIER_FIELDS arrays for a list of ComponentCarrier objects (or keyword dicts)"""
+    carriers = [_carrier(carrier) for carrier in carriers]
+    return {field: np.array([getattr(carrier, field) for carrier in carriers], dtype=np.float64)
+            for field in CARRIER_FIELDS}
+
+def ca_throughput(carriers):
+    """
+    (total, per-carrier) throughput in Mbps of one CA configuration: each
+    carrier with its own parameters, summed. NaN total if a carrier has no PRB.
+    """
+    rates = carrier_rates(**carrier_columns(carriers))
+    return float(rates.sum()), rates
+
+def ca_throughput_batch(configs):
+    """
+    Total throughput (Mbps) of many CA configurations at once. `configs` is
+    a list of carrier lists; all carriers are evaluated in one vectorized
+    pass and summed per configuration with np.bincount. Returns an array
+    with one total per configuration (NaN where a carrier has no PRB, 0 for
+    an empty configuration).
+    """
+    lengths = [len(carriers) for carriers in configs]
+    columns = carrier_columns([carrier for carriers in configs for carrier in carriers])
+    owner = np.repeat(np.arange(len(configs)), lengths)
+    return np.bincount(owner, weights=carrier_rates(**columns), minlength=len(configs))
@@ -19,10 +19,11 @@ V - MIMO LAYERS
 Qm - MODULATION ORDER
 f - SCALING FACTOR 
 FDD = 1 , TDD = 0.76
+TDD SLOT PATTERN (e.g. DDDSU 10:2:2) = DL / UL SYMBOL SHARE
 Rmax - CODING RATE (0.93) 
 Nprb - Number of PRBs 
 Ts - OFDM SYMBOL DURATION
-Ts = 0.001 / (14 * SubcarrierSpacing)
+Ts = 0.001 / (14 * 2^µ), 2^µ = SubcarrierSpacing / 15
 OH - OVERHEAD
 [0.14] FR1 DL, [0.08] FR1 UL, [0.18] FR2 DL, [0.10] FR2 UL
 
@@ -39,6 +40,7 @@ class NRThroughputCalculator:
         self.mod_order = 0
         self.band_type = ''
         self.scaling_factor = 0.0
+        self.tdd_pattern = None
         self.coding_rate = 0.93
         self.numerology = 0
         self.channel_bw = 0
@@ -56,7 +58,8 @@ class NRThroughputCalculator:
         return int(total_prbs) - 4
 
     def calculate_symbol_duration(self, subcarrier_spacing):
-        return 0.001 / (14 * subcarrier_spacing)
+        # 14 symbols per slot, 2^µ = SCS / 15 kHz slots per ms (38.306)
+        return 0.001 / (14 * (subcarrier_spacing / 15))
 
     def calculate_throughput(self):
         numerator = self.num_cc * (
@@ -66,6 +69,50 @@ class NRThroughputCalculator:
         self.throughput = numerator / 1_000_000
         return self.throughput
 
+    def apply_tdd_pattern(self, pattern, direction="DL"):
+        """
+        TDD with a slot pattern ("DDDSU 10:2:2" or a TddPattern): the scaling
+        factor becomes the pattern's DL / UL symbol share at self.numerology.
+        """
+        try:
+            from .nr_throughput_tdd import tdd_scaling_factor
+        except ImportError:
+            from nr_throughput_tdd import tdd_scaling_factor
+        self.scaling_factor = tdd_scaling_factor(pattern, self.numerology, direction)
+        self.band_type = "TDD"
+        self.tdd_pattern = pattern
+        return self.scaling_factor
+
+    def calculate_ca_throughput(self, carriers):
+        """
+        Carrier aggregation with a parameter set per carrier: the sum of each
+        ComponentCarrier's rate instead of num_cc x one carrier's rate.
+        """
+        try:
+            from .nr_throughput_ca import ca_throughput
+        except ImportError:
+            from nr_throughput_ca import ca_throughput
+        total, _ = ca_throughput(carriers)
+        self.throughput = total
+        return self.throughput
+
+    def sweep(self, **axes):
+        """
+        Throughput over a grid of parameter values (see nr_throughput_sweep.sweep_throughput).
+        Parameters not passed (num_cc, num_mimo, mod_order, numerology, channel_bw,
+        duplex, overhead) are taken from this calculator.
+        """
+        params = {"num_cc": self.num_cc, "num_mimo": self.num_mimo, "mod_order": self.mod_order,
+                  "numerology": self.numerology, "channel_bw": self.channel_bw,
+                  "duplex": self.tdd_pattern or self.band_type or "FDD", "overhead": self.overhead,
+                  "coding_rate": self.coding_rate}
+        params.update(axes)
+        try:
+            from .nr_throughput_sweep import sweep_throughput
+        except ImportError:
+            from nr_throughput_sweep import sweep_throughput
+        return sweep_throughput(**params)
+
     def _show_image(self):
         try:
             image_path = os.path.join(os.path.dirname(__file__), "nr_throughput_formula.jpg")
@@ -84,6 +131,8 @@ class NRThroughputCalculator:
         print(f"{'MIMO LAYERS':<24}: {self.num_mimo}")
         print(f"{'MODULATION ORDER':<24}: {self.mod_order}")
         print(f"{'SCALING FACTOR':<24}: {self.scaling_factor}")
+        if self.tdd_pattern:
+            print(f"{'TDD PATTERN':<24}: {self.tdd_pattern}")
         print(f"{'CODING RATE':<24}: {self.coding_rate}")
         print(f"{'SUBCARRIER SPACING':<24}: {self.subcarrier_spacing} KHz")
         print(f"{'CHANNEL BANDWIDTH':<24}: {self.channel_bw} MHz")
@@ -116,6 +165,17 @@ def get_band_type():
             return value
         print("⚠️ Invalid band type. Please enter 'FDD' or 'TDD'.")
 
+def get_tdd_pattern(calc):
+    while True:
+        value = input("ENTER TDD PATTERN (e.g. DDDSU 10:2:2, blank for 0.76): ").strip()
+        if value == "":
+            return
+        try:
+            calc.apply_tdd_pattern(value.upper())
+            return
+        except ValueError as e:
+            print(f"⚠️ {e}")
+
 # -------------------- Program Entry Point --------------------
 
 def main():
@@ -137,6 +197,8 @@ def main():
     calc.channel_bw = get_int("ENTER CHANNEL BANDWIDTH (MHz): ")
     calc.num_prbs = calc.get_num_prbs(calc.channel_bw, calc.subcarrier_spacing)
     calc.symbol_duration = calc.calculate_symbol_duration(calc.subcarrier_spacing)
+    if calc.band_type == "TDD":
+        get_tdd_pattern(calc)
 
     calc.overhead = 0.14  # Default for FR1 DL
 
@@ -0,0 +1,228 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : 5G NR Band Combination Throughput Scoring            ###
+###                 Peak DL / UL throughput of UE capability band        ###
+###                 combinations (NRLogAnalyzer format), evaluated in    ###
+###                 chunks and ranked                                    ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import re
+import json
+from functools import lru_cache
+import numpy as np
+import nrarfcn as NR_5G
+try:
+    from .nr_throughput_ca import carrier_rates, OVERHEADS
+    from .nr_throughput_sweep import CODING_RATE, duplex_factor
+except ImportError:
+    from nr_throughput_ca import carrier_rates, OVERHEADS
+    from nr_throughput_sweep import CODING_RATE, duplex_factor
+
+# Carrier assumptions per (FR, duplex) when a band has no entry of its own.
+# SDL bands use the FDD downlink values, SUL bands the FDD uplink values.
+DEFAULT_ASSUMPTIONS = {
+    ("FR1", "FDD"): {"channel_bw": 20, "scs": 15, "dl_mimo": 4, "ul_mimo": 1, "dl_mod_order": 8, "ul_mod_order": 6},
+    ("FR1", "TDD"): {"channel_bw": 100, "scs": 30, "dl_mimo": 4, "ul_mimo": 1, "dl_mod_order": 8, "ul_mod_order": 6},
+    ("FR2", "TDD"): {"channel_bw": 100, "scs": 120, "dl_mimo": 2, "ul_mimo": 2, "dl_mod_order": 6, "ul_mod_order": 6},
+}
+ASSUMPTION_KEYS = {"channel_bw", "scs", "dl_mimo", "ul_mimo", "dl_mod_order", "ul_mod_order", "dl_overhead", "ul_overhead",
+                   "tdd_pattern"}
+
+FR1_MAX_MHZ = 7125
+CHUNK_SIZE = 4096
+RANK_KEYS = ("dl", "ul", "total")
+
+# "bandNR: 78" (NRLogAnalyzer), "n78" or "78"
+BAND_TOKEN = re.compile(r"(?:bandNR:\s*|n)?(\d+)", re.IGNORECASE)
+COMBO_PREFIX = re.compile(r"^\s*Combo\s+\d+\s*:", re.IGNORECASE)
+
+# -------------------- Bands --------------------
+
+def parse_combo(combo):
+    """
+    Band numbers of one combination: a list as produced by
+    NRLogAnalyzer.extract_band_combinations (["bandNR: 41", "bandNR: 78"]),
+    a list of ints, or a text line ("Combo 1: bandNR: 41, bandNR: 78", "n41+n78").
+    """
+    if isinstance(combo, str):
+        tokens = BAND_TOKEN.findall(COMBO_PREFIX.sub("", combo))
+    else:
+        tokens = []
+        for item in combo:
+            found = BAND_TOKEN.fullmatch(str(item).strip())
+            if not found:
+                raise ValueError(f"not a band: {item!r}")
+            tokens.append(found.group(1))
+    if not tokens:
+        raise ValueError("empty band combination")
+    return tuple(int(token) for token in tokens)
+
+@lru_cache(maxsize=None)
+def band_info(band):
+    """(FR, duplex) of an NR band, duplex one of FDD / TDD / SDL / SUL"""
+    duplex = NR_5G.get_duplex_mode(band)
+    low, _ = NR_5G.get_frequency_range(band)
+    return ("FR1" if low < FR1_MAX_MHZ else "FR2"), duplex
+
+def band_assumptions(band, assumptions=None):
+    """Carrier parameters for a band: DEFAULT_ASSUMPTIONS overlaid with assumptions[band]"""
+    fr, duplex = band_info(band)
+    settings = dict(DEFAULT_ASSUMPTIONS[fr, "FDD" if duplex in ("SDL", "SUL") else duplex])
+    settings.update((assumptions or {}).get(band, {}))
+    unknown = set(settings) - ASSUMPTION_KEYS
+    if unknown:
+        raise ValueError(f"n{band}: unknown assumption {', '.join(sorted(unknown))}")
+    return fr, duplex, settings
+
+def load_assumptions(path):
+    """Per-band assumptions from JSON: {"n78": {"channel_bw": 100, "scs": 30}, "3": {...}}"""
+    with open(path, "r", encoding="utf-8") as handle:
+        raw = json.load(handle)
+    return {parse_combo([key])[0]: values for key, values in raw.items()}
+
+def band_rates(bands, assumptions=None):
+    """
+    Peak DL and UL throughput (Mbps) of one carrier on each band, as two
+    arrays. SDL bands have no uplink and SUL bands no downlink (rate 0).
+    """
+    columns = {"channel_bw": [], "numerology": [], "num_mimo": [], "mod_order": [],
+               "scaling_factor": [], "overhead": []}
+    for direction in ("dl", "ul"):
+        for band in bands:
+            fr, duplex, settings = band_assumptions(band, assumptions)
+            scs = settings["scs"]
+            if scs not in (15, 30, 60, 120, 240):
+                raise ValueError(f"n{band}: SCS must be 15 / 30 / 60 / 120 / 240 kHz, got {scs}")
+            active = not ((duplex == "SDL" and direction == "ul") or (duplex == "SUL" and direction == "dl"))
+            columns["channel_bw"].append(settings["channel_bw"])
+            numerology = int(scs // 15).bit_length() - 1
+            columns["numerology"].append(numerology)
+            columns["num_mimo"].append(settings[f"{direction}_mimo"] if active else 0)
+            columns["mod_order"].append(settings[f"{direction}_mod_order"])
+            mode = settings.get("tdd_pattern", "TDD") if duplex == "TDD" else "FDD"
+            columns["scaling_factor"].append(duplex_factor(mode, numerology, direction))
+            columns["overhead"].append(settings.get(f"{direction}_overhead", OVERHEADS[fr, direction.upper()]))
+    rates = carrier_rates(coding_rate=CODING_RATE, **{name: np.asarray(values) for name, values in columns.items()})
+    return rates[:len(bands)], rates[len(bands):]
+
+# -------------------- Scoring --------------------
+
+def _top_sum(owner, values, lengths, count):
+    # Per-combination sum of the `count` largest values (all of them when count is None)
+    if count is None:
+        return np.bincount(owner, weights=values, minlength=len(lengths))
+    order = np.lexsort((-values, owner))
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    keep = np.arange(len(order)) - starts[owner[order]] < count
+    return np.bincount(owner[order][keep], weights=values[order][keep], minlength=len(lengths))
+
+def _score_chunk(task):
+    combos, assumptions, max_ul_carriers = task
+    parsed, errors = [], []
+    for combo in combos:
+        try:
+            bands = parse_combo(combo)
+            for band in bands:
+                band_info(band)
+            parsed.append(bands)
+            errors.append("")
+        except ValueError as e:
+            parsed.append(())
+            errors.append(str(e))
+    unique = sorted({band for bands in parsed for band in bands})
+    dl_rates, ul_rates = band_rates(unique, assumptions) if unique else (np.empty(0), np.empty(0))
+
+    # Every carrier of the chunk is a lookup into the per-band rate table
+    lengths = np.array([len(bands) for bands in parsed], dtype=np.int64)
+    position = {band: index for index, band in enumerate(unique)}
+    carriers = np.array([position[band] for bands in parsed for band in bands], dtype=np.int64)
+    owner = np.repeat(np.arange(len(parsed)), lengths)
+    dl = _top_sum(owner, dl_rates[carriers], lengths, None)
+    ul = _top_sum(owner, ul_rates[carriers], lengths, max_ul_carriers)
+    dl[lengths == 0] = np.nan
+    ul[lengths == 0] = np.nan
+    return parsed, dl, ul, errors
+
+def _map_chunks(tasks, workers):
+    if workers <= 1:
+        yield from map(_score_chunk, tasks)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_score_chunk, tasks)
+
+def score_combos(combos, assumptions=None, max_ul_carriers=1, chunk_size=CHUNK_SIZE, workers=1):
+    """
+    Peak DL / UL throughput of every band combination, in input order, as
+    dicts {"combo", "bands", "dl_mbps", "ul_mbps", "error"}.
+
+    DL aggregates one carrier per listed band; UL aggregates the
+    `max_ul_carriers` best uplink carriers (None = all). Combinations are
+    scored in chunks of `chunk_size`, each chunk one vectorized pass over
+    its distinct bands; workers > 1 spreads the chunks over processes.
+    Combinations with an unknown band get NaN and an error message.
+    """
+    combos = list(combos)
+    tasks = [(combos[start:start + chunk_size], assumptions, max_ul_carriers)
+             for start in range(0, len(combos), chunk_size)]
+    records = []
+    for parsed, dl, ul, errors in _map_chunks(tasks, workers):
+        for bands, dl_mbps, ul_mbps, error in zip(parsed, dl.tolist(), ul.tolist(), errors):
+            name = str(combos[len(records)]).strip() if error else "+".join(f"n{band}" for band in bands)
+            records.append({"combo": name, "bands": bands, "dl_mbps": dl_mbps, "ul_mbps": ul_mbps, "error": error})
+    return records
+
+def rank_combos(combos, by="dl", top=None, **options):
+    """
+    score_combos() records ordered best first by "dl", "ul" or "total"
+    (ties broken by the other direction), each with its "rank" (1 = best).
+    Failed combinations come last. `options` go to score_combos.
+    """
+    if by not in RANK_KEYS:
+        raise ValueError(f"rank by one of {', '.join(RANK_KEYS)}")
+    records = score_combos(combos, **options)
+    dl = np.nan_to_num(np.array([record["dl_mbps"] for record in records], dtype=np.float64), nan=-np.inf)
+    ul = np.nan_to_num(np.array([record["ul_mbps"] for record in records], dtype=np.float64), nan=-np.inf)
+    keys = {"dl": (-ul, -dl), "ul": (-dl, -ul), "total": (-dl, -(dl + ul))}[by]
+    order = np.lexsort(keys)
+    ranked = [records[index] for index in order[:top]]
+    for rank, record in enumerate(ranked, 1):
+        record["rank"] = rank
+    return ranked
+
+# -------------------- File Input --------------------
+
+def load_combos(path):
+    """
+    Band combinations from a file: JSON (a list of band lists, as
+    extract_band_combinations collects them) or text with one
+    combination per line, e.g. as print_band_combinations prints them.
+    """
+    with open(path, "r", encoding="utf-8") as handle:
+        if path.lower().endswith(".json"):
+            return json.load(handle)
+        return [line for line in handle if BAND_TOKEN.search(COMBO_PREFIX.sub("", line))]
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Rank UE capability band combinations by peak throughput")
+    parser.add_argument("combos", help="Combination file (.json list of band lists, or one combination per line)")
+    parser.add_argument("--assumptions", help="JSON per-band assumptions (channel_bw, scs, dl/ul_mimo, dl/ul_mod_order)")
+    parser.add_argument("--by", choices=RANK_KEYS, default="dl", help="Ranking key (default: dl)")
+    parser.add_argument("--top", type=int, help="Show only the best N combinations")
+    parser.add_argument("--ul-carriers", type=int, default=1, help="Uplink carriers per combination (default: 1)")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1)")
+    args = parser.parse_args()
+
+    ranked = rank_combos(load_combos(args.combos), by=args.by, top=args.top,
+                         assumptions=load_assumptions(args.assumptions) if args.assumptions else None,
+                         max_ul_carriers=args.ul_carriers, workers=args.workers)
+    print(f"{'RANK':<6}{'COMBINATION':<32}{'DL (Mbps)':>12}{'UL (Mbps)':>12}")
+    for record in ranked:
+        if record["error"]:
+            print(f"{record['rank']:<6}{record['combo'][:31]:<32}{'':>12}{'':>12}  ⚠️ {record['error']}")
+        else:
+            print(f"{record['rank']:<6}{record['combo']:<32}{record['dl_mbps']:>12.1f}{record['ul_mbps']:>12.1f}")
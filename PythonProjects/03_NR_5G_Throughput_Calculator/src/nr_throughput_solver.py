@@ -0,0 +1,155 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : 5G NR Throughput Inverse Solver                      ###
+###                 Cheapest configurations (CC, layers, Qm, bandwidth,  ###
+###                 numerology) reaching a target throughput, as a       ###
+###                 Pareto front                                         ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import numpy as np
+try:
+    from .nr_throughput_sweep import SCALING_FACTORS, CODING_RATE, num_prbs, duplex_factor
+    from .nr_throughput_ca import OVERHEADS
+    from .nr_throughput_tdd import parse_pattern
+except ImportError:
+    from nr_throughput_sweep import SCALING_FACTORS, CODING_RATE, num_prbs, duplex_factor
+    from nr_throughput_ca import OVERHEADS
+    from nr_throughput_tdd import parse_pattern
+
+# Searched parameters; all but numerology are resources the throughput grows with
+RESOURCES = ("num_cc", "num_mimo", "mod_order", "channel_bw")
+
+# Default search ranges per frequency range
+STANDARD_RANGES = {
+    "FR1": {"num_cc": range(1, 17), "num_mimo": range(1, 9), "mod_order": (2, 4, 6, 8),
+            "channel_bw": (5, 10, 15, 20, 25, 30, 40, 50, 60, 70, 80, 90, 100), "numerology": (0, 1, 2)},
+    "FR2": {"num_cc": range(1, 17), "num_mimo": range(1, 5), "mod_order": (2, 4, 6, 8),
+            "channel_bw": (50, 100, 200, 400), "numerology": (2, 3)},
+}
+
+# Cost per unit of each resource
+DEFAULT_WEIGHTS = {"num_cc": 10.0, "num_mimo": 5.0, "mod_order": 1.0, "channel_bw": 0.1}
+
+# Largest transmission bandwidth of one carrier (38.101)
+MAX_PRBS = 275
+
+# -------------------- Solver --------------------
+
+def _factor(duplex, numerology, direction):
+    try:
+        return duplex_factor(duplex, numerology, direction)
+    except ValueError:
+        return np.nan
+
+def _values(name, values):
+    array = np.unique(np.asarray(list(values) if not np.isscalar(values) else [values], dtype=np.float64))
+    if not len(array) or array.min() < (0 if name == "numerology" else 1e-9):
+        raise ValueError(f"{name} must be a non-empty set of positive values")
+    return array
+
+def pareto_configs(target, fr="FR1", direction="DL", duplex="FDD", scaling_factor=None, overhead=None,
+                   coding_rate=CODING_RATE, weights=None, max_prbs=MAX_PRBS, **ranges):
+    """
+    Configurations reaching `target` Mbps that are Pareto-minimal in
+    (num_cc, num_mimo, mod_order, channel_bw): none can give up any of the
+    four without falling short. Returned as dicts, cheapest first, with
+    their throughput and weighted cost (sum of weight x value).
+
+    `ranges` restricts the allowed values of num_cc, num_mimo, mod_order,
+    channel_bw and numerology (defaults: STANDARD_RANGES[fr]); carriers
+    with more than `max_prbs` PRBs are not allowed. Overhead and scaling
+    factor default to the FR / direction and duplex values; duplex may be
+    a TDD slot pattern ("DDDSU 10:2:2"), which rules out numerologies its
+    period does not fit. An empty list means the target cannot be reached.
+    """
+    fr, direction, duplex = fr.upper(), direction.upper(), duplex.upper()
+    if (fr, direction) not in OVERHEADS:
+        raise ValueError("fr / direction must be FR1 / FR2, DL / UL")
+    if duplex not in SCALING_FACTORS:
+        parse_pattern(duplex)
+    unknown = set(ranges) - set(RESOURCES) - {"numerology"}
+    if unknown:
+        raise ValueError(f"not a solver parameter: {', '.join(sorted(unknown))}")
+    if not target > 0:
+        raise ValueError("target throughput must be positive")
+    weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+    space = {name: _values(name, ranges.get(name, STANDARD_RANGES[fr][name])) for name in (*RESOURCES, "numerology")}
+    mu, bw = space["numerology"].astype(np.int64), space["channel_bw"]
+    if scaling_factor is None:
+        scaling_factor = np.array([_factor(duplex, numerology, direction) for numerology in mu.tolist()])[:, None]
+    overhead = OVERHEADS[fr, direction] if overhead is None else overhead
+
+    # One carrier at one layer and Qm = 1, per (numerology, bandwidth); NaN where not allowed
+    prbs = num_prbs(bw[None, :], mu[:, None])
+    unit = (prbs * 12 * 14 * 1000.0 * (2.0 ** mu)[:, None] * scaling_factor * coding_rate * (1 - overhead) / 1_000_000)
+    unit = np.where((prbs > 0) & (prbs <= max_prbs), unit, np.nan)
+
+    # Throughput grows with CC x layers x Qm and, per numerology, with bandwidth:
+    # the smallest bandwidth for each multiplier is a binary search
+    multiplier = (space["num_cc"][:, None, None] * space["num_mimo"][None, :, None] * space["mod_order"][None, None, :])
+    needed = target / multiplier
+    best_bw = np.full(multiplier.shape, np.inf)
+    best_mu = np.zeros(multiplier.shape, dtype=np.int64)
+    for row, numerology in enumerate(mu):
+        allowed = np.flatnonzero(~np.isnan(unit[row]))
+        if not len(allowed):
+            continue
+        position = np.searchsorted(unit[row, allowed], needed, side="left")
+        reached = position < len(allowed)
+        candidate = np.where(reached, bw[allowed[np.minimum(position, len(allowed) - 1)]], np.inf)
+        better = candidate < best_bw
+        best_bw[better] = candidate[better]
+        best_mu[better] = numerology
+
+    # best_bw never grows along an axis, so a configuration is dominated exactly
+    # when its predecessor along some axis already manages the same bandwidth
+    front = np.isfinite(best_bw)
+    for axis in range(3):
+        previous = np.concatenate([np.full_like(np.take(best_bw, [0], axis=axis), np.inf),
+                                   np.take(best_bw, range(best_bw.shape[axis] - 1), axis=axis)], axis=axis)
+        front &= best_bw < previous
+
+    configs = []
+    for a, b, q in zip(*np.nonzero(front)):
+        config = {"num_cc": int(space["num_cc"][a]), "num_mimo": int(space["num_mimo"][b]),
+                  "mod_order": int(space["mod_order"][q]), "channel_bw": best_bw[a, b, q].item(),
+                  "numerology": int(best_mu[a, b, q])}
+        row, column = int(np.flatnonzero(mu == config["numerology"])[0]), int(np.flatnonzero(bw == config["channel_bw"])[0])
+        config["throughput"] = float(multiplier[a, b, q] * unit[row, column])
+        config["cost"] = float(sum(weights[name] * config[name] for name in RESOURCES))
+        configs.append(config)
+    configs.sort(key=lambda config: (config["cost"], -config["throughput"]))
+    return configs
+
+def cheapest_config(target, **options):
+    """The lowest-cost configuration reaching `target` Mbps, or None (see pareto_configs)"""
+    configs = pareto_configs(target, **options)
+    return configs[0] if configs else None
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Cheapest NR configurations reaching a target throughput")
+    parser.add_argument("target", type=float, help="Target throughput (Mbps)")
+    parser.add_argument("--fr", choices=("FR1", "FR2"), default="FR1")
+    parser.add_argument("--direction", choices=("DL", "UL"), default="DL")
+    parser.add_argument("--duplex", default="FDD", help="FDD, TDD or a TDD slot pattern, e.g. \"DDDSU 10:2:2\"")
+    parser.add_argument("--max-cc", type=int, help="Largest number of component carriers")
+    parser.add_argument("--max-mimo", type=int, help="Largest number of MIMO layers")
+    parser.add_argument("--top", type=int, default=10, help="Show the N cheapest front configurations (default: 10)")
+    args = parser.parse_args()
+
+    limits = {}
+    if args.max_cc:
+        limits["num_cc"] = range(1, args.max_cc + 1)
+    if args.max_mimo:
+        limits["num_mimo"] = range(1, args.max_mimo + 1)
+    front = pareto_configs(args.target, fr=args.fr, direction=args.direction, duplex=args.duplex, **limits)
+    if not front:
+        print(f"⚠️ {args.target} Mbps is not reachable within the allowed ranges")
+    print(f"{'CC':>4}{'MIMO':>6}{'Qm':>4}{'BW (MHz)':>10}{'SCS (KHz)':>11}{'Mbps':>10}{'COST':>8}")
+    for config in front[:args.top]:
+        print(f"{config['num_cc']:>4}{config['num_mimo']:>6}{config['mod_order']:>4}{config['channel_bw']:>10g}"
+              f"{15 * 2 ** config['numerology']:>11}{config['throughput']:>10.1f}{config['cost']:>8.1f}")
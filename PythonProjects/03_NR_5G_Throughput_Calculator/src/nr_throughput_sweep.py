@@ -0,0 +1,215 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : 5G NR Throughput Parameter Sweep                     ###
+###                 38.306 throughput over the Cartesian product of      ###
+###                 parameter axes with NumPy broadcasting, returned as  ###
+###                 a labeled result grid                                ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import numpy as np
+try:
+    from .nr_throughput_tdd import parse_pattern, tdd_scaling_factor
+except ImportError:
+    from nr_throughput_tdd import parse_pattern, tdd_scaling_factor
+
+# Result dimensions, in this order (parameters given as scalars are not dimensions)
+SWEEP_AXES = ("num_cc", "num_mimo", "mod_order", "numerology", "channel_bw", "duplex", "overhead")
+
+# Scaling factor f per duplex mode, as in the interactive calculator; a TDD
+# slot pattern ("DDDSU 10:2:2") in place of the mode uses its symbol share
+SCALING_FACTORS = {"FDD": 1.0, "TDD": 0.76}
+
+CODING_RATE = 0.93
+OVERHEAD = 0.14
+MAX_NUMEROLOGY = 4
+
+# -------------------- Labeled Result --------------------
+
+class ThroughputSweep:
+    """
+    Throughput grid in Mbps. `values` has one dimension per entry of `axes`
+    ({name: coordinate array}, in SWEEP_AXES order); parameters that were
+    given as scalars are kept in `fixed`. Points where the bandwidth holds
+    no PRB at that numerology are NaN.
+    """
+
+    def __init__(self, values, axes, fixed):
+        self.values = values
+        self.axes = axes
+        self.fixed = fixed
+
+    @property
+    def dims(self):
+        return tuple(self.axes)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    @property
+    def size(self):
+        return self.values.size
+
+    def __repr__(self):
+        axes = ", ".join(f"{name}: {len(coords)}" for name, coords in self.axes.items())
+        return f"ThroughputSweep({axes}; {self.size} points, fixed {self.fixed})"
+
+    def _position(self, name, coordinate):
+        matches = np.flatnonzero(self.axes[name] == coordinate)
+        if not len(matches):
+            raise KeyError(f"{coordinate!r} is not on the {name} axis")
+        return int(matches[0])
+
+    def sel(self, **coords):
+        """
+        Sub-grid by coordinate: a scalar picks one value and drops the axis
+        (it moves to `fixed`), a list keeps the axis with those values.
+        """
+        index, axes, fixed = [], {}, dict(self.fixed)
+        for name, coordinates in self.axes.items():
+            if name not in coords:
+                index.append(slice(None))
+                axes[name] = coordinates
+            elif np.ndim(coords[name]) == 0:
+                index.append(self._position(name, coords[name]))
+                fixed[name] = coordinates[index[-1]].item()
+            else:
+                positions = [self._position(name, value) for value in coords[name]]
+                index.append(positions)
+                axes[name] = coordinates[positions]
+        unknown = set(coords) - set(self.axes)
+        if unknown:
+            raise KeyError(f"not a sweep axis: {', '.join(sorted(unknown))}")
+        # One axis at a time: NumPy would pair up several list indices instead of crossing them
+        values = self.values
+        for dimension, item in reversed(list(enumerate(index))):
+            values = values[(slice(None),) * dimension + (item,)]
+        return ThroughputSweep(values, axes, fixed)
+
+    def point(self, index):
+        """Parameters and throughput of one grid point, index = tuple or flat index"""
+        if np.ndim(index) == 0:
+            index = np.unravel_index(index, self.shape)
+        record = dict(self.fixed)
+        for (name, coordinates), position in zip(self.axes.items(), index):
+            record[name] = coordinates[position].item()
+        record["throughput"] = float(self.values[tuple(index)])
+        return record
+
+    def best(self, count=1):
+        """The `count` highest-throughput points, best first"""
+        flat = np.nan_to_num(self.values.ravel(), nan=-np.inf)
+        count = min(count, flat.size)
+        top = np.argpartition(flat, flat.size - count)[flat.size - count:]
+        return [self.point(index) for index in top[np.argsort(flat[top])[::-1]]]
+
+    def to_records(self):
+        """Yields one dict per grid point (parameters + throughput), in C order"""
+        for index in np.ndindex(*self.shape):
+            yield self.point(index)
+
+# -------------------- Sweep --------------------
+
+def _axis(name, values, dtype):
+    array = np.atleast_1d(np.asarray(values, dtype=dtype))
+    if array.ndim != 1 or not len(array):
+        raise ValueError(f"{name} must be a scalar or a non-empty 1-D sequence")
+    return array
+
+def duplex_factor(duplex, numerology, direction="DL"):
+    """Scaling factor f of FDD / TDD or of a TDD slot pattern at the numerology"""
+    if duplex in SCALING_FACTORS:
+        return SCALING_FACTORS[duplex]
+    return tdd_scaling_factor(duplex, int(numerology), direction)
+
+def _duplex_axis(values):
+    modes = np.atleast_1d(np.asarray(values, dtype=str))
+    modes = np.char.upper(np.char.strip(modes))
+    if modes.ndim != 1:
+        raise ValueError("duplex must be a scalar or a 1-D sequence")
+    for mode in set(modes.tolist()) - set(SCALING_FACTORS):
+        try:
+            parse_pattern(mode)
+        except ValueError:
+            raise ValueError(f"duplex must be FDD / TDD or a TDD pattern, got {mode}") from None
+    return modes
+
+def _factor_grid(duplex, numerology, direction):
+    # [numerology, duplex] scaling factors; NaN where a pattern's period is not valid at that numerology
+    grid = np.empty((len(numerology), len(duplex)))
+    for row, mu in enumerate(numerology.tolist()):
+        for column, mode in enumerate(duplex.tolist()):
+            try:
+                grid[row, column] = duplex_factor(mode, mu, direction)
+            except ValueError:
+                grid[row, column] = np.nan
+    return grid
+
+def num_prbs(channel_bw, numerology):
+    """Elementwise PRB counts, as get_num_prbs: int(BW x 1000 / SCS / 12) - 4"""
+    scs = 15 * 2 ** np.asarray(numerology, dtype=np.int64)
+    return np.floor(np.asarray(channel_bw, dtype=np.float64) * 1000 / scs / 12).astype(np.int64) - 4
+
+def prb_grid(numerology, channel_bw):
+    """[numerology, bandwidth] PRB counts"""
+    return num_prbs(channel_bw[None, :], numerology[:, None])
+
+def sweep_throughput(num_cc, num_mimo, mod_order, numerology, channel_bw, duplex="FDD",
+                     overhead=OVERHEAD, coding_rate=CODING_RATE, dtype=np.float64, direction="DL"):
+    """
+    38.306 throughput (Mbps) for every combination of the given values:
+
+        J x V x Qm x f x Rmax x (N_PRB x 12 / Ts) x (1 - OH) / 1e6,  Ts = 1e-3 / (14 x 2^mu)
+
+    Each parameter is a scalar or a 1-D sequence; sequences become result
+    axes. The formula is a product of one factor per axis (PRBs and Ts
+    share the numerology x bandwidth factor), so the two halves of the
+    grid are multiplied out separately and the full grid is written by a
+    single broadcast multiply into the result array. dtype=np.float32
+    halves the memory of very large grids.
+
+    Duplex values are FDD, TDD or TDD slot patterns ("DDDSU 10:2:2"); a
+    pattern's f is its `direction` symbol share (NaN at numerologies
+    where its period is not a TDD periodicity).
+    """
+    given = {"num_cc": num_cc, "num_mimo": num_mimo, "mod_order": mod_order, "numerology": numerology,
+             "channel_bw": channel_bw, "duplex": duplex, "overhead": overhead}
+    axes = {
+        "num_cc": _axis("num_cc", num_cc, np.int64),
+        "num_mimo": _axis("num_mimo", num_mimo, np.int64),
+        "mod_order": _axis("mod_order", mod_order, np.int64),
+        "numerology": _axis("numerology", numerology, np.int64),
+        "channel_bw": _axis("channel_bw", channel_bw, np.float64),
+        "duplex": _duplex_axis(duplex),
+        "overhead": _axis("overhead", overhead, np.float64),
+    }
+    mu = axes["numerology"]
+    if mu.min() < 0 or mu.max() > MAX_NUMEROLOGY:
+        raise ValueError(f"numerology must be 0 - {MAX_NUMEROLOGY}")
+    for name in ("num_cc", "num_mimo", "mod_order", "channel_bw"):
+        if axes[name].min() < 0:
+            raise ValueError(f"{name} must not be negative")
+
+    # Resource elements per second for each (numerology, bandwidth): N_PRB x 12 / Ts
+    prbs = prb_grid(mu, axes["channel_bw"])
+    per_second = np.where(prbs > 0, prbs * 12 * 14 * 1000.0 * (2.0 ** mu)[:, None], np.nan)
+
+    left = (axes["num_cc"][:, None, None] * axes["num_mimo"][None, :, None]
+            * axes["mod_order"][None, None, :] * (coding_rate / 1_000_000))
+    right = (per_second[:, :, None, None]
+             * _factor_grid(axes["duplex"], mu, direction)[:, None, :, None]
+             * (1 - axes["overhead"])[None, None, None, :])
+    shape = left.shape + right.shape
+    values = np.empty(shape, dtype=dtype)
+    np.multiply(left.reshape(left.shape + (1,) * right.ndim), right, out=values, casting="unsafe")
+
+    # Parameters given as scalars are not dimensions of the result
+    kept = [name for name in SWEEP_AXES if np.ndim(given[name]) > 0]
+    fixed = {name: axes[name][0].item() for name in SWEEP_AXES if name not in kept}
+    fixed["coding_rate"] = coding_rate
+    fixed["direction"] = direction
+    values = values.reshape([len(axes[name]) for name in kept])
+    return ThroughputSweep(values, {name: axes[name] for name in kept}, fixed)
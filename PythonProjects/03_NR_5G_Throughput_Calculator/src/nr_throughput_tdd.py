@@ -0,0 +1,145 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : 5G NR TDD Slot Patterns                              ###
+###                 Exact DL / UL symbol fractions of TDD-UL-DL-Config   ###
+###                 patterns per numerology, memoized per pattern        ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import re
+from fractions import Fraction
+from functools import lru_cache
+
+SYMBOLS_PER_SLOT = 14
+
+# dl-UL-TransmissionPeriodicity values (38.331, incl. ms3 / ms4), in ms
+PERIODICITIES_MS = tuple(Fraction(value) for value in ("0.5", "0.625", "1", "1.25", "2", "2.5", "3", "4", "5", "10"))
+
+# One pattern, or pattern1 + pattern2 when their sum divides 20 ms
+PERIODS_MS = frozenset(PERIODICITIES_MS) | frozenset(
+    first + second for first in PERIODICITIES_MS for second in PERIODICITIES_MS
+    if (Fraction(20) / (first + second)).denominator == 1)
+
+# Special slot split (DL : guard : UL symbols) when a pattern gives none
+DEFAULT_SPECIAL = (10, 2, 2)
+
+# "DDDSU", "DDDSU 10:2:2", "DDDDDDDSUU 6:4:4"
+PATTERN_TEXT = re.compile(r"^\s*([DUSF]+)(?:\s+(\d+):(\d+):(\d+))?\s*$", re.IGNORECASE)
+
+# -------------------- Pattern --------------------
+
+class TddPattern:
+    """
+    One TDD period as (DL symbols, UL symbols) per slot. A slot pattern
+    (from_slots) is written in the carrier's own numerology, so its
+    period in ms depends on the numerology; a TDD-UL-DL-ConfigCommon
+    pattern (from_config_common) is tied to its reference numerology.
+    Guard and flexible symbols count as neither DL nor UL.
+    """
+
+    def __init__(self, slots, reference_numerology=None, name=None):
+        self.slots = tuple(slots)
+        self.reference_numerology = reference_numerology
+        self.name = name
+        if not self.slots or any(dl < 0 or ul < 0 or dl + ul > SYMBOLS_PER_SLOT for dl, ul in self.slots):
+            raise ValueError("each slot needs 0 - 14 DL + UL symbols")
+
+    @classmethod
+    def from_slots(cls, slots, special=DEFAULT_SPECIAL):
+        """D / U / S / F per slot; S slots are split special = (DL, guard, UL) symbols"""
+        if len(special) != 3 or sum(special) != SYMBOLS_PER_SLOT or min(special) < 0:
+            raise ValueError("special slot split must be DL:guard:UL symbols adding up to 14")
+        symbols = {"D": (SYMBOLS_PER_SLOT, 0), "U": (0, SYMBOLS_PER_SLOT), "S": (special[0], special[2]), "F": (0, 0)}
+        slots = slots.strip().upper()
+        if not slots or set(slots) - set(symbols):
+            raise ValueError(f"slot pattern must be made of D / U / S / F, got {slots!r}")
+        name = slots if "S" not in slots else f"{slots} {special[0]}:{special[1]}:{special[2]}"
+        return cls([symbols[slot] for slot in slots], name=name)
+
+    @classmethod
+    def from_config_common(cls, reference_scs, periodicity_ms, dl_slots, dl_symbols, ul_slots, ul_symbols, pattern2=None):
+        """
+        TDD-UL-DL-ConfigCommon: referenceSubcarrierSpacing (kHz) and pattern1
+        (dl-UL-TransmissionPeriodicity, nrofDownlinkSlots, nrofDownlinkSymbols,
+        nrofUplinkSlots, nrofUplinkSymbols); pattern2 is a dict of the
+        same five fields. Slots between the DL and UL parts are flexible.
+        """
+        if reference_scs not in (15, 30, 60, 120):
+            raise ValueError(f"reference SCS must be 15 / 30 / 60 / 120 kHz, got {reference_scs}")
+        numerology = (reference_scs // 15).bit_length() - 1
+        slots = _config_slots(numerology, periodicity_ms, dl_slots, dl_symbols, ul_slots, ul_symbols)
+        if pattern2 is not None:
+            slots += _config_slots(numerology, **pattern2)
+        return cls(slots, reference_numerology=numerology)
+
+    def __eq__(self, other):
+        return isinstance(other, TddPattern) and (self.slots, self.reference_numerology) == (other.slots, other.reference_numerology)
+
+    def __hash__(self):
+        return hash((self.slots, self.reference_numerology))
+
+    def __repr__(self):
+        return f"TddPattern({self.name or f'{len(self.slots)} slots @ mu={self.reference_numerology}'})"
+
+    def period_ms(self, numerology):
+        """Period length at the carrier numerology"""
+        reference = numerology if self.reference_numerology is None else self.reference_numerology
+        return Fraction(len(self.slots), 2 ** reference)
+
+def _config_slots(numerology, periodicity_ms, dl_slots, dl_symbols, ul_slots, ul_symbols):
+    periodicity = Fraction(str(periodicity_ms))
+    if periodicity not in PERIODICITIES_MS:
+        raise ValueError(f"periodicity must be one of {', '.join(str(float(p)) for p in PERIODICITIES_MS)} ms")
+    count = periodicity * 2 ** numerology
+    if count.denominator != 1:
+        raise ValueError(f"{float(periodicity)} ms is not a whole number of slots at {15 * 2 ** numerology} kHz")
+    count = int(count)
+    if not (0 <= dl_symbols < SYMBOLS_PER_SLOT and 0 <= ul_symbols < SYMBOLS_PER_SLOT and dl_slots >= 0 and ul_slots >= 0):
+        raise ValueError("DL / UL symbols must be 0 - 13 and slot counts not negative")
+    # DL symbols follow the last full DL slot, UL symbols end the slot before the first full UL slot
+    if dl_symbols and ul_symbols and dl_slots + ul_slots + 1 == count:
+        head, tail = [(dl_symbols, ul_symbols)], []
+    else:
+        head, tail = [(dl_symbols, 0)] * bool(dl_symbols), [(0, ul_symbols)] * bool(ul_symbols)
+    flexible = count - dl_slots - ul_slots - len(head) - len(tail)
+    if flexible < 0:
+        raise ValueError("DL / UL slots and symbols do not fit the periodicity")
+    return [(SYMBOLS_PER_SLOT, 0)] * dl_slots + head + [(0, 0)] * flexible + tail + [(0, SYMBOLS_PER_SLOT)] * ul_slots
+
+# -------------------- Fractions --------------------
+
+@lru_cache(maxsize=None)
+def parse_pattern(text):
+    """TddPattern from "DDDSU" or "DDDSU 10:2:2" (special slot DL:guard:UL symbols)"""
+    found = PATTERN_TEXT.match(text)
+    if not found:
+        raise ValueError(f"not a TDD pattern: {text!r} (e.g. DDDSU or DDDSU 10:2:2)")
+    special = tuple(int(value) for value in found.groups()[1:]) if found.group(2) else DEFAULT_SPECIAL
+    return TddPattern.from_slots(found.group(1), special)
+
+@lru_cache(maxsize=None)
+def tdd_fractions(pattern, numerology):
+    """
+    Exact (DL, UL) shares of all symbols in one period at the carrier
+    numerology, as Fractions. `pattern` is a TddPattern or its text form.
+    ValueError if the period is not a valid TDD periodicity there.
+    """
+    if isinstance(pattern, str):
+        pattern = parse_pattern(pattern)
+    if pattern.reference_numerology is not None and numerology < pattern.reference_numerology:
+        raise ValueError(f"carrier numerology {numerology} is below the reference numerology {pattern.reference_numerology}")
+    if pattern.period_ms(numerology) not in PERIODS_MS:
+        raise ValueError(f"{pattern!r} lasts {float(pattern.period_ms(numerology))} ms at {15 * 2 ** numerology} kHz, "
+                         "not a TDD periodicity")
+    # Each reference symbol spans 2^(mu - mu_ref) carrier symbols, so the shares do not change
+    total = SYMBOLS_PER_SLOT * len(pattern.slots)
+    return (Fraction(sum(dl for dl, _ in pattern.slots), total), Fraction(sum(ul for _, ul in pattern.slots), total))
+
+def tdd_scaling_factor(pattern, numerology, direction="DL"):
+    """Scaling factor f of a TDD carrier: its DL or UL symbol share"""
+    direction = direction.strip().upper()
+    if direction not in ("DL", "UL"):
+        raise ValueError(f"direction must be DL / UL, got {direction}")
+    return float(tdd_fractions(pattern, numerology)[direction == "UL"])
@@ -34,8 +34,9 @@ class TestNRThroughputCalculator(unittest.TestCase):
     def test_03_symbol_duration(self):
         print("Test 03: Symbol duration for 30 kHz spacing")
         duration = self.calc.calculate_symbol_duration(30)
-        expected = 0.001 / (14 * 30)
+        expected = 0.001 / (14 * 2)
         self.assertAlmostEqual(duration, expected, places=8)
+        self.assertAlmostEqual(self.calc.calculate_symbol_duration(15), 0.001 / 14, places=8)
         print(f"Test 03 passed: Symbol duration = {duration:.8f} sec\n")
 
     def test_04_throughput_calculation(self):
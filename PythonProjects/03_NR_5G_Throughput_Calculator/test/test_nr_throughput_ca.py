@@ -0,0 +1,122 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the per-carrier CA throughput model   ###
+###                 Scalar vs. vectorized rates, FR / direction          ###
+###                 overheads and batch evaluation                       ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import os
+import sys
+import time
+import random
+import subprocess
+import unittest
+import numpy as np
+from src.nr_throughput_calculator import NRThroughputCalculator
+from src.nr_throughput_sweep import sweep_throughput
+from src.nr_throughput_ca import ComponentCarrier, ca_throughput, ca_throughput_batch, OVERHEADS
+
+class TestNRThroughputCA(unittest.TestCase):
+
+    def setUp(self):
+        self.carriers = [
+            ComponentCarrier(100, 1, 4, 8, "TDD"),                  # n78
+            ComponentCarrier(20, 0, 2, 6, "FDD"),                   # n3
+            ComponentCarrier(400, 3, 2, 6, "TDD", "FR2"),           # n257
+        ]
+
+    def test_01_scalar_vs_vectorized(self):
+        print("Test 01: Per-carrier rates vs. ComponentCarrier.throughput")
+        total, rates = ca_throughput(self.carriers)
+        for carrier, rate in zip(self.carriers, rates):
+            self.assertAlmostEqual(rate, carrier.throughput(), delta=1e-9 * rate)
+        self.assertAlmostEqual(total, sum(carrier.throughput() for carrier in self.carriers))
+        self.assertEqual([carrier.num_prbs() for carrier in self.carriers], [273, 107, 273])
+        print(f"Test 01 passed: total = {total:.1f} Mbps\n")
+
+    def test_02_identical_carriers_match_sweep(self):
+        print("Test 02: J identical carriers = the J-CC formula")
+        total, _ = ca_throughput([ComponentCarrier(100, 1, 4, 8, "TDD")] * 3)
+        expected = sweep_throughput(3, 4, 8, 1, 100, "TDD").values
+        self.assertAlmostEqual(total, float(expected))
+        print(f"Test 02 passed: {total:.1f} Mbps\n")
+
+    def test_03_overhead_defaults(self):
+        print("Test 03: Overhead and scaling factor defaults")
+        for (fr, direction), overhead in OVERHEADS.items():
+            self.assertEqual(ComponentCarrier(100, 1, 2, 6, fr=fr, direction=direction).overhead, overhead)
+        carrier = ComponentCarrier(100, 1, 2, 6, "tdd", "fr1", "ul", overhead=0.2)
+        self.assertEqual((carrier.overhead, carrier.scaling_factor), (0.2, 0.76))
+        self.assertEqual(ComponentCarrier(100, 1, 2, 6, scaling_factor=0.5).scaling_factor, 0.5)
+        print("Test 03 passed\n")
+
+    def test_04_dicts_and_calculator(self):
+        print("Test 04: Keyword dicts and NRThroughputCalculator.calculate_ca_throughput")
+        as_dicts = [dict(channel_bw=100, numerology=1, num_mimo=4, mod_order=8, duplex="TDD"),
+                    dict(channel_bw=20, numerology=0, num_mimo=2, mod_order=6),
+                    dict(channel_bw=400, numerology=3, num_mimo=2, mod_order=6, duplex="TDD", fr="FR2")]
+        calc = NRThroughputCalculator()
+        result = calc.calculate_ca_throughput(as_dicts)
+        self.assertEqual(calc.throughput, result)
+        self.assertAlmostEqual(result, ca_throughput(self.carriers)[0])
+        print(f"Test 04 passed: {result:.1f} Mbps\n")
+
+    def test_05_no_prbs_and_empty(self):
+        print("Test 05: Carrier with no PRBs, empty configuration")
+        total, rates = ca_throughput([ComponentCarrier(5, 3, 2, 6), ComponentCarrier(20, 0, 2, 6)])
+        self.assertTrue(np.isnan(total) and np.isnan(rates[0]) and not np.isnan(rates[1]))
+        self.assertEqual(ca_throughput([])[0], 0.0)
+        np.testing.assert_array_equal(ca_throughput_batch([[], [ComponentCarrier(5, 3, 2, 6)]]), [0.0, np.nan])
+        print("Test 05 passed\n")
+
+    def test_06_invalid_input(self):
+        print("Test 06: Invalid carrier parameters")
+        with self.assertRaises(ValueError):
+            ComponentCarrier(100, 1, 2, 6, fr="FR3")
+        with self.assertRaises(ValueError):
+            ComponentCarrier(100, 1, 2, 6, direction="SL")
+        with self.assertRaises(ValueError):
+            ComponentCarrier(100, 1, 2, 6, duplex="SDL")
+        with self.assertRaises(ValueError):
+            ComponentCarrier(100, 5, 2, 6)
+        print("Test 06 passed\n")
+
+    def test_07_batch(self):
+        print("Test 07: Thousands of CA configurations in one pass")
+        random.seed(2026)
+        configs = [[ComponentCarrier(random.choice([10, 20, 50, 100]), random.choice([0, 1]), random.choice([1, 2, 4]),
+                                     random.choice([2, 4, 6, 8]), random.choice(["FDD", "TDD"]), "FR1",
+                                     random.choice(["DL", "UL"]))
+                    for _ in range(random.randint(1, 5))] for _ in range(20000)]
+        start = time.perf_counter()
+        totals = ca_throughput_batch(configs)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(totals.shape, (len(configs),))
+        for index in random.sample(range(len(configs)), 200):
+            self.assertAlmostEqual(totals[index], sum(carrier.throughput() for carrier in configs[index]),
+                                   delta=1e-9 * totals[index])
+        self.assertLess(elapsed, 5.0)
+        print(f"Test 07 passed: {len(configs)} configurations in {elapsed:.3f} s\n")
+
+    def test_08_script_mode(self):
+        print("Test 08: Carrier aggregation with src/ as the script directory")
+        src = os.path.join(os.path.dirname(__file__), "..", "src")
+        script = ("from nr_throughput_calculator import NRThroughputCalculator\n"
+                  "print(NRThroughputCalculator().calculate_ca_throughput("
+                  "[dict(channel_bw=100, numerology=1, num_mimo=4, mod_order=8)]))")
+        out = subprocess.run([sys.executable, "-c", script], cwd=src, capture_output=True, text=True, check=True)
+        self.assertAlmostEqual(float(out.stdout), ComponentCarrier(100, 1, 4, 8).throughput())
+        print(f"Test 08 passed: {float(out.stdout):.1f} Mbps\n")
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(unittest.defaultTestLoader.loadTestsFromTestCase(TestNRThroughputCA))
+
+    print("\nTest Summary:")
+    print(f"Total tests run   : {result.testsRun}")
+    print(f"Tests passed      : {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"Tests failed      : {len(result.failures)}")
+    print(f"Tests with errors : {len(result.errors)}")
@@ -0,0 +1,136 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for band combination throughput scoring  ###
+###                 Parsing, FR / duplex mapping, peak DL / UL vs. the   ###
+###                 CA model, ranking, chunks and worker processes       ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import os
+import sys
+import json
+import random
+import subprocess
+import tempfile
+import unittest
+import numpy as np
+from src.nr_throughput_ca import ComponentCarrier, ca_throughput
+from src.nr_throughput_combos import (parse_combo, band_info, score_combos, rank_combos,
+                                      load_combos, load_assumptions)
+
+BANDS = [1, 3, 7, 28, 41, 66, 71, 75, 77, 78, 79, 80, 257, 258, 260]
+
+class TestNRThroughputCombos(unittest.TestCase):
+
+    def test_01_parse_formats(self):
+        print("Test 01: NRLogAnalyzer lists, printed lines and shorthand")
+        self.assertEqual(parse_combo(["bandNR: 41", "bandNR: 78"]), (41, 78))
+        self.assertEqual(parse_combo("Combo 12: bandNR: 1, bandNR: 78"), (1, 78))
+        self.assertEqual(parse_combo("n3+n78+n78"), (3, 78, 78))
+        self.assertEqual(parse_combo([1, "n28"]), (1, 28))
+        with self.assertRaises(ValueError):
+            parse_combo(["bandNR: 41", "ca-BandwidthClassDL-NR: a"])
+        with self.assertRaises(ValueError):
+            parse_combo("Combo 3:")
+        print("Test 01 passed\n")
+
+    def test_02_band_mapping(self):
+        print("Test 02: Band → FR / duplex")
+        self.assertEqual(band_info(78), ("FR1", "TDD"))
+        self.assertEqual(band_info(3), ("FR1", "FDD"))
+        self.assertEqual(band_info(75), ("FR1", "SDL"))
+        self.assertEqual(band_info(80), ("FR1", "SUL"))
+        self.assertEqual(band_info(257), ("FR2", "TDD"))
+        print("Test 02 passed\n")
+
+    def test_03_matches_ca_model(self):
+        print("Test 03: Combination DL / UL vs. ComponentCarrier sums")
+        assumptions = {78: {"channel_bw": 100, "scs": 30, "ul_mimo": 2}, 3: {"channel_bw": 20, "scs": 15}}
+        [record] = score_combos([["bandNR: 3", "bandNR: 78"]], assumptions=assumptions, max_ul_carriers=None)
+        dl, _ = ca_throughput([ComponentCarrier(20, 0, 4, 8, "FDD"), ComponentCarrier(100, 1, 4, 8, "TDD")])
+        ul, _ = ca_throughput([ComponentCarrier(20, 0, 1, 6, "FDD", direction="UL"),
+                               ComponentCarrier(100, 1, 2, 6, "TDD", direction="UL")])
+        self.assertAlmostEqual(record["dl_mbps"], dl)
+        self.assertAlmostEqual(record["ul_mbps"], ul)
+        [single_ul] = score_combos([[3, 78]], assumptions=assumptions)
+        self.assertAlmostEqual(single_ul["ul_mbps"], ComponentCarrier(100, 1, 2, 6, "TDD", direction="UL").throughput())
+        print(f"Test 03 passed: n3+n78 DL {dl:.1f} / UL {ul:.1f} Mbps\n")
+
+    def test_04_sdl_sul_and_errors(self):
+        print("Test 04: SDL / SUL carriers and invalid combinations")
+        sdl, sul, bad = score_combos(["n75+n78", "n80+n78", "n999+n78"], max_ul_carriers=None)
+        [n78] = score_combos(["n78"], max_ul_carriers=None)
+        self.assertGreater(sdl["dl_mbps"], n78["dl_mbps"])
+        self.assertEqual(sdl["ul_mbps"], n78["ul_mbps"])
+        self.assertEqual(sul["dl_mbps"], n78["dl_mbps"])
+        self.assertGreater(sul["ul_mbps"], n78["ul_mbps"])
+        self.assertTrue(np.isnan(bad["dl_mbps"]) and bad["error"] and bad["combo"] == "n999+n78")
+        with self.assertRaises(ValueError):
+            score_combos(["n78"], assumptions={78: {"bandwidth": 100}})
+        with self.assertRaises(ValueError):
+            score_combos(["n78"], assumptions={78: {"scs": 45}})
+        print("Test 04 passed\n")
+
+    def test_05_ranking(self):
+        print("Test 05: Ranking by DL, UL and total")
+        combos = ["n3", "n78", "n3+n78", "n257+n258", "n1+n999"]
+        by_dl = rank_combos(combos)
+        self.assertEqual([record["rank"] for record in by_dl], [1, 2, 3, 4, 5])
+        self.assertTrue(all(a["dl_mbps"] >= b["dl_mbps"] for a, b in zip(by_dl, by_dl[1:4])))
+        self.assertTrue(by_dl[-1]["error"])
+        self.assertEqual(rank_combos(combos, by="ul", top=1)[0]["combo"], "n257+n258")
+        self.assertEqual(len(rank_combos(combos, by="total", top=2)), 2)
+        with self.assertRaises(ValueError):
+            rank_combos(combos, by="latency")
+        print(f"Test 05 passed: best DL {by_dl[0]['combo']}\n")
+
+    def test_06_chunks_and_workers_agree(self):
+        print("Test 06: Thousands of combinations in chunks and worker processes")
+        random.seed(2026)
+        combos = [[f"bandNR: {random.choice(BANDS)}" for _ in range(random.randint(1, 5))] for _ in range(5000)]
+        combos[17] = ["bandNR: 12345"]
+        serial = score_combos(combos, chunk_size=100000)
+        for chunk_size, workers in ((1000, 1), (777, 2)):
+            self.assertEqual(score_combos(combos, chunk_size=chunk_size, workers=workers)[:17], serial[:17])
+            self.assertEqual(score_combos(combos, chunk_size=chunk_size, workers=workers)[18:], serial[18:])
+        self.assertTrue(serial[17]["error"])
+        print(f"Test 06 passed: {len(combos)} combinations\n")
+
+    def test_07_files(self):
+        print("Test 07: Combination and assumption files")
+        with tempfile.TemporaryDirectory() as folder:
+            text, listed, bands = (os.path.join(folder, name) for name in ("combos.txt", "combos.json", "bands.json"))
+            with open(text, "w", encoding="utf-8") as handle:
+                handle.write("🔗 Band Combinations:\nCombo 1: bandNR: 41, bandNR: 78\nCombo 2: bandNR: 78, bandNR: 79\n")
+            with open(listed, "w", encoding="utf-8") as handle:
+                json.dump([["bandNR: 41", "bandNR: 78"], ["bandNR: 78", "bandNR: 79"]], handle)
+            with open(bands, "w", encoding="utf-8") as handle:
+                json.dump({"n78": {"channel_bw": 80}, "41": {"scs": 30, "channel_bw": 100}}, handle)
+            self.assertEqual([parse_combo(combo) for combo in load_combos(text)], [(41, 78), (78, 79)])
+            self.assertEqual([parse_combo(combo) for combo in load_combos(listed)], [(41, 78), (78, 79)])
+            self.assertEqual(load_assumptions(bands), {78: {"channel_bw": 80}, 41: {"scs": 30, "channel_bw": 100}})
+        print("Test 07 passed\n")
+
+    def test_08_cli_script_mode(self):
+        print("Test 08: python src/nr_throughput_combos.py ranks a combination file")
+        src = os.path.join(os.path.dirname(__file__), "..", "src")
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "combos.txt")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write("Combo 1: bandNR: 3\nCombo 2: bandNR: 3, bandNR: 78\n")
+            out = subprocess.run([sys.executable, "nr_throughput_combos.py", path, "--top", "1"], cwd=src,
+                                 capture_output=True, text=True, check=True).stdout.splitlines()
+        self.assertEqual(out[1].split()[:2], ["1", "n3+n78"])
+        print("Test 08 passed\n")
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(unittest.defaultTestLoader.loadTestsFromTestCase(TestNRThroughputCombos))
+
+    print("\nTest Summary:")
+    print(f"Total tests run   : {result.testsRun}")
+    print(f"Tests passed      : {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"Tests failed      : {len(result.failures)}")
+    print(f"Tests with errors : {len(result.errors)}")
@@ -0,0 +1,117 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the throughput inverse solver         ###
+###                 Pareto front vs. brute force, cost ordering,         ###
+###                 constraints and timing                               ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import os
+import sys
+import time
+import itertools
+import unittest
+import subprocess
+from src.nr_throughput_ca import ComponentCarrier
+from src.nr_throughput_solver import pareto_configs, cheapest_config, RESOURCES
+
+SMALL = {"num_cc": range(1, 5), "num_mimo": range(1, 5), "mod_order": (2, 4, 6, 8),
+         "channel_bw": (5, 10, 20, 40, 50, 100), "numerology": (0, 1, 2)}
+
+class TestNRThroughputSolver(unittest.TestCase):
+
+    def _feasible(self, target, duplex="TDD"):
+        # Every allowed configuration reaching the target, by direct evaluation
+        feasible = set()
+        for cc, mimo, qm, bw, mu in itertools.product(*SMALL.values()):
+            carrier = ComponentCarrier(bw, mu, mimo, qm, duplex)
+            if 0 < carrier.num_prbs() <= 275 and cc * carrier.throughput() >= target:
+                feasible.add((cc, mimo, qm, bw))
+        return feasible
+
+    def test_01_front_matches_brute_force(self):
+        print("Test 01: Pareto front vs. exhaustive dominance check")
+        for target in (150, 1000, 2500):
+            feasible = self._feasible(target)
+            minimal = {config for config in feasible
+                       if not any(other != config and all(a <= b for a, b in zip(other, config)) for other in feasible)}
+            front = pareto_configs(target, duplex="TDD", **SMALL)
+            self.assertEqual({tuple(config[name] for name in RESOURCES) for config in front}, minimal)
+            self.assertTrue(all(config["throughput"] >= target for config in front))
+        print(f"Test 01 passed: {len(minimal)} front configurations at 2500 Mbps\n")
+
+    def test_02_cheapest_by_weights(self):
+        print("Test 02: Cheapest configuration follows the cost weights")
+        weights = {"num_cc": 1.0, "num_mimo": 50.0, "mod_order": 1.0, "channel_bw": 0.01}
+        best = cheapest_config(1000, duplex="TDD", weights=weights, **SMALL)
+        costs = [sum(weights[name] * value for name, value in zip(RESOURCES, config)) for config in self._feasible(1000)]
+        self.assertAlmostEqual(best["cost"], min(costs))
+        self.assertEqual(best["num_mimo"], 1)
+        front = pareto_configs(1000, duplex="TDD", weights=weights, **SMALL)
+        self.assertEqual([config["cost"] for config in front], sorted(config["cost"] for config in front))
+        print(f"Test 02 passed: {best}\n")
+
+    def test_03_constraints(self):
+        print("Test 03: Allowed values, PRB limit and unreachable targets")
+        front = pareto_configs(2000, duplex="TDD", num_cc=[1, 2], num_mimo=[4], numerology=[1])
+        self.assertTrue(front)
+        self.assertTrue(all(config["num_cc"] in (1, 2) and config["num_mimo"] == 4 and config["numerology"] == 1
+                            for config in front))
+        self.assertTrue(all(ComponentCarrier(config["channel_bw"], config["numerology"], 1, 2).num_prbs() <= 275
+                            for config in pareto_configs(500)))
+        self.assertEqual(pareto_configs(10 ** 6), [])
+        self.assertIsNone(cheapest_config(10 ** 6))
+        print("Test 03 passed\n")
+
+    def test_04_fr2_and_uplink(self):
+        print("Test 04: FR2 ranges, uplink overhead")
+        fr2 = cheapest_config(4000, fr="FR2", duplex="TDD")
+        self.assertIn(fr2["numerology"], (2, 3))
+        self.assertIn(fr2["channel_bw"], (50, 100, 200, 400))
+        dl, ul = (cheapest_config(300, direction=direction, **SMALL) for direction in ("DL", "UL"))
+        self.assertLessEqual(ul["cost"], dl["cost"])
+        print(f"Test 04 passed: FR2 4 Gbps = {fr2}\n")
+
+    def test_05_invalid_input(self):
+        print("Test 05: Invalid solver parameters")
+        with self.assertRaises(ValueError):
+            pareto_configs(0)
+        with self.assertRaises(ValueError):
+            pareto_configs(1000, fr="FR3")
+        with self.assertRaises(ValueError):
+            pareto_configs(1000, layers=[2])
+        with self.assertRaises(ValueError):
+            pareto_configs(1000, num_cc=[])
+        print("Test 05 passed\n")
+
+    def test_06_standard_ranges_timing(self):
+        print("Test 06: Standard parameter ranges well under a second")
+        start = time.perf_counter()
+        for target in (100, 500, 2000, 5000, 10000):
+            for fr in ("FR1", "FR2"):
+                pareto_configs(target, fr=fr, duplex="TDD")
+        elapsed = (time.perf_counter() - start) / 10
+        self.assertLess(elapsed, 0.1)
+        print(f"Test 06 passed: {elapsed * 1000:.1f} ms per solve\n")
+
+    def test_07_cli_script_mode(self):
+        print("Test 07: python src/nr_throughput_solver.py prints the cheapest configurations")
+        src = os.path.join(os.path.dirname(__file__), "..", "src")
+        out = subprocess.run([sys.executable, "nr_throughput_solver.py", "1000", "--top", "1"], cwd=src,
+                             capture_output=True, text=True, check=True).stdout.splitlines()
+        best = cheapest_config(1000)
+        self.assertEqual([float(value) for value in out[1].split()[:4]],
+                         [best["num_cc"], best["num_mimo"], best["mod_order"], best["channel_bw"]])
+        print("Test 07 passed\n")
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(unittest.defaultTestLoader.loadTestsFromTestCase(TestNRThroughputSolver))
+
+    print("\nTest Summary:")
+    print(f"Total tests run   : {result.testsRun}")
+    print(f"Tests passed      : {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"Tests failed      : {len(result.failures)}")
+    print(f"Tests with errors : {len(result.errors)}")
@@ -0,0 +1,126 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for the 5G NR throughput parameter sweep  ###
+###                 Grid values vs. calculate_throughput, labeled axes,  ###
+###                 selection and large-grid timing                      ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import time
+import unittest
+import numpy as np
+from src.nr_throughput_calculator import NRThroughputCalculator
+from src.nr_throughput_sweep import sweep_throughput, SWEEP_AXES, SCALING_FACTORS
+
+class TestNRThroughputSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.grid = sweep_throughput(num_cc=[1, 2, 4], num_mimo=[1, 2, 4], mod_order=[2, 4, 6, 8],
+                                     numerology=[0, 1, 3], channel_bw=[5, 20, 100], duplex=["FDD", "TDD"],
+                                     overhead=[0.08, 0.14])
+
+    def _scalar(self, point):
+        # The interactive calculator, configured the way main() does it
+        calc = NRThroughputCalculator()
+        calc.num_cc, calc.num_mimo, calc.mod_order = point["num_cc"], point["num_mimo"], point["mod_order"]
+        calc.scaling_factor = SCALING_FACTORS[point["duplex"]]
+        calc.coding_rate = point["coding_rate"]
+        calc.subcarrier_spacing = calc.get_subcarrier_spacing(point["numerology"])
+        calc.num_prbs = calc.get_num_prbs(point["channel_bw"], calc.subcarrier_spacing)
+        calc.symbol_duration = calc.calculate_symbol_duration(calc.subcarrier_spacing)
+        calc.overhead = point["overhead"]
+        return calc.calculate_throughput()
+
+    def test_01_matches_scalar_formula(self):
+        print("Test 01: Every grid point vs. calculate_throughput")
+        checked = 0
+        for point in self.grid.to_records():
+            if np.isnan(point["throughput"]):
+                continue
+            self.assertAlmostEqual(point["throughput"], self._scalar(point), delta=1e-9 * point["throughput"])
+            checked += 1
+        self.assertGreater(checked, 0)
+        print(f"Test 01 passed: {checked} points match\n")
+
+    def test_02_labeled_axes(self):
+        print("Test 02: Axis order, coordinates and fixed parameters")
+        self.assertEqual(self.grid.dims, SWEEP_AXES)
+        self.assertEqual(self.grid.shape, (3, 3, 4, 3, 3, 2, 2))
+        self.assertEqual(self.grid.axes["duplex"].tolist(), ["FDD", "TDD"])
+        single = sweep_throughput(1, [2, 4], 6, 1, 100, "tdd")
+        self.assertEqual(single.dims, ("num_mimo",))
+        self.assertEqual(single.fixed["duplex"], "TDD")
+        self.assertEqual(single.fixed["overhead"], 0.14)
+        print(f"Test 02 passed: {single}\n")
+
+    def test_03_no_prbs_is_nan(self):
+        print("Test 03: Bandwidth with no PRBs at the numerology")
+        point = self.grid.sel(channel_bw=5, numerology=3)
+        self.assertTrue(np.isnan(point.values).all())
+        self.assertFalse(np.isnan(self.grid.sel(channel_bw=5, numerology=0).values).any())
+        print("Test 03 passed: 5 MHz @ 120 kHz is NaN\n")
+
+    def test_04_selection(self):
+        print("Test 04: sel() by scalar and list coordinates")
+        sub = self.grid.sel(num_cc=[4, 1], duplex="TDD")
+        self.assertEqual(sub.dims, ("num_cc", "num_mimo", "mod_order", "numerology", "channel_bw", "overhead"))
+        self.assertEqual(sub.fixed["duplex"], "TDD")
+        np.testing.assert_array_equal(sub.values[0], self.grid.values[2, ..., 1, :])
+        np.testing.assert_array_equal(sub.values[1], self.grid.values[0, ..., 1, :])
+        with self.assertRaises(KeyError):
+            self.grid.sel(num_cc=3)
+        with self.assertRaises(KeyError):
+            self.grid.sel(layers=2)
+        print("Test 04 passed\n")
+
+    def test_05_best(self):
+        print("Test 05: Best configurations")
+        best = self.grid.best(3)
+        self.assertEqual(best[0]["throughput"], np.nanmax(self.grid.values))
+        self.assertGreaterEqual(best[0]["throughput"], best[1]["throughput"])
+        self.assertEqual((best[0]["num_cc"], best[0]["num_mimo"], best[0]["mod_order"], best[0]["duplex"]), (4, 4, 8, "FDD"))
+        print(f"Test 05 passed: best = {best[0]['throughput']:.1f} Mbps\n")
+
+    def test_06_calculator_defaults(self):
+        print("Test 06: NRThroughputCalculator.sweep uses the calculator's values")
+        calc = NRThroughputCalculator()
+        calc.num_cc, calc.num_mimo, calc.mod_order, calc.numerology, calc.channel_bw = 1, 4, 8, 1, 100
+        calc.band_type = "TDD"
+        result = calc.sweep(num_cc=[1, 2])
+        self.assertEqual(result.dims, ("num_cc",))
+        self.assertAlmostEqual(result.values[1], 2 * result.values[0])
+        self.assertAlmostEqual(result.values[0], self._scalar(result.point(0)))
+        print(f"Test 06 passed: {result.values.round(1).tolist()} Mbps\n")
+
+    def test_07_invalid_input(self):
+        print("Test 07: Invalid parameters")
+        with self.assertRaises(ValueError):
+            sweep_throughput(1, 1, 2, 5, 100)
+        with self.assertRaises(ValueError):
+            sweep_throughput(1, 1, 2, 1, 100, duplex="SDL")
+        with self.assertRaises(ValueError):
+            sweep_throughput([], 1, 2, 1, 100)
+        print("Test 07 passed\n")
+
+    def test_08_large_grid(self):
+        print("Test 08: Tens of millions of points")
+        start = time.perf_counter()
+        grid = sweep_throughput(num_cc=range(1, 17), num_mimo=range(1, 9), mod_order=[1, 2, 4, 6, 8],
+                                numerology=range(0, 5), channel_bw=np.arange(5, 405, 5), duplex=["FDD", "TDD"],
+                                overhead=np.linspace(0.0, 0.3, 31), dtype=np.float32)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(grid.size, 15_872_000)
+        self.assertLess(elapsed, 5.0)
+        print(f"Test 08 passed: {grid.size} points in {elapsed:.3f} s\n")
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(unittest.defaultTestLoader.loadTestsFromTestCase(TestNRThroughputSweep))
+
+    print("\nTest Summary:")
+    print(f"Total tests run   : {result.testsRun}")
+    print(f"Tests passed      : {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"Tests failed      : {len(result.failures)}")
+    print(f"Tests with errors : {len(result.errors)}")
@@ -0,0 +1,136 @@
+#############################################################################
+###  Author       : Sanjeet Prasad                                       ###
+###  Email        : sanjeet8.23@gmail.com                                ###
+###  Description  : Unit tests for TDD slot-pattern scaling factors      ###
+###                 Exact symbol shares, ConfigCommon patterns,          ###
+###                 periodicity checks, caching and the throughput paths ###
+###  Date         : 19-10-2026                                           ###
+###  Interpreter  : Python 3.11.0                                        ###
+#############################################################################
+
+import time
+import itertools
+import unittest
+from fractions import Fraction
+import numpy as np
+from src.nr_throughput_calculator import NRThroughputCalculator
+from src.nr_throughput_sweep import sweep_throughput
+from src.nr_throughput_ca import ComponentCarrier
+from src.nr_throughput_combos import score_combos
+from src.nr_throughput_solver import cheapest_config
+from src.nr_throughput_tdd import TddPattern, parse_pattern, tdd_fractions, tdd_scaling_factor
+
+class TestNRThroughputTDD(unittest.TestCase):
+
+    def test_01_slot_pattern_fractions(self):
+        print("Test 01: Exact DL / UL symbol shares of slot patterns")
+        self.assertEqual(tdd_fractions("DDDSU", 1), (Fraction(26, 35), Fraction(8, 35)))
+        self.assertEqual(tdd_fractions("DDDSU 6:4:4", 1), (Fraction(24, 35), Fraction(18, 70)))
+        self.assertEqual(tdd_fractions("DDDDDDDSUU 6:4:4", 1), (Fraction(104, 140), Fraction(32, 140)))
+        self.assertEqual(tdd_fractions("DDDSUDDSUU", 0), (Fraction(90, 140), Fraction(46, 140)))
+        self.assertEqual(tdd_fractions("DDFU", 3), (Fraction(1, 2), Fraction(1, 4)))
+        self.assertAlmostEqual(tdd_scaling_factor("dddsu", 1, "ul"), 8 / 35)
+        print("Test 01 passed\n")
+
+    def test_02_config_common(self):
+        print("Test 02: TDD-UL-DL-ConfigCommon patterns")
+        pattern = TddPattern.from_config_common(30, 2.5, 3, 10, 1, 2)
+        self.assertEqual(pattern.slots, parse_pattern("DDDSU").slots)
+        self.assertEqual(tdd_fractions(pattern, 1), tdd_fractions("DDDSU", 1))
+        # 15 kHz reference on a 30 kHz carrier: same shares, twice the slots
+        self.assertEqual(tdd_fractions(TddPattern.from_config_common(15, 5, 3, 10, 1, 2), 1), tdd_fractions("DDDSU", 0))
+        split = TddPattern.from_config_common(30, 2.5, 2, 6, 1, 4)
+        self.assertEqual(split.slots, ((14, 0), (14, 0), (6, 0), (0, 4), (0, 14)))
+        dual = TddPattern.from_config_common(30, 3, 4, 6, 1, 4, pattern2={"periodicity_ms": 2, "dl_slots": 2,
+                                                                            "dl_symbols": 0, "ul_slots": 1, "ul_symbols": 0})
+        self.assertEqual(len(dual.slots), 10)
+        self.assertEqual(tdd_fractions(dual, 1), (Fraction(4 * 14 + 6 + 2 * 14, 140), Fraction(14 + 4 + 14, 140)))
+        print("Test 02 passed\n")
+
+    def test_03_invalid_patterns(self):
+        print("Test 03: Invalid patterns and periodicities")
+        with self.assertRaises(ValueError):
+            parse_pattern("DDXU")
+        with self.assertRaises(ValueError):
+            parse_pattern("DDDSU 10:2:3")
+        with self.assertRaises(ValueError):
+            tdd_fractions("DDDSU", 4)                                          # 0.3125 ms
+        with self.assertRaises(ValueError):
+            tdd_fractions("DDDDDDDSU", 1)                                      # 4.5 ms
+        with self.assertRaises(ValueError):
+            tdd_fractions(TddPattern.from_config_common(30, 2.5, 3, 10, 1, 2), 0)  # below the reference SCS
+        with self.assertRaises(ValueError):
+            TddPattern.from_config_common(30, 2.5, 4, 6, 1, 0)                 # 6 slots in a 5-slot period
+        with self.assertRaises(ValueError):
+            TddPattern.from_config_common(30, 1.5, 1, 0, 1, 0)
+        with self.assertRaises(ValueError):
+            tdd_scaling_factor("DDDSU", 1, "SL")
+        print("Test 03 passed\n")
+
+    def test_04_memoized(self):
+        print("Test 04: Fractions computed once per pattern and numerology")
+        tdd_fractions("DDDSUDDDSU 8:2:4", 2)
+        hits = tdd_fractions.cache_info().hits
+        for _ in range(1000):
+            tdd_fractions("DDDSUDDDSU 8:2:4", 2)
+        self.assertEqual(tdd_fractions.cache_info().hits, hits + 1000)
+        self.assertIs(parse_pattern("DDSU"), parse_pattern("DDSU"))
+        print("Test 04 passed\n")
+
+    def test_05_scalar_paths(self):
+        print("Test 05: Calculator and ComponentCarrier use the pattern share")
+        calc = NRThroughputCalculator()
+        calc.num_cc, calc.num_mimo, calc.mod_order, calc.numerology = 1, 4, 8, 1
+        calc.subcarrier_spacing = calc.get_subcarrier_spacing(1)
+        calc.num_prbs = calc.get_num_prbs(100, calc.subcarrier_spacing)
+        calc.symbol_duration = calc.calculate_symbol_duration(calc.subcarrier_spacing)
+        self.assertEqual(calc.apply_tdd_pattern("DDDSU"), 26 / 35)
+        self.assertEqual((calc.band_type, calc.tdd_pattern), ("TDD", "DDDSU"))
+        with_pattern = calc.calculate_throughput()
+        carrier = ComponentCarrier(100, 1, 4, 8, "DDDSU")
+        self.assertAlmostEqual(carrier.throughput(), with_pattern)
+        self.assertAlmostEqual(carrier.throughput() / ComponentCarrier(100, 1, 4, 8, "TDD").throughput(), (26 / 35) / 0.76)
+        self.assertAlmostEqual(ComponentCarrier(100, 1, 1, 6, "DDDSU", direction="UL").scaling_factor, 8 / 35)
+        self.assertEqual(calc.sweep(num_cc=[1, 2]).fixed["duplex"], "DDDSU")
+        with self.assertRaises(ValueError):
+            ComponentCarrier(100, 4, 2, 6, "DDDSU")
+        print(f"Test 05 passed: DDDSU 100 MHz 4x256QAM = {with_pattern:.1f} Mbps\n")
+
+    def test_06_sweep_over_patterns(self):
+        print("Test 06: Sweep over many slot patterns")
+        patterns = ["FDD", "TDD"] + ["".join(slots) + " 10:2:2" for slots in itertools.product("DSU", repeat=5)]
+        start = time.perf_counter()
+        grid = sweep_throughput(2, 4, 8, numerology=[0, 1, 2, 3, 4], channel_bw=[50, 100], duplex=patterns)
+        uplink = sweep_throughput(2, 4, 8, numerology=1, channel_bw=100, duplex=patterns, direction="UL")
+        elapsed = time.perf_counter() - start
+        self.assertEqual(grid.shape, (5, 2, len(patterns)))
+        point = grid.sel(numerology=1, channel_bw=100, duplex="DDDSU 10:2:2").values
+        self.assertAlmostEqual(float(point), 2 * ComponentCarrier(100, 1, 4, 8, "DDDSU").throughput())
+        self.assertTrue(np.isnan(grid.sel(numerology=4, duplex="DDDSU 10:2:2").values).all())
+        self.assertAlmostEqual(float(uplink.sel(duplex="UUUUU 10:2:2").values),
+                               float(grid.sel(numerology=1, channel_bw=100, duplex="FDD").values))
+        with self.assertRaises(ValueError):
+            sweep_throughput(1, 1, 2, 1, 100, duplex="DDXU")
+        print(f"Test 06 passed: {len(patterns)} patterns in {elapsed:.3f} s\n")
+
+    def test_07_combos_and_solver(self):
+        print("Test 07: Band combination assumptions and the solver")
+        [plain] = score_combos(["n78"])
+        [patterned] = score_combos(["n78"], assumptions={78: {"tdd_pattern": "DDDSU"}})
+        self.assertAlmostEqual(patterned["dl_mbps"] / plain["dl_mbps"], (26 / 35) / 0.76)
+        config = cheapest_config(1500, duplex="DDDSU 10:2:2", numerology=[1, 2])
+        self.assertGreaterEqual(config["throughput"], 1500)
+        self.assertIsNone(cheapest_config(1500, duplex="DDDSU", numerology=[4]))
+        with self.assertRaises(ValueError):
+            cheapest_config(1500, duplex="DDXU")
+        print(f"Test 07 passed: {config}\n")
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(unittest.defaultTestLoader.loadTestsFromTestCase(TestNRThroughputTDD))
+
+    print("\nTest Summary:")
+    print(f"Total tests run   : {result.testsRun}")
+    print(f"Tests passed      : {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"Tests failed      : {len(result.failures)}")
+    print(f"Tests with errors : {len(result.errors)}")